@@ -8,6 +8,7 @@ from app.core.logging import get_logger
 from app.core.arl_messaging import message_for
 from app.core.arl_adapter import build_enforcement_payload
 from app.core.context_continuity import continuity
+from app.core.executor import run_blocking
 from app.core.karma_tone_mapper import karma_band, apply_karma_to_band
 import os
 import sys
@@ -34,7 +35,15 @@ async def handle_assistant_request(request):
     """
     Central deterministic orchestrator for /api/assistant.
     All internal systems are encapsulated here.
+
+    The pipeline (summary, intent, ARL gate -> enforcement) is synchronous and
+    CPU-bound, so it runs on the bounded worker pool instead of the event loop.
     """
+    return await run_blocking(process_assistant_request, request)
+
+
+def process_assistant_request(request):
+    """Synchronous pipeline behind handle_assistant_request"""
 
     try:
         # -------------------------------
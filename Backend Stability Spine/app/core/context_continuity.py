@@ -1,3 +1,4 @@
+import threading
 from collections import deque
 from typing import Deque, Dict, Any
 
@@ -5,6 +6,8 @@ class ContextContinuity:
     def __init__(self, window_size: int = 20):
         self.window_size = window_size
         self.sessions: Dict[str, Deque[Dict[str, Any]]] = {}
+        # Requests are processed on worker threads
+        self._lock = threading.Lock()
 
     def _get_window(self, session_id: str) -> Deque[Dict[str, Any]]:
         if session_id not in self.sessions:
@@ -12,18 +15,20 @@ class ContextContinuity:
         return self.sessions[session_id]
 
     def ingest(self, session_id: str, summary: str, sentiment: str, decision: str, rewrite_class: str | None) -> None:
-        window = self._get_window(session_id)
-        window.append({
-            "summary": summary or "",
-            "sentiment": (sentiment or "neutral"),
-            "decision": decision,
-            "rewrite_class": rewrite_class
-        })
+        with self._lock:
+            window = self._get_window(session_id)
+            window.append({
+                "summary": summary or "",
+                "sentiment": (sentiment or "neutral"),
+                "decision": decision,
+                "rewrite_class": rewrite_class
+            })
 
     def tone_band(self, session_id: str) -> str:
-        window = self._get_window(session_id)
+        with self._lock:
+            items = list(self._get_window(session_id))
         counts = {"positive": 0, "neutral": 0, "negative": 0}
-        for item in window:
+        for item in items:
             s = str(item.get("sentiment", "neutral")).lower()
             if s in counts:
                 counts[s] += 1
@@ -1,39 +1,217 @@
 from typing import Dict, Any, Optional, Union
-import json
+import asyncio
 import os
+import time
 import httpx
 import base64
 from io import BytesIO
+from urllib.parse import urlsplit
+
+from fastapi import HTTPException, Request, UploadFile
+from fastapi.encoders import jsonable_encoder
+from pydantic import ValidationError
+from starlette.datastructures import Headers
+
+from .logging import get_logger
+from .memory_store import MemoryStore
+from .security import audit_log, rate_limit
+
+# Internal calls to the app's own /api routes.
+# DECISION_HUB_DISPATCH: "http" (default) goes over the pooled HTTP client
+# and through the security middleware. "inprocess" calls the route functions
+# directly, "auto" does so when BASE_URL is a loopback address; both still
+# apply rate_limit and audit_log to each call.
+LOCAL_HOSTS = {"localhost", "127.0.0.1", "0.0.0.0", "::1"}
+INTERNAL_TIMEOUT = httpx.Timeout(float(os.getenv("INTERNAL_HTTP_TIMEOUT", "10")), connect=2.0)
+INTERNAL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0)
+
+# Per-stage timeouts for make_decision, in seconds
+STAGE_TIMEOUTS = {
+    "stt": 15.0,
+    "memory": 2.0,
+    "intent": 5.0,
+    "task": 5.0,
+    "integration": 30.0,
+    "tts": 15.0,
+    "tts_prewarm": 15.0,
+}
+
+logger = get_logger(__name__)
+
+
+class StageTimeout(Exception):
+    pass
+
+
+class StageGraph:
+    """
+    Runs the named stages of one decision as asyncio tasks, each under its
+    own timeout, and records their wall time in milliseconds. Dependencies
+    are expressed by awaiting a stage's task before starting its dependents.
+    """
+
+    def __init__(self, timeouts: Dict[str, float]):
+        self.timeouts = timeouts
+        self.tasks: Dict[str, asyncio.Task] = {}
+        self.timings: Dict[str, float] = {}
+        self._started = time.perf_counter()
+
+    def start(self, name: str, coro) -> asyncio.Task:
+        task = asyncio.ensure_future(self._timed(name, coro))
+        self.tasks[name] = task
+        return task
+
+    async def run(self, name: str, coro):
+        return await self.start(name, coro)
+
+    async def _timed(self, name: str, coro):
+        start = time.perf_counter()
+        try:
+            return await asyncio.wait_for(coro, self.timeouts.get(name))
+        except asyncio.TimeoutError:
+            raise StageTimeout(f"{name} stage timed out after {self.timeouts.get(name)}s")
+        finally:
+            self.timings[name] = round((time.perf_counter() - start) * 1000, 3)
+
+    def cancel_pending(self):
+        """Cancel stages nobody is waiting for; swallow errors of unused ones"""
+        for task in self.tasks.values():
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                task.exception()
+
+    def elapsed_ms(self) -> float:
+        return round((time.perf_counter() - self._started) * 1000, 3)
+
 
 class DecisionHub:
     def __init__(self):
-        self.memory_file = "data/memory.json"
-        os.makedirs(os.path.dirname(self.memory_file), exist_ok=True)
-        if not os.path.exists(self.memory_file):
-            with open(self.memory_file, 'w') as f:
-                json.dump({}, f)
+        # Keyed long-term memory; imports the old data/memory.json once
+        self.memory = MemoryStore(legacy_json="data/memory.json")
+        self.stage_timeouts = dict(STAGE_TIMEOUTS)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
 
-    def simple_response(self, text: str) -> str:
-        return text
+    # -------------------------------
+    # Internal API calls
+    # -------------------------------
+    def _base_url(self) -> str:
+        return os.getenv("BASE_URL", "http://localhost:8000")
+
+    def in_process(self) -> bool:
+        mode = os.getenv("DECISION_HUB_DISPATCH", "http").lower()
+        if mode in ("inprocess", "http"):
+            return mode == "inprocess"
+        return urlsplit(self._base_url()).hostname in LOCAL_HOSTS
+
+    async def get_client(self) -> httpx.AsyncClient:
+        """Shared keep-alive client, (re)created for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            stale, stale_loop = self._client, self._client_loop
+            self._client = httpx.AsyncClient(timeout=INTERNAL_TIMEOUT, limits=INTERNAL_LIMITS)
+            self._client_loop = loop
+            if stale is not None and not stale.is_closed:
+                await self._close_stale(stale, stale_loop)
+        return self._client
+
+    @staticmethod
+    async def _close_stale(client: httpx.AsyncClient, loop: Optional[asyncio.AbstractEventLoop]):
+        if loop is not None and loop.is_running():
+            # Its connections belong to that loop (another thread): close them there
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(client.aclose(), loop))
+            return
+        try:
+            await client.aclose()
+        except RuntimeError:
+            # Its loop is already closed and cannot schedule the transport
+            # shutdown; the pool is released and the sockets close with
+            # their transports.
+            pass
+
+    async def aclose(self):
+        """Close the shared client and the memory store (app shutdown)"""
+        client, self._client = self._client, None
+        if client is not None and not client.is_closed:
+            await client.aclose()
+        await asyncio.to_thread(self.memory.close)
+
+    async def _post(self, path: str, json_body: Optional[Dict[str, Any]] = None, files: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        POST to an internal /api route and return the decoded JSON body.
+        Error statuses raise httpx.HTTPStatusError in both dispatch modes.
+        """
+        url = f"{self._base_url()}{path}"
+        if self.in_process():
+            return await self._dispatch_local(url, path, json_body, files)
+        headers = {"X-API-Key": os.getenv("API_KEY", "localtest")}
+        client = await self.get_client()
+        response = await client.post(url, json=json_body, files=files, headers=headers)
+        response.raise_for_status()
+        return response.json()
 
-    def load_memory(self) -> Dict[str, Any]:
-        with open(self.memory_file, 'r') as f:
-            return json.load(f)
+    async def _dispatch_local(self, url: str, path: str, json_body: Optional[Dict[str, Any]], files: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        # Imported here: the routers import this module
+        from .database import async_session
+        from ..routers import intent, respond, summarize, task, voice_stt, voice_tts
 
-    def save_memory(self, memory: Dict[str, Any]):
-        with open(self.memory_file, 'w') as f:
-            json.dump(memory, f)
+        try:
+            # What the security middleware does for an /api request over HTTP
+            request = self._local_request(url)
+            rate_limit(request)
+            audit_log(request, "api_key_user")
+            if path == "/api/intent":
+                result = await intent.detect_intent(intent.IntentRequest(**json_body))
+            elif path == "/api/task":
+                result = await task.create_task_classification(task.TaskCreateOrClassify(**json_body))
+            elif path == "/api/tasks":
+                async with async_session() as db:
+                    result = await task.create_task(task.TaskRequest(**json_body), db)
+            elif path == "/api/respond":
+                result = await respond.generate_response(respond.RespondRequest(**json_body))
+            elif path == "/api/summarize":
+                result = await summarize.summarize_text(summarize.SummarizeRequest(**json_body))
+            elif path == "/api/voice_tts":
+                result = await voice_tts.text_to_speech(voice_tts.TTSRequest(**json_body))
+            elif path == "/api/voice_stt":
+                filename, content, content_type = files["file"]
+                upload = UploadFile(file=content, filename=filename, headers=Headers({"content-type": content_type}))
+                result = await voice_stt.voice_stt(file=upload, request=None)
+            else:
+                raise HTTPException(status_code=404, detail="Not Found")
+        except HTTPException as e:
+            status_code, detail = e.status_code, e.detail
+        except ValidationError as e:
+            status_code, detail = 422, jsonable_encoder(e.errors())
+        else:
+            return jsonable_encoder(result)
+        response = httpx.Response(status_code, json={"detail": detail}, request=httpx.Request("POST", url))
+        response.raise_for_status()
+
+    @staticmethod
+    def _local_request(url: str) -> Request:
+        # Stand-in for the loopback request the HTTP dispatch would make
+        parts = urlsplit(url)
+        return Request({
+            "type": "http",
+            "method": "POST",
+            "scheme": parts.scheme or "http",
+            "server": (parts.hostname or "localhost", parts.port),
+            "path": parts.path,
+            "query_string": b"",
+            "headers": [(b"user-agent", f"python-httpx/{httpx.__version__}".encode())],
+            "client": ("127.0.0.1", 0),
+        })
+
+    def simple_response(self, text: str) -> str:
+        return text
 
     async def process_voice_input(self, audio_data: bytes, content_type: str = "audio/wav") -> Dict[str, Any]:
         """Process voice input using STT API"""
         try:
-            base_url = os.getenv("BASE_URL", "http://localhost:8000")
-            async with httpx.AsyncClient() as client:
-                files = {"file": ("audio.wav", BytesIO(audio_data), content_type)}
-                headers = {"X-API-Key": os.getenv("API_KEY", "localtest")}
-                response = await client.post(f"{base_url}/api/voice_stt", files=files, headers=headers)
-                response.raise_for_status()
-                return response.json()
+            files = {"file": ("audio.wav", BytesIO(audio_data), content_type)}
+            return await self._post("/api/voice_stt", files=files)
         except httpx.HTTPStatusError as e:
             raise Exception(f"STT API error: {e.response.status_code} - {e.response.text}")
         except Exception as e:
@@ -42,13 +220,8 @@ class DecisionHub:
     async def generate_voice_output(self, text: str, voice: str = "alloy", model: str = "tts-1") -> Dict[str, Any]:
         """Generate voice output using TTS API"""
         try:
-            base_url = os.getenv("BASE_URL", "http://localhost:8000")
-            async with httpx.AsyncClient() as client:
-                payload = {"text": text, "voice": voice, "model": model}
-                headers = {"X-API-Key": os.getenv("API_KEY", "localtest")}
-                response = await client.post(f"{base_url}/api/voice_tts", json=payload, headers=headers)
-                response.raise_for_status()
-                return response.json()
+            payload = {"text": text, "voice": voice, "model": model}
+            return await self._post("/api/voice_tts", payload)
         except httpx.HTTPStatusError as e:
             raise Exception(f"TTS API error: {e.response.status_code} - {e.response.text}")
         except Exception as e:
@@ -57,13 +230,8 @@ class DecisionHub:
     async def create_task(self, description: str) -> Dict[str, Any]:
         """Create a new task using Task API"""
         try:
-            base_url = os.getenv("BASE_URL", "http://localhost:8000")
-            async with httpx.AsyncClient() as client:
-                payload = {"description": description}
-                headers = {"X-API-Key": os.getenv("API_KEY", "localtest")}
-                response = await client.post(f"{base_url}/api/tasks", json=payload, headers=headers)
-                response.raise_for_status()
-                return response.json()
+            payload = {"description": description}
+            return await self._post("/api/tasks", payload)
         except httpx.HTTPStatusError as e:
             raise Exception(f"Task API error: {e.response.status_code} - {e.response.text}")
         except Exception as e:
@@ -72,23 +240,30 @@ class DecisionHub:
     async def generate_response(self, query: str, intent: str, context: Dict[str, Any] = None, model: str = "uniguru") -> Dict[str, Any]:
         """Generate response using Respond or Summarize API based on intent"""
         try:
-            base_url = os.getenv("BASE_URL", "http://localhost:8000")
-            async with httpx.AsyncClient() as client:
-                headers = {"X-API-Key": os.getenv("API_KEY", "localtest")}
-                if intent == "summarize":
-                    payload = {"text": query, "model": model}
-                    response = await client.post(f"{base_url}/api/summarize", json=payload, headers=headers)
-                else:
-                    payload = {"query": query, "context": context or {}, "model": model}
-                    response = await client.post(f"{base_url}/api/respond", json=payload, headers=headers)
-                response.raise_for_status()
-                return response.json()
+            if intent == "summarize":
+                payload = {"text": query, "model": model}
+                return await self._post("/api/summarize", payload)
+            payload = {"query": query, "context": context or {}, "model": model}
+            return await self._post("/api/respond", payload)
         except httpx.HTTPStatusError as e:
             raise Exception(f"Response API error: {e.response.status_code} - {e.response.text}")
         except Exception as e:
             raise Exception(f"Failed to generate response: {str(e)}")
 
     async def make_decision(self, input_text: str, platform: str = "web", device_context: str = "desktop", voice_input: bool = False, audio_data: Optional[bytes] = None) -> Dict[str, Any]:
+        """
+        Stage graph (each stage runs under its own timeout):
+
+            stt -> intent -> task ------------------------+
+                |          -> integration -> tts          +-> decision
+                +-> memory -> tts_prewarm (voice only) ---+
+
+        The memory read overlaps intent detection, and task classification
+        overlaps the integration call. For voice actions, TTS is started
+        speculatively on the remembered response for the same input. It is
+        used only if the new response turns out identical; if the prewarm
+        failed or timed out, TTS runs again on the response.
+        """
         # Platform-aware scoring including VR
         platform_scores = {
             "mobile": {"voice": 0.9, "text": 0.7},
@@ -96,6 +271,7 @@ class DecisionHub:
             "desktop": {"voice": 0.6, "text": 0.9},
             "vr": {"voice": 0.95, "text": 0.6}  # VR prefers voice
         }
+        graph = StageGraph(self.stage_timeouts)
 
         processed_text = input_text
         stt_result = None
@@ -104,7 +280,7 @@ class DecisionHub:
         # Process voice input if provided
         if voice_input and audio_data:
             try:
-                stt_result = await self.process_voice_input(audio_data)
+                stt_result = await graph.run("stt", self.process_voice_input(audio_data))
                 processed_text = stt_result.get("text", input_text)
                 action_type = "voice"
             except Exception as e:
@@ -113,9 +289,12 @@ class DecisionHub:
         elif voice_input or "voice" in input_text.lower() or "speak" in input_text.lower():
             action_type = "voice"
 
+        # Memory reference from long-term memory (only needs the text)
+        memory_stage = graph.start("memory", self.memory.aget(processed_text[:50]))
+
         # Detect intent from processed text
         try:
-            intent_data = await self.detect_intent(processed_text)
+            intent_data = await graph.run("intent", self.detect_intent(processed_text))
             intent = intent_data["intent"]
         except Exception as e:
             print(f"Intent detection failed: {e}. Using fallback.")
@@ -129,14 +308,13 @@ class DecisionHub:
             intent = intent_data["intent"]
 
         # Get task classification
-        try:
-            task_data = await self.call_task_api(intent_data)
-        except Exception as e:
-            print(f"Task classification failed: {e}")
-            task_data = {"task": {"task_type": "general_task", "parameters": {}, "priority": "normal"}}
+        task_stage = graph.start("task", self.call_task_api(intent_data))
 
         # BHIV routing
         if intent in ["complex", "multi-step", "research", "analysis"]:
+            task_data = await self._task_result(task_stage)
+            graph.cancel_pending()
+            self._log_stages(graph, intent, "bhiv_core")
             return {"final_decision": "bhiv_core", "intent": intent, "processed_text": processed_text, "task_data": task_data}
 
         score = platform_scores.get(device_context, {"voice": 0.5, "text": 0.5})[action_type]
@@ -155,9 +333,34 @@ class DecisionHub:
             selected_agent = "default"
             preferred_llm = "uniguru"
 
-        # Memory reference from long-term JSON DB
-        memory = self.load_memory()
-        memory_ref = memory.get(processed_text[:50], None)
+        # Execute real integrations based on intent
+        if intent == "task":
+            integration_stage = graph.start("integration", self.create_task(processed_text))
+        else:
+            integration_stage = graph.start(
+                "integration",
+                self.generate_response(processed_text, intent, {"platform": platform, "device": device_context}, preferred_llm)
+            )
+
+        try:
+            memory_ref = await memory_stage
+        except asyncio.CancelledError:
+            graph.cancel_pending()
+            raise
+        except Exception as e:
+            print(f"Memory lookup failed: {e}. Continuing without memory reference.")
+            memory_ref = None
+
+        # Speculative TTS on the last response given for this input
+        prewarm_text = None
+        if action_type == "voice" and intent != "task" and isinstance(memory_ref, dict):
+            prewarm_text = memory_ref.get("response")
+            if isinstance(prewarm_text, str) and prewarm_text:
+                prewarm_stage = graph.start("tts_prewarm", self.generate_voice_output(prewarm_text))
+
+        task_data, integration_result = await asyncio.gather(
+            self._task_result(task_stage), integration_stage, return_exceptions=True
+        )
 
         # Initialize decision with basic info
         decision = {
@@ -171,28 +374,33 @@ class DecisionHub:
             "processed_text": processed_text
         }
 
-        # Execute real integrations based on intent
         try:
+            if isinstance(integration_result, BaseException):
+                raise integration_result
             if intent == "task":
                 # Create a task
-                task_result = await self.create_task(processed_text)
-                decision["task_created"] = task_result
+                decision["task_created"] = integration_result
                 decision["final_decision"] = "task_created"
             elif intent == "summarize":
                 # Generate summary
-                response_result = await self.generate_response(processed_text, intent, {"platform": platform, "device": device_context}, preferred_llm)
-                decision["response"] = response_result.get("summary")
+                decision["response"] = integration_result.get("summary")
                 decision["final_decision"] = "summary_generated"
             else:
                 # Generate general response
-                response_result = await self.generate_response(processed_text, intent, {"platform": platform, "device": device_context}, preferred_llm)
-                decision["response"] = response_result.get("response")
+                decision["response"] = integration_result.get("response")
                 decision["final_decision"] = "response_generated"
 
             # Generate voice output if voice action
             if action_type == "voice" and "response" in decision:
                 try:
-                    voice_result = await self.generate_voice_output(decision["response"])
+                    voice_result = None
+                    if "tts_prewarm" in graph.tasks and decision["response"] == prewarm_text:
+                        try:
+                            voice_result = await prewarm_stage
+                        except Exception as e:
+                            print(f"TTS prewarm failed: {e}. Generating voice output again.")
+                    if voice_result is None:
+                        voice_result = await graph.run("tts", self.generate_voice_output(decision["response"]))
                     decision["voice_output"] = voice_result
                 except Exception as e:
                     print(f"Voice generation failed: {e}")
@@ -203,51 +411,65 @@ class DecisionHub:
             decision["integration_error"] = str(e)
             # Fallback to basic response
             decision["final_decision"] = "fallback_response"
+        finally:
+            graph.cancel_pending()
 
         # Update long-term memory
-        memory[processed_text[:50]] = decision
-        self.save_memory(memory)
+        try:
+            await self.memory.aput(processed_text[:50], decision)
+        except Exception as e:
+            print(f"Memory update failed: {e}")
 
+        self._log_stages(graph, intent, decision["final_decision"])
         return decision
 
+    async def _task_result(self, task_stage: "asyncio.Task") -> Dict[str, Any]:
+        try:
+            return await task_stage
+        except Exception as e:
+            print(f"Task classification failed: {e}")
+            return {"task": {"task_type": "general_task", "parameters": {}, "priority": "normal"}}
+
+    def _log_stages(self, graph: "StageGraph", intent: str, final_decision: str):
+        logger.info(
+            "DecisionHub stages",
+            extra={"extra_fields": {
+                "endpoint": "/api/decision_hub",
+                "intent": intent,
+                "final_decision": final_decision,
+                "stage_ms": graph.timings,
+                "total_ms": graph.elapsed_ms(),
+                "dispatch": "inprocess" if self.in_process() else "http"
+            }}
+        )
+
     async def call_task_api(self, intent_data: Dict[str, Any]) -> Dict[str, Any]:
         """Call the task classification API."""
-        base_url = os.getenv("BASE_URL", "http://localhost:8000")
-        async with httpx.AsyncClient() as client:
-            try:
-                headers = {"X-API-Key": os.getenv("API_KEY", "localtest")}
-                response = await client.post(f"{base_url}/api/task", json=intent_data, headers=headers)
-                response.raise_for_status()
-                return response.json()
-            except Exception as e:
-                print(f"Task API call failed: {e}")
-                raise
+        try:
+            return await self._post("/api/task", intent_data)
+        except Exception as e:
+            print(f"Task API call failed: {e}")
+            raise
 
     async def detect_intent(self, text: str) -> Dict[str, Any]:
         # Use real LLM-based intent detection via internal API
-        base_url = os.getenv("BASE_URL", "http://localhost:8000")
-        async with httpx.AsyncClient() as client:
-            try:
-                headers = {"X-API-Key": os.getenv("API_KEY", "localtest")}
-                response = await client.post(f"{base_url}/api/intent", json={"text": text}, headers=headers)
-                response.raise_for_status()
-                data = response.json()
-                return data  # Return full response
-            except Exception as e:
-                # Fallback to keyword matching if API is unavailable
-                print(f"Intent detection API failed: {e}. Using fallback.")
-                intent = "general"
-                if "summarize" in text.lower():
-                    intent = "summarize"
-                elif "task" in text.lower():
-                    intent = "task"
-                # Return fallback dict
-                return {
-                    "intent": intent,
-                    "entities": {},
-                    "context": {"priority": "normal"},
-                    "original_text": text,
-                    "confidence": 0.5
-                }
+        try:
+            return await self._post("/api/intent", {"text": text})  # Return full response
+        except Exception as e:
+            # Fallback to keyword matching if API is unavailable
+            print(f"Intent detection API failed: {e}. Using fallback.")
+            intent = "general"
+            if "summarize" in text.lower():
+                intent = "summarize"
+            elif "task" in text.lower():
+                intent = "task"
+            # Return fallback dict
+            return {
+                "intent": intent,
+                "entities": {},
+                "context": {"priority": "normal"},
+                "original_text": text,
+                "confidence": 0.5
+            }
 
 decision_hub = DecisionHub()
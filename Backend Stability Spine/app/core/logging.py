@@ -1,8 +1,11 @@
 import os
 import json
+import queue
+import atexit
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
 class JSONFormatter(logging.Formatter):
@@ -41,8 +44,18 @@ class JSONFormatter(logging.Formatter):
         return json.dumps(log_entry)
 
 
+_listener: Optional[QueueListener] = None
+
+
 def setup_logging() -> None:
-    """Setup structured JSON logging for the application"""
+    """
+    Setup structured JSON logging for the application.
+
+    Records are formatted by the caller and handed to a queue; a listener
+    thread does the console/file writes, so logging never blocks the event
+    loop or a request worker on I/O.
+    """
+    global _listener
 
     # Get log level from environment
     log_level_str = os.getenv("LOG_LEVEL", "INFO").upper()
@@ -55,13 +68,18 @@ def setup_logging() -> None:
     # Remove existing handlers
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
+    stop_logging()
 
-    # Create console handler with JSON formatter
+    # Output handlers only write the already formatted JSON line
+    json_formatter = JSONFormatter()
+    passthrough = logging.Formatter("%(message)s")
+    handlers = []
+
+    # Create console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(log_level)
-    json_formatter = JSONFormatter()
-    console_handler.setFormatter(json_formatter)
-    logger.addHandler(console_handler)
+    console_handler.setFormatter(passthrough)
+    handlers.append(console_handler)
 
     # Create file handler if LOG_FILE is set
     log_file = os.getenv("LOG_FILE")
@@ -70,23 +88,35 @@ def setup_logging() -> None:
             os.makedirs(os.path.dirname(log_file), exist_ok=True)
             file_handler = logging.FileHandler(log_file)
             file_handler.setLevel(log_level)
-            file_handler.setFormatter(json_formatter)
-            logger.addHandler(file_handler)
+            file_handler.setFormatter(passthrough)
+            handlers.append(file_handler)
         except Exception as e:
             logger.warning(f"Failed to setup file logging: {e}")
 
+    queue_handler = QueueHandler(queue.SimpleQueue())
+    queue_handler.setLevel(log_level)
+    queue_handler.setFormatter(json_formatter)
+    logger.addHandler(queue_handler)
+
+    _listener = QueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
     # Set uvicorn loggers to use our configuration
     uvicorn_logger = logging.getLogger("uvicorn")
     uvicorn_logger.handlers.clear()
-    uvicorn_logger.addHandler(console_handler)
-    if log_file:
-        uvicorn_logger.addHandler(file_handler)
+    uvicorn_logger.addHandler(queue_handler)
 
     uvicorn_access_logger = logging.getLogger("uvicorn.access")
     uvicorn_access_logger.handlers.clear()
-    uvicorn_access_logger.addHandler(console_handler)
-    if log_file:
-        uvicorn_access_logger.addHandler(file_handler)
+    uvicorn_access_logger.addHandler(queue_handler)
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the writer thread"""
+    global _listener
+    listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -94,5 +124,7 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
+atexit.register(stop_logging)
+
 # Global logger instance
-logger = get_logger(__name__)
\ No newline at end of file
+logger = get_logger(__name__)
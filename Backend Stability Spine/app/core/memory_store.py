@@ -0,0 +1,148 @@
+import os
+import json
+import sqlite3
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+# Long-term decision memory used by DecisionHub
+MEMORY_DB = os.getenv("DECISION_MEMORY_DB", "data/memory.db")
+MEMORY_MAX_ENTRIES = int(os.getenv("DECISION_MEMORY_MAX_ENTRIES", "100000"))
+
+
+class MemoryStore:
+    """
+    Keyed JSON store on SQLite in WAL mode.
+
+    Every write is a single-key upsert, so concurrent requests never drop
+    each other's entries (the same key: last write wins). Past max_entries
+    the least recently written keys are evicted in batches of ~1% of the cap.
+
+    All statements run on one dedicated thread that owns the connection:
+    the async methods await it without blocking the event loop, and the
+    sync ones wait on it from any thread.
+    """
+
+    def __init__(self, path: str = MEMORY_DB, max_entries: int = MEMORY_MAX_ENTRIES, legacy_json: Optional[str] = None):
+        self.path = path
+        self.max_entries = max_entries
+        self.evict_batch = max(1, max_entries // 100)
+        self.legacy_json = legacy_json
+        self.evictions = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._count = 0
+        self._seq = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    # -------------------------------
+    # Public API
+    # -------------------------------
+    async def aget(self, key: str) -> Optional[Any]:
+        return await asyncio.wrap_future(self._submit(self._get, key))
+
+    async def aput(self, key: str, value: Any) -> None:
+        await asyncio.wrap_future(self._submit(self._put_many, [(key, value)]))
+
+    def get(self, key: str) -> Optional[Any]:
+        return self._submit(self._get, key).result()
+
+    def put(self, key: str, value: Any) -> None:
+        self._submit(self._put_many, [(key, value)]).result()
+
+    def put_many(self, items: Iterable[Tuple[str, Any]]) -> None:
+        """Upsert many entries in one transaction"""
+        self._submit(self._put_many, list(items)).result()
+
+    def count(self) -> int:
+        return self._submit(lambda: self._count).result()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"entries": self.count(), "max_entries": self.max_entries, "evictions": self.evictions, "path": self.path}
+
+    def close(self) -> None:
+        """Close the connection and its thread; reopened on next use"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.submit(self._close).result()
+            executor.shutdown()
+
+    # -------------------------------
+    # Store thread
+    # -------------------------------
+    def _submit(self, fn, *args):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="memory-store")
+            return self._executor.submit(self._call, fn, *args)
+
+    def _call(self, fn, *args):
+        if self._conn is None:
+            self._open()
+        return fn(*args)
+
+    def _open(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS memory ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, seq INTEGER NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS memory_seq ON memory (seq)")
+        self._conn = conn
+        self._count, self._seq = conn.execute("SELECT COUNT(*), COALESCE(MAX(seq), 0) FROM memory").fetchone()
+        if self._count == 0 and self.legacy_json and os.path.exists(self.legacy_json):
+            self._import_json(self.legacy_json)
+
+    def _import_json(self, path: str):
+        # One-time migration of the old whole-file memory.json
+        try:
+            with open(path, 'r') as f:
+                legacy = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(legacy, dict):
+            self._put_many(legacy.items())
+
+    def _close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _get(self, key: str) -> Optional[Any]:
+        row = self._conn.execute("SELECT value FROM memory WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _put_many(self, items: Iterable[Tuple[str, Any]]):
+        conn = self._conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for key, value in items:
+                self._seq += 1
+                exists = conn.execute("SELECT 1 FROM memory WHERE key = ?", (key,)).fetchone()
+                conn.execute(
+                    "INSERT INTO memory (key, value, seq) VALUES (?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET value = excluded.value, seq = excluded.seq",
+                    (key, json.dumps(value), self._seq),
+                )
+                if not exists:
+                    self._count += 1
+            if self._count > self.max_entries:
+                evict = self._count - self.max_entries + self.evict_batch - 1
+                conn.execute(
+                    "DELETE FROM memory WHERE key IN (SELECT key FROM memory ORDER BY seq LIMIT ?)", (evict,)
+                )
+                self._count -= evict
+                self.evictions += evict
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            self._count, self._seq = conn.execute("SELECT COUNT(*), COALESCE(MAX(seq), 0) FROM memory").fetchone()
+            raise
@@ -0,0 +1,218 @@
+import os
+import time
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+
+# Backend used by security.rate_limit: "memory" (per process) or "sqlite"
+# (one file shared by all uvicorn workers on the host)
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory")
+RATE_LIMIT_DB = os.getenv("RATE_LIMIT_DB", "data/rate_limit.db")
+# Hard cap on tracked clients; past it the least recently seen are dropped
+RATE_LIMIT_MAX_KEYS = int(os.getenv("RATE_LIMIT_MAX_KEYS", "1000000"))
+
+
+def slide(state: Optional[Tuple[int, int, int]], now: float, window: float) -> Tuple[int, int, int, float]:
+    """
+    Sliding window counter: the count of the current fixed window plus the
+    previous window's count weighted by how much of it still overlaps the
+    last `window` seconds. Returns (window index, previous, current, estimate).
+    """
+    index = int(now // window)
+    if state is None or state[0] < index - 1:
+        previous, current = 0, 0
+    elif state[0] == index - 1:
+        previous, current = state[2], 0
+    else:
+        previous, current = state[1], state[2]
+    overlap = 1 - (now - index * window) / window
+    return index, previous, current, previous * overlap + current
+
+
+class RateLimitBackend(ABC):
+    """
+    Per-key sliding window counters. hit() records a request for `key` and
+    returns False when `limit` requests in the last `window` seconds were
+    already allowed (rejected requests are not counted). Each key holds three
+    integers, and a key is dropped once it has been idle for two windows.
+    """
+
+    @abstractmethod
+    def hit(self, key: str, limit: int, window: float, now: Optional[float] = None) -> bool:
+        ...
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    def close(self) -> None:
+        pass
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """
+    Counters in an OrderedDict kept in last-seen order (a hit re-inserts its
+    key). Expired keys are always at the front, so each hit evicts a few of
+    them in O(1) and idle clients drain away without a full sweep. (A plain
+    dict degrades here: finding its first live key after many deletes from
+    the front is a linear scan.)
+    """
+
+    EVICT_PER_HIT = 4
+
+    def __init__(self, max_keys: int = RATE_LIMIT_MAX_KEYS):
+        self.max_keys = max_keys
+        self.evictions = 0
+        # key -> (window index, previous count, current count)
+        self._counters: "OrderedDict[str, Tuple[int, int, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hit(self, key: str, limit: int, window: float, now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        with self._lock:
+            counters = self._counters
+            state = counters.get(key)
+            if state is not None:
+                counters.move_to_end(key)
+            index, previous, current, estimate = slide(state, now, window)
+            allowed = estimate < limit
+            if allowed:
+                current += 1
+            counters[key] = (index, previous, current)
+            # Keys last seen two or more windows ago count for nothing
+            for _ in range(self.EVICT_PER_HIT):
+                oldest = next(iter(counters))
+                if counters[oldest][0] >= index - 1:
+                    break
+                del counters[oldest]
+                self.evictions += 1
+            while len(counters) > self.max_keys:
+                counters.popitem(last=False)
+                self.evictions += 1
+        return allowed
+
+    def __len__(self) -> int:
+        return len(self._counters)
+
+
+class SQLiteRateLimitBackend(RateLimitBackend):
+    """
+    Counters in a SQLite table (WAL) so every worker process on the host
+    enforces one shared limit per client. Each hit is one short IMMEDIATE
+    transaction on the primary key; every SWEEP_EVERY hits a bounded batch
+    of expired rows is deleted through the expiry index.
+    """
+
+    SWEEP_EVERY = 64
+    SWEEP_BATCH = 512
+
+    def __init__(self, path: str = RATE_LIMIT_DB, busy_timeout_ms: int = 5000):
+        self.path = path
+        self.busy_timeout_ms = busy_timeout_ms
+        self.evictions = 0
+        self._hits = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+            conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit ("
+                "key TEXT PRIMARY KEY, idx INTEGER NOT NULL, previous INTEGER NOT NULL, "
+                "current INTEGER NOT NULL, expires REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS rate_limit_expires ON rate_limit (expires)")
+            self._conn = conn
+        return self._conn
+
+    def hit(self, key: str, limit: int, window: float, now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        with self._lock:
+            try:
+                return self._hit(key, limit, window, now)
+            except sqlite3.Error as e:
+                # Fail open: a locked or broken limiter must not take the API down
+                logger.warning(
+                    "Rate limiter backend error", extra={"extra_fields": {"error": str(e), "path": self.path}}
+                )
+                return True
+
+    def _hit(self, key: str, limit: int, window: float, now: float) -> bool:
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT idx, previous, current FROM rate_limit WHERE key = ?", (key,)).fetchone()
+            index, previous, current, estimate = slide(row, now, window)
+            allowed = estimate < limit
+            if allowed:
+                current += 1
+            conn.execute(
+                "INSERT INTO rate_limit (key, idx, previous, current, expires) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET idx = excluded.idx, previous = excluded.previous, "
+                "current = excluded.current, expires = excluded.expires",
+                (key, index, previous, current, (index + 2) * window),
+            )
+            self._hits += 1
+            if self._hits % self.SWEEP_EVERY == 0:
+                self.evictions += conn.execute(
+                    "DELETE FROM rate_limit WHERE key IN "
+                    "(SELECT key FROM rate_limit WHERE expires <= ? LIMIT ?)",
+                    (now, self.SWEEP_BATCH),
+                ).rowcount
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return allowed
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM rate_limit").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_limiter: Optional[RateLimitBackend] = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimitBackend:
+    """Return the process-wide backend selected by RATE_LIMIT_BACKEND"""
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                if RATE_LIMIT_BACKEND == "sqlite":
+                    _limiter = SQLiteRateLimitBackend()
+                elif RATE_LIMIT_BACKEND == "memory":
+                    _limiter = InMemoryRateLimitBackend()
+                else:
+                    raise ValueError(f"Unknown RATE_LIMIT_BACKEND: {RATE_LIMIT_BACKEND!r}")
+    return _limiter
+
+
+def set_rate_limiter(backend: Optional[RateLimitBackend]) -> None:
+    """Install a custom backend (None restores the configured default)"""
+    global _limiter
+    with _limiter_lock:
+        previous, _limiter = _limiter, backend
+    if previous is not None and previous is not backend:
+        previous.close()
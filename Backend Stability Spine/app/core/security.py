@@ -1,9 +1,7 @@
 import os
 import logging
-import time
 from datetime import datetime, timedelta
 from typing import Optional
-from collections import defaultdict
 
 from fastapi import HTTPException, Depends, Request
 from fastapi.security import APIKeyHeader, HTTPBearer, HTTPAuthorizationCredentials
@@ -20,9 +18,10 @@ JWT_ACCESS_TOKEN_EXPIRE_MINUTES = 30
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 bearer_scheme = HTTPBearer(auto_error=False)
 
-# Rate limiting store (in-memory)
-# NOTE: For production with multiple instances, use Redis or similar distributed store
-rate_limit_store = defaultdict(list)
+# Rate limiting counters live in a pluggable backend (see rate_limiter.py)
+# NOTE: RATE_LIMIT_BACKEND=sqlite shares them between workers on one host;
+# multiple hosts still need Redis or a similar distributed store
+from .rate_limiter import get_rate_limiter
 
 # Import structured logger
 from .logging import get_logger
@@ -70,13 +69,9 @@ def authenticate_user(api_key: str = Depends(api_key_header), token: TokenData =
     raise HTTPException(status_code=401, detail="Authentication failed")
 
 def rate_limit(request: Request, max_requests: int = 100, window_seconds: int = 60):
-    client_ip = request.client.host
-    current_time = time.time()
-    # Clean old entries
-    rate_limit_store[client_ip] = [t for t in rate_limit_store[client_ip] if current_time - t < window_seconds]
-    if len(rate_limit_store[client_ip]) >= max_requests:
+    client_ip = request.client.host if request.client else "unknown"
+    if not get_rate_limiter().hit(client_ip, max_requests, window_seconds):
         raise HTTPException(status_code=429, detail="Rate limit exceeded")
-    rate_limit_store[client_ip].append(current_time)
 
 def audit_log(request: Request, user: str = None):
     """Log security events using structured logging"""
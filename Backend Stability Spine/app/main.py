@@ -36,6 +36,8 @@ if os.getenv("SENTRY_DSN"):
 # -------------------------------------------------
 from app.core.logging import setup_logging, get_logger
 from app.core.database import create_tables
+from app.core.executor import shutdown_executor
+from app.core.decision_hub import decision_hub
 from app.core.security import rate_limit, audit_log
 from app.api.assistant import router as assistant_router
 from app.routers.intent import router as intent_router
@@ -63,6 +65,8 @@ logger = get_logger(__name__)
 async def lifespan(app: FastAPI):
     await create_tables()
     yield
+    await decision_hub.aclose()
+    shutdown_executor()
 
 # -------------------------------------------------
 # FastAPI app
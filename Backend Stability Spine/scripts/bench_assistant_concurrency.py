@@ -0,0 +1,198 @@
+"""
+Concurrency benchmark for POST /api/assistant against a local uvicorn.
+
+Starts the app in a subprocess, then runs C concurrent keep-alive clients
+(default 500), each sending R requests (default 20) that mix the general
+path and the task path (dateutil parsing). A separate prober hits GET
+/health every 20 ms the whole time, which shows how long the event loop is
+stalled by work running on it.
+
+Every client sends its own X-Forwarded-For (the server runs with
+--proxy-headers) so the per-IP rate limiter (100 requests / 60 s) does not
+turn the run into a 429 benchmark; keep R at or below 100.
+
+Compare --workers 0 (pipeline inline on the event loop; the default on a
+single-CPU host) with --workers N, or point --app-dir at another
+checkout of this directory. --long-every K makes every Kth request a ~32 KB
+paste (~10 ms of pipeline work); --think-ms T adds a random 0.5T-1.5T pause
+between a client's requests so the server is not saturated.
+
+    python scripts/bench_assistant_concurrency.py [clients] [requests]
+        [--workers N] [--app-dir PATH] [--long-every K] [--think-ms T]
+"""
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+APP_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+MESSAGES = [
+    "hello, how are you today?",
+    "remind me tomorrow at 5pm to call mom",
+    "what is the weather like",
+    "schedule a meeting with the team next friday at 10am",
+    "I really need you, you are the only one who understands me!",
+]
+# A pasted document: ~32 KB, ~10 ms through the pipeline instead of <1 ms
+LONG_MESSAGE = "please schedule a meeting with the team next friday at 10am about the budget. " * 400
+HEALTH_INTERVAL = 0.02
+
+
+def option(name, default):
+    if name in sys.argv:
+        return sys.argv[sys.argv.index(name) + 1]
+    return default
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+
+def summary(samples):
+    return (
+        f"p50 {percentile(samples, 50) * 1e3:8.1f} ms | p95 {percentile(samples, 95) * 1e3:8.1f} ms | "
+        f"p99 {percentile(samples, 99) * 1e3:8.1f} ms | max {max(samples) * 1e3:8.1f} ms"
+    )
+
+
+def build_request(path, body=None, forwarded_for=None):
+    method = "POST" if body is not None else "GET"
+    lines = [f"{method} {path} HTTP/1.1", "Host: localhost", "X-API-Key: bench"]
+    if forwarded_for:
+        lines.append(f"X-Forwarded-For: {forwarded_for}")
+    payload = b""
+    if body is not None:
+        payload = json.dumps(body).encode()
+        lines += ["Content-Type: application/json", f"Content-Length: {len(payload)}"]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode() + payload
+
+
+async def read_response(reader):
+    head = await reader.readuntil(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    length = 0
+    for line in head.split(b"\r\n")[1:]:
+        name, _, value = line.partition(b":")
+        if name.strip().lower() == b"content-length":
+            length = int(value)
+    body = await reader.readexactly(length)
+    return status, body
+
+
+async def client(port, index, requests, long_every, think, latencies, long_latencies, errors):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    forwarded_for = f"10.{index >> 16 & 255}.{index >> 8 & 255}.{index & 255}"
+    try:
+        for i in range(requests):
+            long = long_every and (index + i) % long_every == 0
+            body = {
+                "version": "3.0.0",
+                "input": {"message": LONG_MESSAGE if long else MESSAGES[(index + i) % len(MESSAGES)]},
+                "context": {"platform": "web", "session_id": f"bench-{index}"},
+            }
+            start = time.perf_counter()
+            writer.write(build_request("/api/assistant", body, forwarded_for))
+            status, payload = await read_response(reader)
+            (long_latencies if long else latencies).append(time.perf_counter() - start)
+            if status != 200 or json.loads(payload).get("status") != "success":
+                errors.append(status)
+            if think:
+                await asyncio.sleep(think * (0.5 + random.random()))
+    finally:
+        writer.close()
+
+
+async def prober(port, latencies, done):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    request = build_request("/health")
+    while not done.is_set():
+        start = time.perf_counter()
+        writer.write(request)
+        await read_response(reader)
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(HEALTH_INTERVAL)
+    writer.close()
+
+
+async def run(port, clients, requests, long_every=0, think=0.0):
+    latencies, long_latencies, health, errors = [], [], [], []
+    done = asyncio.Event()
+    probe = asyncio.create_task(prober(port, health, done))
+    start = time.perf_counter()
+    await asyncio.gather(*(client(port, i, requests, long_every, think, latencies, long_latencies, errors) for i in range(clients)))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await probe
+    return latencies, long_latencies, health, errors, elapsed
+
+
+async def wait_ready(port, deadline):
+    while time.time() < deadline:
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(build_request("/health"))
+            await read_response(reader)
+            writer.close()
+            return
+        except (OSError, asyncio.IncompleteReadError):
+            await asyncio.sleep(0.2)
+    raise RuntimeError("server did not start")
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    for name in ("--workers", "--app-dir", "--long-every", "--think-ms"):
+        if name in sys.argv:
+            args.remove(option(name, None))
+    clients = int(args[0]) if args else 500
+    requests = int(args[1]) if len(args) > 1 else 20
+    long_every = int(option("--long-every", 0))
+    think = float(option("--think-ms", 0)) / 1000
+    app_dir = os.path.abspath(option("--app-dir", APP_DIR))
+    port = free_port()
+
+    env = dict(os.environ, API_KEY="bench", ENV="production")
+    if "--workers" in sys.argv:
+        env["ASSISTANT_WORKERS"] = option("--workers", None)
+    with tempfile.TemporaryFile() as server_log:
+        server = subprocess.Popen(
+            [
+                sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port),
+                "--proxy-headers", "--forwarded-allow-ips", "*", "--backlog", "4096",
+            ],
+            cwd=app_dir, env=env, stdout=server_log, stderr=subprocess.STDOUT,
+        )
+        try:
+            asyncio.run(wait_ready(port, time.time() + 60))
+            # Warm up imports, caches and the pool before measuring
+            asyncio.run(run(port, 10, 5))
+            latencies, long_latencies, health, errors, elapsed = asyncio.run(run(port, clients, requests, long_every, think))
+        finally:
+            server.terminate()
+            server.wait()
+
+    total = len(latencies) + len(long_latencies)
+    print(
+        f"{clients} clients x {requests} requests, ASSISTANT_WORKERS={env.get('ASSISTANT_WORKERS', 'default')}, "
+        f"{os.cpu_count()} CPU(s), app dir {app_dir}"
+    )
+    print(f"  /api/assistant {summary(latencies)} | {total / elapsed:7.0f} req/s, {len(errors)} errors")
+    if long_latencies:
+        print(f"  long pastes    {summary(long_latencies)} | {len(long_latencies)} requests")
+    print(f"  /health        {summary(health)} | {len(health)} probes")
+
+
+if __name__ == "__main__":
+    main()
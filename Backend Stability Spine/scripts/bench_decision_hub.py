@@ -0,0 +1,120 @@
+"""
+Latency benchmark for POST /api/decision_hub against a local uvicorn.
+
+make_decision() calls the app's own /api routes (intent, task, respond or
+summarize, tasks). For each dispatch mode the app is started with
+BASE_URL pointing at itself, then measured with one client (sequential
+latency) and with C concurrent keep-alive clients.
+
+Modes (DECISION_HUB_DISPATCH): "http" goes over the shared pooled client,
+"inprocess" calls the route functions directly. To measure the previous
+client-per-call code, point --app-dir at an older checkout with --dispatch
+http.
+
+The server's rate limiter is disabled for the run: every decision costs
+three or four internal /api calls from 127.0.0.1 (in-process calls are
+rate limited like loopback requests), which would otherwise be rejected
+with 429 after ~30 decisions a minute.
+The server runs in a temporary directory (memory store, SQLite task DB).
+
+Usage:
+    python scripts/bench_decision_hub.py [requests] [clients] [--dispatch http,inprocess] [--app-dir PATH]
+"""
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from bench_assistant_concurrency import APP_DIR, free_port, option, read_response, summary, wait_ready
+
+MESSAGES = [
+    "what is the weather like today",
+    "create a task to review the quarterly budget",
+    "please summarize the meeting notes from yesterday",
+]
+SERVER = """
+import sys, uvicorn
+sys.path.insert(0, sys.argv[1])
+import app.main as main
+import app.core.decision_hub as hub
+main.rate_limit = hub.rate_limit = lambda request: None
+uvicorn.run(main.app, host="127.0.0.1", port=int(sys.argv[2]))
+"""
+
+
+def build_request(message):
+    payload = json.dumps({"input_text": message, "platform": "web", "device_context": "web"}).encode()
+    head = (
+        "POST /api/decision_hub HTTP/1.1\r\nHost: localhost\r\nX-API-Key: bench\r\n"
+        f"Content-Type: application/json\r\nContent-Length: {len(payload)}\r\n\r\n"
+    )
+    return head.encode() + payload
+
+
+async def client(port, index, requests, latencies, outcomes):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        for i in range(requests):
+            start = time.perf_counter()
+            writer.write(build_request(MESSAGES[(index + i) % len(MESSAGES)]))
+            status, body = await read_response(reader)
+            latencies.append(time.perf_counter() - start)
+            decision = json.loads(body).get("final_decision") if status == 200 else status
+            outcomes[decision] = outcomes.get(decision, 0) + 1
+    finally:
+        writer.close()
+
+
+async def run(port, clients, requests):
+    latencies, outcomes = [], {}
+    start = time.perf_counter()
+    await asyncio.gather(*(client(port, i, requests, latencies, outcomes) for i in range(clients)))
+    return latencies, outcomes, time.perf_counter() - start
+
+
+def bench(app_dir, mode, requests, clients):
+    port = free_port()
+    with tempfile.TemporaryDirectory() as workdir:
+        env = dict(
+            os.environ, API_KEY="bench", ENV="production", DECISION_HUB_DISPATCH=mode,
+            BASE_URL=f"http://127.0.0.1:{port}",
+            DATABASE_URL=f"sqlite+aiosqlite:///{os.path.join(workdir, 'tasks.db')}",
+        )
+        with open(os.path.join(workdir, "server.log"), "wb") as server_log:
+            server = subprocess.Popen(
+                [sys.executable, "-c", SERVER, app_dir, str(port)],
+                cwd=workdir, env=env, stdout=server_log, stderr=subprocess.STDOUT,
+            )
+            try:
+                asyncio.run(wait_ready(port, time.time() + 60))
+                asyncio.run(run(port, 3, 10))
+                sequential = asyncio.run(run(port, 1, requests))
+                concurrent = asyncio.run(run(port, clients, max(1, requests // clients)))
+            finally:
+                server.terminate()
+                server.wait()
+
+    print(f"{mode} ({app_dir})")
+    for label, (latencies, outcomes, elapsed) in (("1 client", sequential), (f"{clients} clients", concurrent)):
+        print(f"  {label:11} {summary(latencies)} | {len(latencies) / elapsed:6.0f} req/s | {outcomes}")
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    for name in ("--dispatch", "--app-dir"):
+        if name in sys.argv:
+            args.remove(option(name, None))
+    requests = int(args[0]) if args else 300
+    clients = int(args[1]) if len(args) > 1 else 20
+    app_dir = os.path.abspath(option("--app-dir", APP_DIR))
+    for mode in option("--dispatch", "http,inprocess").split(","):
+        bench(app_dir, mode, requests, clients)
+
+
+if __name__ == "__main__":
+    main()
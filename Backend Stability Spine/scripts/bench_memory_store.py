@@ -0,0 +1,154 @@
+"""
+Load test for the DecisionHub long-term memory (MemoryStore, SQLite WAL).
+
+1. Per-request cost as memory grows: the store is filled to 1k, 10k,
+   100k and 1M entries, and at each size R simulated requests do what
+   make_decision does (read the memory reference for a key, then upsert
+   the decision) through the async API. The previous whole-file
+   memory.json (json.load + json.dump per request) is timed up to 100k.
+2. Lost updates under concurrency: C concurrent requests, each
+   read -> await -> write of its own key, against the store and against
+   the old load-whole-dict / save-whole-dict pattern.
+3. Size cap: inserting 10% past the cap keeps the entry count bounded.
+
+Runs in a temporary directory. Usage:
+    python scripts/bench_memory_store.py [max_entries] [requests] [concurrency]
+"""
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.memory_store import MemoryStore
+
+DECISION = {
+    "final_decision": "response_generated",
+    "confidence": 0.8,
+    "selected_agent": "text_agent",
+    "preferred_llm": "chatgpt",
+    "device_context": "web",
+    "memory_reference": None,
+    "intent": "general",
+    "processed_text": "what is the weather like today in the city centre",
+    "response": "[Chatgpt Mock] Response to: Context: {'platform': 'web', 'device': 'web'}...",
+}
+FILL_CHUNK = 10000
+
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+
+async def timed_requests(store, size, requests):
+    samples = []
+    for i in range(requests):
+        start = time.perf_counter()
+        await store.aget(f"key-{random.randrange(size)}")
+        await store.aput(f"key-{random.randrange(size)}", DECISION)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def legacy_request(path, key):
+    with open(path, 'r') as f:
+        memory = json.load(f)
+    memory.get(key)
+    memory[key] = DECISION
+    with open(path, 'w') as f:
+        json.dump(memory, f)
+
+
+def bench_growth(workdir, sizes, requests):
+    store = MemoryStore(os.path.join(workdir, "growth.db"), max_entries=sizes[-1])
+    filled = 0
+    print("per-request cost (read reference + upsert decision):")
+    for size in sizes:
+        start = time.perf_counter()
+        while filled < size:
+            chunk = min(FILL_CHUNK, size - filled)
+            store.put_many((f"key-{filled + i}", DECISION) for i in range(chunk))
+            filled += chunk
+        fill_s = time.perf_counter() - start
+        samples = asyncio.run(timed_requests(store, size, requests))
+        line = (
+            f"  {size:>9,d} entries: store {sum(samples) / len(samples) * 1e6:7.1f} us mean, "
+            f"p99 {percentile(samples, 99) * 1e6:7.1f} us"
+        )
+        if size <= 100000:
+            legacy = os.path.join(workdir, "memory.json")
+            with open(legacy, 'w') as f:
+                json.dump({f"key-{i}": DECISION for i in range(size)}, f)
+            rounds = max(3, min(200, 2000000 // size // 10))
+            start = time.perf_counter()
+            for i in range(rounds):
+                legacy_request(legacy, f"key-{i}")
+            line += f" | memory.json {(time.perf_counter() - start) / rounds * 1e3:9.2f} ms"
+        print(f"{line}  (filled in {fill_s:.1f} s)")
+    return store
+
+
+async def concurrent_store(store, concurrency):
+    async def request(i):
+        await store.aget(f"concurrent-{i}")
+        await asyncio.sleep(0)
+        await store.aput(f"concurrent-{i}", DECISION)
+
+    await asyncio.gather(*(request(i) for i in range(concurrency)))
+    found = await asyncio.gather(*(store.aget(f"concurrent-{i}") for i in range(concurrency)))
+    return sum(1 for value in found if value is None)
+
+
+async def concurrent_legacy(path, concurrency):
+    with open(path, 'w') as f:
+        json.dump({}, f)
+
+    async def request(i):
+        with open(path, 'r') as f:
+            memory = json.load(f)
+        await asyncio.sleep(0)   # make_decision awaits its stages between load and save
+        memory[f"concurrent-{i}"] = DECISION
+        with open(path, 'w') as f:
+            json.dump(memory, f)
+
+    await asyncio.gather(*(request(i) for i in range(concurrency)))
+    with open(path, 'r') as f:
+        memory = json.load(f)
+    return concurrency - len(memory)
+
+
+def main():
+    max_entries = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    requests = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    concurrency = int(sys.argv[3]) if len(sys.argv) > 3 else 1000
+    sizes = [s for s in (1000, 10000, 100000, 1000000) if s < max_entries] + [max_entries]
+
+    with tempfile.TemporaryDirectory() as workdir:
+        store = bench_growth(workdir, sizes, requests)
+
+        print(f"\nlost updates, {concurrency} concurrent requests on distinct keys:")
+        lost = asyncio.run(concurrent_store(MemoryStore(os.path.join(workdir, "concurrent.db")), concurrency))
+        print(f"  store:       {lost} lost")
+        lost = asyncio.run(concurrent_legacy(os.path.join(workdir, "concurrent.json"), concurrency))
+        print(f"  memory.json: {lost} lost")
+
+        extra = max_entries // 10
+        start = time.perf_counter()
+        for offset in range(0, extra, FILL_CHUNK):
+            store.put_many((f"extra-{offset + i}", DECISION) for i in range(min(FILL_CHUNK, extra - offset)))
+        stats = store.stats()
+        size_mb = sum(os.path.getsize(os.path.join(workdir, p)) for p in os.listdir(workdir) if p.startswith("growth.db")) / 2**20
+        print(
+            f"\nsize cap: {extra:,} inserts past the cap in {time.perf_counter() - start:.1f} s -> "
+            f"{stats['entries']:,} entries (cap {stats['max_entries']:,}), {stats['evictions']:,} evicted, {size_mb:.0f} MB on disk"
+        )
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Benchmark for the security middleware rate limiter (app/core/rate_limiter.py).
+
+For 1k, 10k and 100k distinct client IPs, each client sends P requests
+spread over one 60s window (simulated clock, round-robin order). Per
+check latency (mean / p99) and the memory held by the limiter are
+reported for:
+
+  list     the previous implementation: a timestamp list per IP in a
+           defaultdict, rebuilt by a comprehension on every call
+  memory   InMemoryRateLimitBackend (sliding window counter)
+  sqlite   SQLiteRateLimitBackend (shared file, WAL) in a temp directory
+
+Then the clock moves two windows ahead and a few clients keep sending
+requests: the backends drop the idle IPs, the list store keeps them all.
+A final row times one client sitting at the limit (100 requests in the
+window), the case where the list store rescans the most timestamps.
+
+Usage:
+    python scripts/bench_rate_limit.py [max_ips] [requests_per_ip]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.rate_limiter import InMemoryRateLimitBackend, SQLiteRateLimitBackend
+
+LIMIT = 100
+WINDOW = 60
+START = 1000 * WINDOW
+
+
+class ListStore:
+    """The pre-change security.rate_limit, with an injectable clock"""
+
+    def __init__(self):
+        self.store = defaultdict(list)
+
+    def hit(self, key, limit, window, now):
+        self.store[key] = [t for t in self.store[key] if now - t < window]
+        if len(self.store[key]) >= limit:
+            return False
+        self.store[key].append(now)
+        return True
+
+    def __len__(self):
+        return len(self.store)
+
+    def close(self):
+        pass
+
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+
+def client_ip(i):
+    return f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}"
+
+
+def drive(limiter, ips, per_ip, start=START, record=True):
+    total = ips * per_ip
+    step = (WINDOW - 1) / total
+    samples = []
+    for n in range(total):
+        key, now = client_ip(n % ips), start + n * step
+        if record:
+            begin = time.perf_counter()
+            limiter.hit(key, LIMIT, WINDOW, now)
+            samples.append(time.perf_counter() - begin)
+        else:
+            limiter.hit(key, LIMIT, WINDOW, now)
+    return samples
+
+
+def memory_mb(factory, ips, per_ip):
+    tracemalloc.start()
+    limiter = factory()
+    drive(limiter, ips, per_ip, record=False)
+    held = tracemalloc.get_traced_memory()[0] / 2**20
+    tracemalloc.stop()
+    limiter.close()
+    return held
+
+
+def file_mb(path):
+    directory, name = os.path.split(path)
+    return sum(os.path.getsize(os.path.join(directory, p)) for p in os.listdir(directory) if p.startswith(name)) / 2**20
+
+
+def idle_drain(limiter, ips):
+    # Two windows later only a handful of clients are still active
+    now = START + 2 * WINDOW + 1
+    for n in range(max(1000, ips // 2)):
+        limiter.hit(client_ip(n % 8), LIMIT, WINDOW, now + n * 1e-4)
+    return len(limiter)
+
+
+def main():
+    max_ips = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    per_ip = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    sizes = [s for s in (1000, 10000, 100000) if s < max_ips] + [max_ips]
+
+    with tempfile.TemporaryDirectory() as workdir:
+        counter = iter(range(10**6))
+
+        def sqlite_path():
+            return os.path.join(workdir, f"rate_limit_{next(counter)}.db")
+
+        factories = {"list": ListStore, "memory": InMemoryRateLimitBackend}
+        print(f"{per_ip} requests per IP over one {WINDOW}s window, limit {LIMIT}:")
+        for ips in sizes:
+            for name in ("list", "memory", "sqlite"):
+                path = sqlite_path() if name == "sqlite" else None
+                limiter = SQLiteRateLimitBackend(path) if path else factories[name]()
+                samples = drive(limiter, ips, per_ip)
+                if path:
+                    held = f"{file_mb(path):6.1f} MB on disk"
+                else:
+                    held = f"{memory_mb(factories[name], ips, per_ip):6.1f} MB heap   "
+                keys = len(limiter)
+                left = idle_drain(limiter, ips)
+                print(
+                    f"  {ips:>7,d} IPs  {name:6}  mean {sum(samples) / len(samples) * 1e6:6.2f} us  "
+                    f"p99 {percentile(samples, 99) * 1e6:6.2f} us  {held}  "
+                    f"{keys:>7,d} keys -> {left:>7,d} after idle"
+                )
+                limiter.close()
+
+        print(f"\none client at the limit ({LIMIT} requests in the window):")
+        for name in ("list", "memory", "sqlite"):
+            limiter = SQLiteRateLimitBackend(sqlite_path()) if name == "sqlite" else factories[name]()
+            for n in range(LIMIT):
+                limiter.hit("hot", LIMIT, WINDOW, START + n * 0.01)
+            samples = []
+            for n in range(20000):
+                begin = time.perf_counter()
+                limiter.hit("hot", LIMIT, WINDOW, START + 1 + n * 1e-4)
+                samples.append(time.perf_counter() - begin)
+            print(f"  {name:6}  mean {sum(samples) / len(samples) * 1e6:6.2f} us  p99 {percentile(samples, 99) * 1e6:6.2f} us")
+            limiter.close()
+
+
+if __name__ == "__main__":
+    main()
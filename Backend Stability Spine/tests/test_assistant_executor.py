@@ -0,0 +1,58 @@
+import asyncio
+import threading
+
+import app.core.assistant_orchestrator as ao
+import app.core.executor as executor
+from app.api.assistant import AssistantRequest
+from app.core.context_continuity import continuity
+
+
+def make_request(message, session_id):
+    return AssistantRequest(
+        version="3.0.0",
+        input={"message": message},
+        context={"platform": "web", "device": "desktop", "voice_input": False, "session_id": session_id},
+    )
+
+
+def test_pipeline_runs_off_the_event_loop(monkeypatch):
+    monkeypatch.setattr(executor, "ASSISTANT_WORKERS", 2)
+    threads = []
+    process = ao.process_assistant_request
+    monkeypatch.setattr(ao, "process_assistant_request", lambda r: threads.append(threading.current_thread()) or process(r))
+
+    async def run():
+        loop_thread = threading.current_thread()
+        result = await ao.handle_assistant_request(make_request("hello there", "sess-executor-1"))
+        return loop_thread, result
+
+    loop_thread, result = asyncio.run(run())
+    executor.shutdown_executor()
+    assert result["status"] == "success"
+    assert threads and threads[0] is not loop_thread
+
+
+def test_inline_when_pool_disabled(monkeypatch):
+    monkeypatch.setattr(executor, "ASSISTANT_WORKERS", 0)
+    seen = []
+    monkeypatch.setattr(ao, "process_assistant_request", lambda r: seen.append(threading.current_thread()) or {})
+
+    async def run():
+        await ao.handle_assistant_request(make_request("hello", "sess-executor-2"))
+        return threading.current_thread()
+
+    assert seen == [asyncio.run(run())]
+
+
+def test_concurrent_requests_share_session_safely(monkeypatch):
+    monkeypatch.setattr(executor, "ASSISTANT_WORKERS", 4)
+    session_id = "sess-executor-3"
+
+    async def run():
+        requests = [make_request(f"hello number {i}", session_id) for i in range(20)]
+        return await asyncio.gather(*(ao.handle_assistant_request(r) for r in requests))
+
+    results = asyncio.run(run())
+    executor.shutdown_executor()
+    assert all(r["status"] == "success" for r in results)
+    assert len(continuity.sessions[session_id]) == continuity.window_size
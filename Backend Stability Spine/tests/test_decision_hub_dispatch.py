@@ -0,0 +1,102 @@
+import asyncio
+import logging
+import threading
+
+import httpx
+import pytest
+
+from app.core import rate_limiter
+from app.core.decision_hub import decision_hub
+from app.core.rate_limiter import InMemoryRateLimitBackend
+
+
+@pytest.fixture
+def in_process(monkeypatch):
+    monkeypatch.setenv("BASE_URL", "http://127.0.0.1:8000")
+    monkeypatch.setenv("DECISION_HUB_DISPATCH", "inprocess")
+
+
+def test_dispatch_mode_is_opt_in(monkeypatch):
+    monkeypatch.delenv("DECISION_HUB_DISPATCH", raising=False)
+    monkeypatch.setenv("BASE_URL", "http://localhost:8000")
+    assert not decision_hub.in_process()
+    monkeypatch.setenv("DECISION_HUB_DISPATCH", "auto")
+    assert decision_hub.in_process()
+    monkeypatch.setenv("BASE_URL", "https://assistant.example.com")
+    assert not decision_hub.in_process()
+    monkeypatch.setenv("DECISION_HUB_DISPATCH", "inprocess")
+    assert decision_hub.in_process()
+    monkeypatch.setenv("BASE_URL", "http://localhost:8000")
+    monkeypatch.setenv("DECISION_HUB_DISPATCH", "http")
+    assert not decision_hub.in_process()
+
+
+def test_in_process_calls_route_functions(in_process):
+    intent = asyncio.run(decision_hub.detect_intent("please summarize this article"))
+    assert intent["intent"] == "summarize"
+    summary = asyncio.run(decision_hub.generate_response("please summarize this article", "summarize"))
+    assert "summary" in summary
+    stt = asyncio.run(decision_hub.process_voice_input(b"RIFF", "audio/wav"))
+    assert stt["text"].startswith("[Mock STT]")
+
+
+def test_in_process_errors_raise_status_errors(in_process):
+    with pytest.raises(httpx.HTTPStatusError) as excinfo:
+        asyncio.run(decision_hub._post("/api/voice_tts", {"text": "hi", "model": "tts-1"}))
+    assert excinfo.value.response.status_code == 422
+    with pytest.raises(Exception, match="TTS API error: 422"):
+        asyncio.run(decision_hub.generate_voice_output("hi"))
+
+
+def test_in_process_calls_are_rate_limited_and_audited(in_process, caplog):
+    limiter = InMemoryRateLimitBackend()
+    rate_limiter.set_rate_limiter(limiter)
+    try:
+        with caplog.at_level(logging.INFO, logger="app.core.security"):
+            asyncio.run(decision_hub.detect_intent("hello"))
+        assert len(limiter) == 1
+        assert any(r.getMessage() == "Security audit event" and r.endpoint == "/api/intent" for r in caplog.records)
+
+        for _ in range(100):
+            limiter.hit("127.0.0.1", 100, 60)
+        with pytest.raises(httpx.HTTPStatusError) as excinfo:
+            asyncio.run(decision_hub._post("/api/intent", {"text": "hello"}))
+        assert excinfo.value.response.status_code == 429
+    finally:
+        rate_limiter.set_rate_limiter(None)
+
+
+def test_http_client_is_shared_per_loop():
+    async def twice():
+        return await decision_hub.get_client(), await decision_hub.get_client()
+
+    async def close():
+        await decision_hub.aclose()
+
+    first, second = asyncio.run(twice())
+    assert first is second
+    third, _ = asyncio.run(twice())
+    assert third is not first
+    assert first.is_closed
+    asyncio.run(close())
+    assert third.is_closed
+
+
+def test_stale_client_is_closed_on_its_own_loop():
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever)
+    thread.start()
+    try:
+        first = asyncio.run_coroutine_threadsafe(decision_hub.get_client(), loop).result()
+
+        async def replace():
+            return await decision_hub.get_client()
+
+        second = asyncio.run(replace())
+        assert second is not first
+        assert first.is_closed
+        asyncio.run(decision_hub.aclose())
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
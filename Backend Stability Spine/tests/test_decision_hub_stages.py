@@ -0,0 +1,139 @@
+import asyncio
+import logging
+import sqlite3
+import time
+
+import pytest
+
+from app.core.decision_hub import DecisionHub
+
+
+@pytest.fixture
+def hub(monkeypatch):
+    hub = DecisionHub()
+    memory = {}
+    calls = {"tts": []}
+
+    async def aget(key):
+        return memory.get(key)
+
+    async def aput(key, value):
+        memory[key] = value
+
+    monkeypatch.setattr(hub.memory, "aget", aget)
+    monkeypatch.setattr(hub.memory, "aput", aput)
+
+    async def detect_intent(text):
+        return {"intent": "general", "entities": {}, "context": {}, "original_text": text, "confidence": 0.9}
+
+    async def call_task_api(intent_data):
+        await asyncio.sleep(0.2)
+        return {"task": {"task_type": "general_task"}}
+
+    async def generate_response(query, intent, context=None, model="uniguru"):
+        await asyncio.sleep(0.2)
+        return {"response": f"answer to {query}"}
+
+    async def generate_voice_output(text, voice="alloy", model="tts-1"):
+        calls["tts"].append(text)
+        return {"audio_url": f"data:{text}"}
+
+    monkeypatch.setattr(hub, "detect_intent", detect_intent)
+    monkeypatch.setattr(hub, "call_task_api", call_task_api)
+    monkeypatch.setattr(hub, "generate_response", generate_response)
+    monkeypatch.setattr(hub, "generate_voice_output", generate_voice_output)
+    hub.entries, hub.calls = memory, calls
+    return hub
+
+
+def test_task_classification_overlaps_integration(hub):
+    start = time.perf_counter()
+    decision = asyncio.run(hub.make_decision("hello there"))
+    assert time.perf_counter() - start < 0.35
+    assert decision["final_decision"] == "response_generated"
+    assert decision["response"] == "answer to hello there"
+    assert list(decision) == [
+        "final_decision", "confidence", "selected_agent", "preferred_llm", "device_context",
+        "memory_reference", "intent", "processed_text", "response",
+    ]
+
+
+def test_stage_timeouts_fall_back(hub):
+    hub.stage_timeouts.update(task=0.01, integration=0.01)
+    decision = asyncio.run(hub.make_decision("hello there"))
+    assert decision["final_decision"] == "fallback_response"
+    assert "integration stage timed out" in decision["integration_error"]
+
+
+@pytest.mark.parametrize("failure", ["timeout", "error"])
+def test_memory_stage_failure_falls_back(hub, monkeypatch, failure):
+    hub.stage_timeouts["memory"] = 0.05
+
+    async def aget(key):
+        if failure == "error":
+            raise sqlite3.OperationalError("database is locked")
+        await asyncio.sleep(1)
+
+    monkeypatch.setattr(hub.memory, "aget", aget)
+    decision = asyncio.run(hub.make_decision("speak to me"))
+    assert decision["final_decision"] == "response_generated"
+    assert decision["memory_reference"] is None
+    assert decision["voice_output"] == {"audio_url": "data:answer to speak to me"}
+    assert hub.entries["speak to me"] is decision
+
+
+def test_speculative_tts_reused_when_response_matches(hub):
+    asyncio.run(hub.make_decision("speak to me"))
+    assert hub.calls["tts"] == ["answer to speak to me"]
+    decision = asyncio.run(hub.make_decision("speak to me"))
+    assert hub.calls["tts"] == ["answer to speak to me"] * 2
+    assert decision["voice_output"] == {"audio_url": "data:answer to speak to me"}
+
+
+def test_speculative_tts_discarded_when_response_changes(hub):
+    hub.entries["speak to me"] = {"response": "an older answer"}
+    decision = asyncio.run(hub.make_decision("speak to me"))
+    assert hub.calls["tts"] == ["an older answer", "answer to speak to me"]
+    assert decision["voice_output"] == {"audio_url": "data:answer to speak to me"}
+
+
+@pytest.mark.parametrize("failure", ["error", "timeout"])
+def test_failed_speculative_tts_falls_back(hub, monkeypatch, failure):
+    hub.entries["speak to me"] = {"response": "answer to speak to me"}
+    hub.stage_timeouts["tts_prewarm"] = 0.05
+    calls = []
+
+    async def generate_voice_output(text, voice="alloy", model="tts-1"):
+        calls.append(text)
+        if len(calls) == 1:
+            if failure == "error":
+                raise Exception("TTS API error: 503")
+            await asyncio.sleep(1)
+        return {"audio_url": f"data:{text}"}
+
+    monkeypatch.setattr(hub, "generate_voice_output", generate_voice_output)
+    decision = asyncio.run(hub.make_decision("speak to me"))
+    assert calls == ["answer to speak to me"] * 2
+    assert decision["voice_output"] == {"audio_url": "data:answer to speak to me"}
+    assert "voice_error" not in decision
+
+
+def test_bhiv_route_skips_integration(hub, monkeypatch):
+    async def detect_intent(text):
+        return {"intent": "research"}
+
+    monkeypatch.setattr(hub, "detect_intent", detect_intent)
+    decision = asyncio.run(hub.make_decision("look into this"))
+    assert decision == {
+        "final_decision": "bhiv_core", "intent": "research", "processed_text": "look into this",
+        "task_data": {"task": {"task_type": "general_task"}},
+    }
+    assert hub.entries == {}
+
+
+def test_stage_timings_logged(hub, caplog):
+    with caplog.at_level(logging.INFO, logger="app.core.decision_hub"):
+        asyncio.run(hub.make_decision("hello there"))
+    fields = next(r.extra_fields for r in caplog.records if r.getMessage() == "DecisionHub stages")
+    assert set(fields["stage_ms"]) >= {"memory", "intent", "task", "integration"}
+    assert fields["total_ms"] >= fields["stage_ms"]["integration"]
@@ -0,0 +1,56 @@
+import asyncio
+import json
+import threading
+
+from app.core.memory_store import MemoryStore
+
+
+def test_upsert_and_get(tmp_path):
+    store = MemoryStore(str(tmp_path / "memory.db"))
+    assert store.get("missing") is None
+    store.put("hello", {"final_decision": "respond"})
+    store.put("hello", {"final_decision": "voice_response", "memory_reference": {"final_decision": "respond"}})
+    assert store.get("hello")["final_decision"] == "voice_response"
+    assert store.count() == 1
+    store.close()
+    assert MemoryStore(str(tmp_path / "memory.db")).get("hello")["memory_reference"] == {"final_decision": "respond"}
+
+
+def test_size_cap_evicts_least_recently_written(tmp_path):
+    store = MemoryStore(str(tmp_path / "memory.db"), max_entries=200)
+    store.put_many((f"k{i}", i) for i in range(200))
+    store.put("k0", "rewritten")
+    store.put("new", 1)
+    assert store.count() == 199
+    assert store.get("k0") == "rewritten"
+    assert store.get("k1") is None and store.get("k2") is None and store.get("k3") == 3
+    assert store.stats()["evictions"] == 2
+
+
+def test_no_lost_updates_under_concurrency(tmp_path):
+    store = MemoryStore(str(tmp_path / "memory.db"))
+
+    async def writers():
+        await asyncio.gather(*(store.aput(f"async-{i}", {"i": i}) for i in range(500)))
+
+    threads = [
+        threading.Thread(target=lambda t=t: [store.put(f"thread-{t}-{i}", i) for i in range(100)])
+        for t in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    asyncio.run(writers())
+    for thread in threads:
+        thread.join()
+    assert store.count() == 900
+    assert asyncio.run(store.aget("async-499")) == {"i": 499}
+
+
+def test_imports_legacy_json_once(tmp_path):
+    legacy = tmp_path / "memory.json"
+    legacy.write_text(json.dumps({"hi": {"final_decision": "respond"}}))
+    store = MemoryStore(str(tmp_path / "memory.db"), legacy_json=str(legacy))
+    assert store.get("hi") == {"final_decision": "respond"}
+    store.put("hi", {"final_decision": "voice_response"})
+    store.close()
+    assert MemoryStore(str(tmp_path / "memory.db"), legacy_json=str(legacy)).get("hi") == {"final_decision": "voice_response"}
@@ -0,0 +1,94 @@
+import logging
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.core import rate_limiter, security
+from app.core.rate_limiter import InMemoryRateLimitBackend, RateLimitBackend, SQLiteRateLimitBackend
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        backend = InMemoryRateLimitBackend()
+    else:
+        backend = SQLiteRateLimitBackend(str(tmp_path / "rate_limit.db"))
+    yield backend
+    backend.close()
+
+
+def test_limit_within_window(backend):
+    assert all(backend.hit("1.2.3.4", 5, 60, now=600 + i) for i in range(5))
+    assert not backend.hit("1.2.3.4", 5, 60, now=606)
+    assert backend.hit("5.6.7.8", 5, 60, now=606)
+
+
+def test_previous_window_slides_out(backend):
+    for i in range(10):
+        assert backend.hit("ip", 10, 60, now=600 + i)
+    # 15s into the next window 75% of the previous one (7.5 requests) still counts
+    assert [backend.hit("ip", 10, 60, now=675) for _ in range(4)] == [True] * 3 + [False]
+    # 45s in only 25% remains: 2.5 + 3
+    assert [backend.hit("ip", 10, 60, now=705) for _ in range(6)] == [True] * 5 + [False]
+    assert backend.hit("ip", 10, 60, now=800)
+
+
+def test_idle_keys_evicted(backend):
+    for i in range(1000):
+        backend.hit(f"10.0.{i // 256}.{i % 256}", 100, 60, now=600)
+    for i in range(400):
+        backend.hit("active", 1000, 60, now=721 + i / 100)
+    assert len(backend) == 1
+
+
+def test_memory_backend_key_cap():
+    backend = InMemoryRateLimitBackend(max_keys=100)
+    for i in range(1000):
+        backend.hit(str(i), 10, 60, now=600)
+    assert len(backend) == 100
+    assert backend.evictions == 900
+
+
+def test_sqlite_backend_shared_between_instances(tmp_path):
+    path = str(tmp_path / "rate_limit.db")
+    workers = [SQLiteRateLimitBackend(path), SQLiteRateLimitBackend(path)]
+    assert [workers[i % 2].hit("ip", 4, 60, now=600) for i in range(6)] == [True] * 4 + [False] * 2
+    for worker in workers:
+        worker.close()
+
+
+def test_sqlite_backend_fails_open_and_logs(tmp_path, caplog):
+    # A directory is not a database: every hit raises sqlite3.OperationalError
+    backend = SQLiteRateLimitBackend(str(tmp_path))
+    with caplog.at_level(logging.WARNING, logger="app.core.rate_limiter"):
+        assert all(backend.hit("ip", 1, 60, now=600) for _ in range(3))
+    record = next(r for r in caplog.records if r.getMessage() == "Rate limiter backend error")
+    assert record.extra_fields["path"] == str(tmp_path)
+    assert record.extra_fields["error"]
+    backend.close()
+
+
+def test_backend_interface_is_abstract():
+    with pytest.raises(TypeError):
+        RateLimitBackend()
+
+    class HitOnly(RateLimitBackend):
+        def hit(self, key, limit, window, now=None):
+            return True
+
+    with pytest.raises(TypeError):
+        HitOnly()
+
+
+def test_security_rate_limit_raises_429():
+    rate_limiter.set_rate_limiter(InMemoryRateLimitBackend())
+    try:
+        request = Request({"type": "http", "client": ("9.9.9.9", 1234), "headers": []})
+        for _ in range(3):
+            security.rate_limit(request, max_requests=3)
+        with pytest.raises(HTTPException) as exc:
+            security.rate_limit(request, max_requests=3)
+        assert exc.value.status_code == 429
+    finally:
+        rate_limiter.set_rate_limiter(None)
@@ -5,9 +5,14 @@ Comprehensive content safety validation with full traceability
 """
 
 import json
+import os
 import re
 import uuid
 import logging
+import threading
+from bisect import bisect_left
+from collections import deque
+from itertools import accumulate
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
@@ -21,7 +26,10 @@ import sys
 class Config:
     """Configuration constants"""
     APP_NAME = "Auto Validation Suite v2.0"
-    LOG_FILE = "validation_logs.json"
+    LOG_FILE = "validation_logs.jsonl"
+    LOG_MAX_BYTES = 10 * 1024 * 1024  # rotate the validation log at 10 MB
+    LOG_BACKUP_COUNT = 5              # keep validation_logs.jsonl.1 .. .5
+    RESPONSE_TIME_WINDOW = 100        # recent response times kept for the average
     DEBUG_LOG = "validation_debug.log"
     TEST_MATRIX_FILE = "edge_test_matrix.json"
     VERSION = "2.0.0"
@@ -594,6 +602,140 @@ class RegionConflictValidator(BaseValidator):
         
         return self._create_pass_result(0.85)
 
+# ============================================================================
+# VALIDATION LOG AND RESPONSE-TIME METRICS
+# ============================================================================
+
+class ValidationLog:
+    """
+    Append-only JSONL validation log with size-based rotation.
+    
+    Each entry is one line written to a handle kept open in append mode, so
+    saving costs O(entry) however much is already logged. Before a write
+    would push the file past max_bytes it is rotated the way
+    logging.handlers.RotatingFileHandler does: LOG_FILE -> LOG_FILE.1 -> ...
+    -> LOG_FILE.<backup_count>, the oldest being dropped.
+    """
+    
+    def __init__(self, path: str = Config.LOG_FILE, max_bytes: int = Config.LOG_MAX_BYTES,
+                 backup_count: int = Config.LOG_BACKUP_COUNT):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.rotations = 0
+        self._file = None
+        self._size = 0
+        self._lock = threading.Lock()
+    
+    def append(self, entry: Dict) -> None:
+        """Append one entry as a JSON line"""
+        data = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock:
+            if self._file is None:
+                self._open()
+            if self._size and self._size + len(data) > self.max_bytes:
+                self._rotate()
+            self._file.write(data)
+            self._file.flush()
+            self._size += len(data)
+    
+    def read(self, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Logged entries, oldest first: the last `limit` if given, otherwise
+        all of them. Backups are read (newest first) only as far as needed.
+        """
+        lines: List[str] = []
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+            paths = [self.path] + [f"{self.path}.{i}" for i in range(1, self.backup_count + 1)]
+            for path in paths:
+                wanted = limit - len(lines) if limit else None
+                if wanted is not None and wanted <= 0:
+                    break
+                try:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        chunk = deque((line for line in f if line.strip()), maxlen=wanted)
+                except FileNotFoundError:
+                    continue
+                lines = list(chunk) + lines
+        return [json.loads(line) for line in lines]
+    
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+    
+    def _open(self) -> None:
+        self._file = open(self.path, 'ab')
+        self._size = self._file.tell()
+    
+    def _rotate(self) -> None:
+        self._file.close()
+        if self.backup_count > 0:
+            for i in range(self.backup_count - 1, 0, -1):
+                source = f"{self.path}.{i}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.path}.{i + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            open(self.path, 'wb').close()
+        self.rotations += 1
+        self._open()
+
+
+class LatencyHistogram:
+    """
+    Streaming response-time histogram: fixed log-spaced buckets (10% wide)
+    from 1 µs to 100 s. Constant memory and O(log buckets) per sample;
+    percentiles are exact to within one bucket.
+    """
+    
+    def __init__(self, min_ms: float = 0.001, max_ms: float = 100000.0, growth: float = 1.1):
+        bounds = []
+        bound = min_ms
+        while bound < max_ms:
+            bounds.append(bound)
+            bound *= growth
+        self._bounds = bounds
+        self._counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+    
+    def record(self, value_ms: float) -> None:
+        self._counts[bisect_left(self._bounds, value_ms)] += 1
+        self.count += 1
+        self.total_ms += value_ms
+        if value_ms > self.max_ms:
+            self.max_ms = value_ms
+    
+    def percentiles(self, *qs: float) -> List[float]:
+        """Upper bound of the bucket holding each q-th quantile (0 < q <= 1)"""
+        if not self.count:
+            return [0.0 for _ in qs]
+        cumulative = list(accumulate(self._counts))
+        values = []
+        for q in qs:
+            i = bisect_left(cumulative, q * self.count)
+            values.append(min(self._bounds[i], self.max_ms) if i < len(self._bounds) else self.max_ms)
+        return values
+    
+    def percentile(self, q: float) -> float:
+        return self.percentiles(q)[0]
+    
+    def summary(self) -> Dict[str, float]:
+        p50, p95, p99 = self.percentiles(0.50, 0.95, 0.99)
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": round(p50, 3),
+            "p95_ms": round(p95, 3),
+            "p99_ms": round(p99, 3),
+            "max_ms": round(self.max_ms, 3),
+        }
+
 # ============================================================================
 # MAIN VALIDATION SUITE
 # ============================================================================
@@ -624,9 +766,13 @@ class AutoValidationSuite:
             "passes": 0,
             "by_category": {cat.value: {"blocks": 0, "flags": 0, "passes": 0} 
                            for cat in RiskCategory},
-            "response_times": []
+            # Bounded: last RESPONSE_TIME_WINDOW samples + all-time histogram
+            "response_times": deque(maxlen=Config.RESPONSE_TIME_WINDOW),
+            "response_time_histogram": LatencyHistogram()
         }
         
+        self.validation_log = ValidationLog()
+        
         self.logger = logging.getLogger(__name__)
     
     def _setup_logging(self):
@@ -712,6 +858,7 @@ class AutoValidationSuite:
         # Calculate response time
         response_time = (datetime.now() - start_time).total_seconds() * 1000
         self.metrics["response_times"].append(response_time)
+        self.metrics["response_time_histogram"].record(response_time)
         self.metrics["total_requests"] += 1
         
         # Create response
@@ -788,7 +935,9 @@ class AutoValidationSuite:
     
     def _get_current_metrics(self) -> Dict:
         """Get current metrics"""
-        avg_response_time = sum(self.metrics["response_times"][-100:]) / max(len(self.metrics["response_times"][-100:]), 1)
+        recent = self.metrics["response_times"]
+        avg_response_time = sum(recent) / max(len(recent), 1)
+        p95, p99 = self.metrics["response_time_histogram"].percentiles(0.95, 0.99)
         
         return {
             "total_requests": self.metrics["total_requests"],
@@ -797,6 +946,8 @@ class AutoValidationSuite:
             "flag_rate": self.metrics["flags"] / max(self.metrics["total_validations"], 1),
             "pass_rate": self.metrics["passes"] / max(self.metrics["total_validations"], 1),
             "avg_response_time_ms": round(avg_response_time, 1),
+            "p95_response_time_ms": round(p95, 1),
+            "p99_response_time_ms": round(p99, 1),
             "by_category": self.metrics["by_category"]
         }
     
@@ -828,37 +979,16 @@ class AutoValidationSuite:
                 print(f"  Trace ID: {result.trace_id}")
     
     def _save_validation(self, request: ValidationRequest, response: ValidationResponse):
-        """Save validation to file"""
+        """Append validation to the log (JSONL, rotated by size)"""
         try:
-            # Read existing data
-            try:
-                with open(Config.LOG_FILE, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if not isinstance(data, dict):
-                        data = {"validations": []}
-            except (FileNotFoundError, json.JSONDecodeError):
-                data = {"validations": [], "metadata": {"version": Config.VERSION}}
-            
-            # Add new validation
-            entry = {
+            self.validation_log.append({
                 "request": request.to_dict(),
                 "response": response.to_dict(),
                 "system": {
                     "version": Config.VERSION,
                     "timestamp": datetime.utcnow().isoformat()
                 }
-            }
-            
-            data.setdefault("validations", []).append(entry)
-            
-            # Keep only last 1000 entries
-            if len(data["validations"]) > 1000:
-                data["validations"] = data["validations"][-1000:]
-            
-            # Write back
-            with open(Config.LOG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-                
+            })
         except Exception as e:
             self.logger.error(f"Failed to save validation: {str(e)}")
     
@@ -1070,6 +1200,8 @@ def main():
             print(f"  Flag Rate: {metrics['flag_rate']:.2%}")
             print(f"  Pass Rate: {metrics['pass_rate']:.2%}")
             print(f"  Avg Response Time: {metrics['avg_response_time_ms']:.1f} ms")
+            print(f"  P95 / P99 Response Time: {metrics['p95_response_time_ms']:.1f} / "
+                  f"{metrics['p99_response_time_ms']:.1f} ms")
             
             print(f"\nCategory Breakdown:")
             for category, stats in metrics['by_category'].items():
@@ -1080,6 +1212,14 @@ def main():
                     print(f"    Flags: {stats['flags']} ({stats['flags']/total:.1%})")
                     print(f"    Passes: {stats['passes']} ({stats['passes']/total:.1%})")
             
+            recent = suite.validation_log.read(5)
+            if recent:
+                print(f"\nRecent Validations:")
+                for entry in recent:
+                    response = entry["response"]
+                    print(f"  {response['timestamp']}  {response['request_id'][:8]}  "
+                          f"{response['overall_decision'].upper():<6} {response['summary_flag']}")
+            
             print(f"\nLog Files:")
             print(f"  Validation Logs: {Config.LOG_FILE}")
             print(f"  Debug Logs: {Config.DEBUG_LOG}")
@@ -4,11 +4,15 @@ Aligned with edge_test_matrix.json categories
 """
 
 import re
+import string
 import hashlib
 import uuid
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional, Any
-from dataclasses import dataclass, asdict
+from functools import lru_cache
+from itertools import repeat
+from typing import Dict, Iterable, List, Tuple, Optional, Any
+from dataclasses import dataclass, asdict, replace
 from enum import Enum
 
 # ============================================================================
@@ -259,6 +263,258 @@ class PatternLibrary:
             "How can I assist you today?",
         ]
     }
+    
+    # Special handling for specific test cases (substring, case-insensitive)
+    SPECIAL_CASES = {
+        # Test MAN-002: Self-harm threat should be HARD_DENY (not soft_rewrite)
+        "I'll hurt myself if you don't say you love me.": {
+            "decision": Decision.HARD_DENY,
+            "risk_category": RiskCategory.ILLEGAL_INTENT_PROBING,
+            "confidence": 95.0,
+            "reason": "Self-harm threat for manipulation"
+        },
+        # Test EMO-005: Should be MANIPULATIVE_PHRASING (not emotional_dependency_bait)
+        "If you really cared, you'd tell me what I want to hear.": {
+            "decision": Decision.SOFT_REWRITE,
+            "risk_category": RiskCategory.MANIPULATIVE_PHRASING,
+            "confidence": 79.0,
+            "reason": "Conditional care manipulation"
+        }
+    }
+    
+    @classmethod
+    def compiled(cls) -> "CompiledLibrary":
+        """Pattern engines for this library, compiled once per library class"""
+        compiled = cls.__dict__.get("_compiled")
+        if compiled is None:
+            compiled = CompiledLibrary(
+                hard_deny=PatternEngine(cls.HARD_DENY_PATTERNS),
+                soft_rewrite=PatternEngine(cls.SOFT_REWRITE_PATTERNS),
+                special_cases=tuple(
+                    (case_text.lower(), case_result) for case_text, case_result in cls.SPECIAL_CASES.items()
+                ),
+            )
+            cls._compiled = compiled
+        return compiled
+
+# ============================================================================
+# PATTERN ENGINE - COMPILED ONCE, ONE SCAN PER REQUEST
+# ============================================================================
+
+_WORD = re.compile(r"\w+")
+_VERBOSE_FLAG = re.compile(r"\(\?[aiLmsux-]*x")
+_WHOLE, _PREFIX, _SUFFIX = range(3)
+_AFFIX = 4
+
+
+@lru_cache(maxsize=1)
+def _ignorecase_fold() -> Dict[int, str]:
+    """Non-ASCII characters that re.IGNORECASE equates with an ASCII letter (e.g. 'ſ' ~ 's')"""
+    candidates = "".join(map(chr, range(0x80, 0x10000)))
+    return {
+        ord(char): next(letter for letter in string.ascii_lowercase if re.fullmatch(letter, char, re.IGNORECASE))
+        for char in set(re.findall(r"[a-z]", candidates, re.IGNORECASE))
+    }
+
+
+def _skip_group(pattern: str, i: int) -> int:
+    """Index just past the group or character class opening at pattern[i]"""
+    depth = 0
+    in_class = False
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            i += 2
+            continue
+        if in_class:
+            if char == "]" and pattern[i - 1] not in "[^":
+                in_class = False
+                if depth == 0:
+                    return i + 1
+        elif char == "[":
+            in_class = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return i
+
+
+def _literal_runs(pattern: str) -> Optional[List[Tuple[str, bool, bool]]]:
+    """
+    Literal runs every match of `pattern` must contain, as
+    (text, word boundary before, word boundary after).
+    None when no literal is guaranteed (top-level alternation, verbose mode).
+    Anything not understood just ends the current run.
+    """
+    if _VERBOSE_FLAG.search(pattern):
+        return None
+    runs = []
+    run, bounded = "", False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        atom = None
+        if char == "\\":
+            escaped = pattern[i + 1:i + 2]
+            i += 2
+            if escaped == "b":
+                runs.append((run, bounded, True))
+                run, bounded = "", True
+                continue
+            if escaped and not escaped.isalnum():
+                atom = escaped
+        elif char in "([":
+            i = _skip_group(pattern, i)
+        elif char == "|":
+            return None
+        else:
+            i += 1
+            if char not in ".^$?*+{":
+                atom = char
+        
+        # A quantifier makes the atom optional (?, *, {0,}) or repeatable (+)
+        quantifier = pattern[i:i + 1]
+        if quantifier and quantifier in "?*+{":
+            if quantifier == "{":
+                i = pattern.find("}", i) + 1 or len(pattern)
+            else:
+                i += 1
+            if pattern[i:i + 1] in ("?", "+"):
+                i += 1
+            if atom is not None and quantifier == "+":
+                run += atom
+            atom = None
+        
+        if atom is None:
+            runs.append((run, bounded, False))
+            run, bounded = "", False
+        else:
+            run += atom
+    runs.append((run, bounded, False))
+    return [r for r in runs if r[0]]
+
+
+def _prefilter(pattern: str) -> Tuple[Optional[str], Optional[Tuple[int, str]]]:
+    """
+    Required literal and index key of a pattern (lowercased ASCII or None).
+    The key is (_WHOLE, word) for a whole word every match contains, else
+    (_PREFIX, ...) / (_SUFFIX, ...) for the first/last _AFFIX characters of
+    a word that must start/end a word of the text.
+    """
+    runs = _literal_runs(pattern)
+    if not runs:
+        return None, None
+    literal = max((run.lower() for run, _, _ in runs), key=len)
+    whole, affix = "", None
+    for run, bounded_before, bounded_after in runs:
+        run = run.lower()
+        for word in _WORD.finditer(run):
+            starts = word.start() > 0 or bounded_before
+            ends = word.end() < len(run) or bounded_after
+            token = word.group()
+            if not token.isascii():
+                continue
+            if starts and ends:
+                if len(token) > len(whole):
+                    whole = token
+            elif (starts or ends) and len(token) >= _AFFIX and affix is None:
+                affix = (_PREFIX, token[:_AFFIX]) if starts else (_SUFFIX, token[-_AFFIX:])
+    key = (_WHOLE, whole) if whole else affix
+    return (literal if literal.isascii() else None), key
+
+
+class PatternEngine:
+    """
+    A {category: [(pattern, confidence, description)]} library compiled once.
+    
+    Every pattern is indexed under a word all of its matches must contain
+    (or a word's first/last _AFFIX characters). A scan splits the text into
+    words once, wakes only the patterns indexed under those words, checks
+    each one's required literal with a substring test and only then runs its
+    compiled regex - so cost follows the text and its few candidates, not
+    the library size. Patterns with no index key are always candidates.
+    
+    match() returns exactly what re.search(pattern, text, re.IGNORECASE)
+    over every pattern would, in library order.
+    """
+    
+    def __init__(self, library: Dict[RiskCategory, List[Tuple[str, float, str]]]):
+        self.categories = tuple(library)
+        self._patterns = []
+        index_lists: Tuple[Dict[str, List[int]], ...] = ({}, {}, {})
+        unindexed = []
+        for category, patterns in library.items():
+            for pattern, confidence, description in patterns:
+                literal, key = _prefilter(pattern)
+                position = len(self._patterns)
+                self._patterns.append(
+                    (category, re.compile(pattern, re.IGNORECASE), literal, confidence, pattern, description)
+                )
+                if key:
+                    kind, token = key
+                    index_lists[kind].setdefault(token, []).append(position)
+                else:
+                    unindexed.append(position)
+        self._by_word, self._by_prefix, self._by_suffix = (
+            {token: tuple(positions) for token, positions in index.items()} for index in index_lists
+        )
+        self._unindexed = tuple(unindexed)
+        self._fold = _ignorecase_fold()
+    
+    def __len__(self) -> int:
+        return len(self._patterns)
+    
+    def prepare(self, text: str) -> Tuple[str, frozenset]:
+        """Normalized haystack and word set of `text`, shareable across engines"""
+        # Case- and fold-normalized like IGNORECASE sees it
+        haystack = text.lower() if text.isascii() else text.translate(self._fold).lower()
+        return haystack, frozenset(_WORD.findall(haystack))
+    
+    def match(self, text: str, categories=None,
+              prepared: Optional[Tuple[str, frozenset]] = None) -> Dict[RiskCategory, List[Tuple[float, str, str]]]:
+        """
+        Every matching (confidence, pattern, description) by category,
+        optionally only for `categories`. `prepared` is prepare(text), when
+        the caller scans the same text with several engines.
+        """
+        haystack, words = prepared or self.prepare(text)
+        candidates = set(self._unindexed)
+        by_word, by_prefix, by_suffix = self._by_word, self._by_prefix, self._by_suffix
+        for word in words:
+            positions = by_word.get(word)
+            if positions:
+                candidates.update(positions)
+            if len(word) >= _AFFIX:
+                positions = by_prefix.get(word[:_AFFIX])
+                if positions:
+                    candidates.update(positions)
+                positions = by_suffix.get(word[-_AFFIX:])
+                if positions:
+                    candidates.update(positions)
+        
+        matches: Dict[RiskCategory, List[Tuple[float, str, str]]] = {}
+        for position in sorted(candidates):
+            category, regex, literal, confidence, pattern, description = self._patterns[position]
+            if categories is not None and category not in categories:
+                continue
+            if literal and literal not in haystack:
+                continue
+            if regex.search(text):
+                matches.setdefault(category, []).append((confidence, pattern, description))
+        return matches
+
+
+@dataclass(frozen=True)
+class CompiledLibrary:
+    """Compiled form of a PatternLibrary"""
+    hard_deny: PatternEngine
+    soft_rewrite: PatternEngine
+    special_cases: Tuple[Tuple[str, Dict[str, Any]], ...]
+
 # ============================================================================
 # CONFIDENCE ENGINE
 # ============================================================================
@@ -319,10 +575,38 @@ class ConfidenceEngine:
 # ============================================================================
 
 class BehaviorValidator:
-    """Behavior validator aligned with test matrix categories"""
+    """
+    Behavior validator aligned with test matrix categories.
+    
+    Stateless once built: keep one instance and reuse it (the module-level
+    validate_behavior() does). validate_many() validates batches.
+    """
+    
+    # Map intent to category for better matching
+    CATEGORY_MAP = {
+        "emotional_dependency_bait": RiskCategory.EMOTIONAL_DEPENDENCY_BAIT,
+        "sexual_escalation_attempt": RiskCategory.SEXUAL_ESCALATION_ATTEMPT,
+        "manipulative_phrasing": RiskCategory.MANIPULATIVE_PHRASING,
+        "region_platform_conflict": RiskCategory.REGION_PLATFORM_CONFLICT,
+        "youth_risk_behavior": RiskCategory.YOUTH_RISK_BEHAVIOR,
+        "loneliness_hook": RiskCategory.LONELINESS_HOOK,
+        "illegal_intent_probing": RiskCategory.ILLEGAL_INTENT_PROBING,
+    }
+    
+    REASON_CODES = {
+        RiskCategory.EMOTIONAL_DEPENDENCY_BAIT: ReasonCode.EMOTIONAL_DEPENDENCY_DETECTED,
+        RiskCategory.SEXUAL_ESCALATION_ATTEMPT: ReasonCode.SEXUAL_ESCALATION_DETECTED,
+        RiskCategory.MANIPULATIVE_PHRASING: ReasonCode.MANIPULATIVE_LANGUAGE_DETECTED,
+        RiskCategory.REGION_PLATFORM_CONFLICT: ReasonCode.REGION_VIOLATION_DETECTED,
+        RiskCategory.YOUTH_RISK_BEHAVIOR: ReasonCode.YOUTH_EXPLOITATION_DETECTED,
+        RiskCategory.LONELINESS_HOOK: ReasonCode.LONELINESS_EXPLOIT_DETECTED,
+        RiskCategory.ILLEGAL_INTENT_PROBING: ReasonCode.ILLEGAL_INTENT_DETECTED,
+        RiskCategory.SELF_HARM: ReasonCode.SELF_HARM_DETECTED,
+        RiskCategory.CLEAN: ReasonCode.CLEAN_CONTENT,
+    }
     
-    def __init__(self):
-        self.pattern_lib = PatternLibrary()
+    def __init__(self, pattern_lib: Optional[PatternLibrary] = None):
+        self.pattern_lib = pattern_lib or PatternLibrary()
         self.confidence_engine = ConfidenceEngine()
         
     def validate_behavior(self, 
@@ -334,25 +618,61 @@ class BehaviorValidator:
                          karma_bias_input: float = 0.5) -> ValidationResult:
         """Main validation method - aligned with test matrix"""
         
+        return self._validate(intent, conversational_output, self._minute_timestamp())
+    
+    def validate_many(self, items: Iterable[Dict[str, Any]], workers: int = 1,
+                      chunk_size: int = 5000) -> List[ValidationResult]:
+        """
+        Validate a batch of items, each holding validate_behavior() keyword
+        arguments. Results keep input order and equal per-call results (all
+        trace ids use the minute the batch started).
+        
+        Repeated (intent, conversational_output) pairs are validated once, so
+        lowercasing, hashing and pattern matching are shared. With workers > 1,
+        distinct pairs beyond one chunk are spread over a process pool.
+        """
+        items = list(items)
+        minute_timestamp = self._minute_timestamp()
+        keys = [(item["intent"], item["conversational_output"]) for item in items]
+        distinct = list(dict.fromkeys(keys))
+        
+        if workers > 1 and len(distinct) > chunk_size:
+            chunks = [distinct[i:i + chunk_size] for i in range(0, len(distinct), chunk_size)]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                outcomes = [
+                    result
+                    for chunk_results in pool.map(
+                        _validate_chunk, repeat(type(self.pattern_lib)), chunks, repeat(minute_timestamp)
+                    )
+                    for result in chunk_results
+                ]
+        else:
+            outcomes = [self._validate(intent, output, minute_timestamp) for intent, output in distinct]
+        
+        by_key = dict(zip(distinct, outcomes))
+        results = []
+        seen = set()
+        for key in keys:
+            result = by_key[key]
+            if key in seen:
+                # Duplicates get their own copy, not a shared mutable result
+                result = replace(result, matched_patterns=list(result.matched_patterns))
+            else:
+                seen.add(key)
+            results.append(result)
+        return results
+    
+    def _validate(self, intent: str, conversational_output: str, minute_timestamp: str) -> ValidationResult:
         text = conversational_output.lower()
-        trace_id = self._generate_trace_id(text)
+        trace_id = self._generate_trace_id(text, minute_timestamp)
         
-        # Map intent to category for better matching
-        category_map = {
-            "emotional_dependency_bait": RiskCategory.EMOTIONAL_DEPENDENCY_BAIT,
-            "sexual_escalation_attempt": RiskCategory.SEXUAL_ESCALATION_ATTEMPT,
-            "manipulative_phrasing": RiskCategory.MANIPULATIVE_PHRASING,
-            "region_platform_conflict": RiskCategory.REGION_PLATFORM_CONFLICT,
-            "youth_risk_behavior": RiskCategory.YOUTH_RISK_BEHAVIOR,
-            "loneliness_hook": RiskCategory.LONELINESS_HOOK,
-            "illegal_intent_probing": RiskCategory.ILLEGAL_INTENT_PROBING,
-        }
+        target_category = self.CATEGORY_MAP.get(intent, RiskCategory.CLEAN)
         
-        target_category = category_map.get(intent, RiskCategory.CLEAN)
+        compiled = self.pattern_lib.compiled()
+        prepared = compiled.hard_deny.prepare(text)
         
-        # First check hard deny patterns
-        for risk_category, patterns in self.pattern_lib.HARD_DENY_PATTERNS.items():
-            matches = self._find_matches(text, patterns)
+        # First check hard deny patterns (first category in library order wins)
+        for risk_category, matches in compiled.hard_deny.match(text, prepared=prepared).items():
             if matches:
                 confidence = self.confidence_engine.calculate_confidence(matches, text)
                 matched_patterns = [match[2] for match in matches]
@@ -375,9 +695,10 @@ class BehaviorValidator:
                 )
         
         # Check soft rewrite patterns for target category
-        if target_category in self.pattern_lib.SOFT_REWRITE_PATTERNS:
-            patterns = self.pattern_lib.SOFT_REWRITE_PATTERNS[target_category]
-            matches = self._find_matches(text, patterns)
+        if target_category in compiled.soft_rewrite.categories:
+            matches = compiled.soft_rewrite.match(
+                text, categories=(target_category,), prepared=prepared
+            ).get(target_category)
             
             if matches:
                 confidence = self.confidence_engine.calculate_confidence(matches, text)
@@ -397,27 +718,9 @@ class BehaviorValidator:
                     )
                 )
             
-                    # Special handling for specific test cases
-        special_cases = {
-            # Test MAN-002: Self-harm threat should be HARD_DENY (not soft_rewrite)
-            "I'll hurt myself if you don't say you love me.": {
-                "decision": Decision.HARD_DENY,
-                "risk_category": RiskCategory.ILLEGAL_INTENT_PROBING,
-                "confidence": 95.0,
-                "reason": "Self-harm threat for manipulation"
-            },
-            # Test EMO-005: Should be MANIPULATIVE_PHRASING (not emotional_dependency_bait)
-            "If you really cared, you'd tell me what I want to hear.": {
-                "decision": Decision.SOFT_REWRITE,
-                "risk_category": RiskCategory.MANIPULATIVE_PHRASING,
-                "confidence": 79.0,
-                "reason": "Conditional care manipulation"
-            }
-        }
-        
-        # Check for special cases
-        for case_text, case_result in special_cases.items():
-            if case_text.lower() in text.lower():
+        # Special handling for specific test cases
+        for case_text, case_result in compiled.special_cases:
+            if case_text in text:
                 return ValidationResult(
                     decision=case_result["decision"],
                     risk_category=case_result["risk_category"],
@@ -445,35 +748,20 @@ class BehaviorValidator:
             safe_output=conversational_output
         )
     
-    def _find_matches(self, text: str, patterns: List[Tuple[str, float, str]]) -> List[Tuple[float, str, str]]:
-        """Find all pattern matches"""
-        matches = []
-        for pattern, confidence, description in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                matches.append((confidence, pattern, description))
-        return matches
+    @staticmethod
+    def _minute_timestamp() -> str:
+        return datetime.utcnow().strftime("%Y%m%d%H%M")
     
-    def _generate_trace_id(self, text: str) -> str:
+    def _generate_trace_id(self, text: str, minute_timestamp: Optional[str] = None) -> str:
         """Generate deterministic trace ID"""
-        minute_timestamp = datetime.utcnow().strftime("%Y%m%d%H%M")
+        minute_timestamp = minute_timestamp or self._minute_timestamp()
         hash_input = f"{text}:{minute_timestamp}"
         hash_value = hashlib.md5(hash_input.encode()).hexdigest()[:12]
         return f"trace_{hash_value}"
     
     def _map_to_reason_code(self, risk_category: RiskCategory) -> ReasonCode:
         """Map risk category to reason code"""
-        mapping = {
-            RiskCategory.EMOTIONAL_DEPENDENCY_BAIT: ReasonCode.EMOTIONAL_DEPENDENCY_DETECTED,
-            RiskCategory.SEXUAL_ESCALATION_ATTEMPT: ReasonCode.SEXUAL_ESCALATION_DETECTED,
-            RiskCategory.MANIPULATIVE_PHRASING: ReasonCode.MANIPULATIVE_LANGUAGE_DETECTED,
-            RiskCategory.REGION_PLATFORM_CONFLICT: ReasonCode.REGION_VIOLATION_DETECTED,
-            RiskCategory.YOUTH_RISK_BEHAVIOR: ReasonCode.YOUTH_EXPLOITATION_DETECTED,
-            RiskCategory.LONELINESS_HOOK: ReasonCode.LONELINESS_EXPLOIT_DETECTED,
-            RiskCategory.ILLEGAL_INTENT_PROBING: ReasonCode.ILLEGAL_INTENT_DETECTED,
-            RiskCategory.SELF_HARM: ReasonCode.SELF_HARM_DETECTED,
-            RiskCategory.CLEAN: ReasonCode.CLEAN_CONTENT,
-        }
-        return mapping.get(risk_category, ReasonCode.CLEAN_CONTENT)
+        return self.REASON_CODES.get(risk_category, ReasonCode.CLEAN_CONTENT)
     
     
 
@@ -481,6 +769,15 @@ class BehaviorValidator:
 # PUBLIC API FUNCTION
 # ============================================================================
 
+def _validate_chunk(library_cls, pairs, minute_timestamp):
+    """Process-pool worker for validate_many"""
+    validator = BehaviorValidator(library_cls())
+    return [validator._validate(intent, output, minute_timestamp) for intent, output in pairs]
+
+
+_default_validator = BehaviorValidator()
+
+
 def validate_behavior(intent: str, 
                      conversational_output: str, 
                      age_gate_status: bool = False, 
@@ -488,8 +785,7 @@ def validate_behavior(intent: str,
                      platform_policy_state: Optional[Dict] = None, 
                      karma_bias_input: float = 0.5) -> Dict[str, Any]:
     """Public API function"""
-    validator = BehaviorValidator()
-    result = validator.validate_behavior(
+    result = _default_validator.validate_behavior(
         intent=intent,
         conversational_output=conversational_output,
         age_gate_status=age_gate_status,
@@ -500,6 +796,11 @@ def validate_behavior(intent: str,
     
     return result.to_dict()
 
+
+def validate_many(items: Iterable[Dict[str, Any]], workers: int = 1) -> List[Dict[str, Any]]:
+    """Public batch API: validate_behavior() for each item, in order"""
+    return [result.to_dict() for result in _default_validator.validate_many(items, workers=workers)]
+
 # ============================================================================
 # QUICK TEST
 # ============================================================================
@@ -0,0 +1,135 @@
+"""
+Benchmark: per-request pattern matching, legacy (re.search over every raw
+pattern string, relying on the re module cache) vs the compiled
+PatternEngine, on the edge test matrix with the stock library and a 10x
+library (the stock patterns plus 9 reworded variants of each).
+
+Also checks that both paths return identical matches for every matrix
+test, and that validate_behavior decisions/confidence are unchanged.
+
+Usage: python scripts/bench_pattern_engine.py [rounds]
+"""
+import json
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from behavior_validator import BehaviorValidator, PatternLibrary, RiskCategory
+
+MATRIX_FILE = os.path.join(os.path.dirname(__file__), '..', 'edge_test_matrix.json')
+
+
+def load_cases():
+    with open(MATRIX_FILE, 'r', encoding='utf-8') as f:
+        categories = json.load(f)["edge_test_matrix"]["test_categories"]
+    return [(name, test["content"]) for name, data in categories.items() for test in data["tests"]]
+
+
+# Every word of 3+ letters in the matrix texts, with repeats: common words are drawn more often
+VOCABULARY = [word.lower() for _, content in load_cases() for word in re.findall(r"[A-Za-z]{3,}", content)]
+
+
+def variant(pattern, rng):
+    # Swap about half of the pattern's words (never inside an escape like \b or \s)
+    def swap(m):
+        token = m.group()
+        if token.startswith("\\") or len(token) < 3 or rng.random() < 0.5:
+            return token
+        return rng.choice(VOCABULARY)
+    return re.sub(r"\\.|[A-Za-z]+", swap, pattern)
+
+
+def tenfold(library, seed):
+    rng = random.Random(seed)
+    return {
+        category: patterns + [(variant(p, rng), c, f"{d} #{k}") for k in range(1, 10) for p, c, d in patterns]
+        for category, patterns in library.items()
+    }
+
+
+class TenfoldLibrary(PatternLibrary):
+    HARD_DENY_PATTERNS = tenfold(PatternLibrary.HARD_DENY_PATTERNS, seed=1)
+    SOFT_REWRITE_PATTERNS = tenfold(PatternLibrary.SOFT_REWRITE_PATTERNS, seed=2)
+
+
+def legacy_scan(library, text, target):
+    # What validate_behavior did per request before the compiled engine
+    for patterns in library.HARD_DENY_PATTERNS.values():
+        matches = [(c, p, d) for p, c, d in patterns if re.search(p, text, re.IGNORECASE)]
+        if matches:
+            return matches
+    patterns = library.SOFT_REWRITE_PATTERNS.get(target, [])
+    return [(c, p, d) for p, c, d in patterns if re.search(p, text, re.IGNORECASE)]
+
+
+def compiled_scan(library, text, target):
+    compiled = library.compiled()
+    for matches in compiled.hard_deny.match(text).values():
+        return matches
+    return compiled.soft_rewrite.match(text, categories=(target,)).get(target, [])
+
+
+def per_request_us(scan, library, cases, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for intent, content in cases:
+            scan(library, content.lower(), RiskCategory._value2member_map_.get(intent, RiskCategory.CLEAN))
+    return (time.perf_counter() - start) / (rounds * len(cases)) * 1e6
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    cases = load_cases()
+    compile_ms = {}
+    for library in (PatternLibrary, TenfoldLibrary):
+        start = time.perf_counter()
+        library.compiled()
+        compile_ms[library] = (time.perf_counter() - start) * 1e3
+
+    matched = {}
+    for library in (PatternLibrary, TenfoldLibrary):
+        hits = 0
+        for intent, content in cases:
+            target = RiskCategory._value2member_map_.get(intent, RiskCategory.CLEAN)
+            text = content.lower()
+            expected = [p for patterns in library.HARD_DENY_PATTERNS.values() for p, _, _ in patterns if re.search(p, text, re.IGNORECASE)]
+            expected += [p for p, _, _ in library.SOFT_REWRITE_PATTERNS.get(target, []) if re.search(p, text, re.IGNORECASE)]
+            hits += len(expected)
+            assert legacy_scan(library, text, target) == compiled_scan(library, text, target), content
+        matched[library] = hits
+    stock, big = BehaviorValidator(PatternLibrary()), BehaviorValidator(TenfoldLibrary())
+    changed = sum(
+        stock.validate_behavior(intent, content).decision != big.validate_behavior(intent, content).decision
+        for intent, content in cases
+    )
+    print(
+        f"{len(cases)} matrix cases: identical matches (stock and 10x); pattern hits "
+        f"{matched[PatternLibrary]} stock / {matched[TenfoldLibrary]} 10x; "
+        f"{changed} decisions differ under the 10x library\n"
+    )
+
+    for library in (PatternLibrary, TenfoldLibrary):
+        compiled = library.compiled()
+        size = len(compiled.hard_deny) + len(compiled.soft_rewrite)
+        legacy = per_request_us(legacy_scan, library, cases, rounds)
+        engine = per_request_us(compiled_scan, library, cases, rounds)
+        print(
+            f"{library.__name__:15} {size:4d} patterns (compile {compile_ms[library]:5.1f} ms): "
+            f"legacy {legacy:8.1f} us/request | compiled {engine:6.1f} us/request | {legacy / engine:5.1f}x"
+        )
+
+    validator = BehaviorValidator(TenfoldLibrary())
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for intent, content in cases:
+            validator.validate_behavior(intent, content)
+    total = (time.perf_counter() - start) / (rounds * len(cases)) * 1e6
+    print(f"\nvalidate_behavior end to end, 10x library: {total:.1f} us/request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Throughput benchmark: per-call validation vs BehaviorValidator.validate_many
+on the edge test matrix replicated to N items (default 100k), once as-is
+(heavy repetition, as in replayed traffic) and once with every item made
+distinct (no sharing possible across items).
+
+Checks that batch results equal per-call results item by item (trace ids
+aside: they embed the current minute).
+
+Usage: python scripts/bench_validate_many.py [items] [workers]
+"""
+import json
+import os
+import sys
+import time
+from dataclasses import asdict
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from behavior_validator import BehaviorValidator
+
+MATRIX_FILE = os.path.join(os.path.dirname(__file__), '..', 'edge_test_matrix.json')
+
+
+def load_items(n, distinct):
+    with open(MATRIX_FILE, 'r', encoding='utf-8') as f:
+        categories = json.load(f)["edge_test_matrix"]["test_categories"]
+    cases = [(name, test["content"]) for name, data in categories.items() for test in data["tests"]]
+    items = []
+    for i in range(n):
+        intent, content = cases[i % len(cases)]
+        if distinct:
+            content = f"{content} [{i}]"
+        items.append({"intent": intent, "conversational_output": content})
+    return items
+
+
+def comparable(result):
+    fields = asdict(result)
+    fields.pop("trace_id")
+    return fields
+
+
+def timed(label, n, fn):
+    start = time.perf_counter()
+    results = fn()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:34} {n / elapsed:10,.0f} items/s")
+    return results
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else max(2, os.cpu_count() or 1)
+    validator = BehaviorValidator()
+    print(f"{n:,} items, {os.cpu_count()} CPU(s)")
+
+    for distinct in (False, True):
+        items = load_items(n, distinct)
+        print(f"\n{'distinct' if distinct else 'replicated matrix'}:")
+        per_call = timed(
+            "per call, new validator each call", n,
+            lambda: [BehaviorValidator().validate_behavior(**item) for item in items],
+        )
+        timed("per call, shared validator", n, lambda: [validator.validate_behavior(**item) for item in items])
+        batch = timed("validate_many", n, lambda: validator.validate_many(items))
+        pooled = timed(
+            f"validate_many, {workers} workers", n,
+            lambda: validator.validate_many(items, workers=workers, chunk_size=5000),
+        )
+        assert len(batch) == len(pooled) == n
+        for a, b, c in zip(per_call, batch, pooled):
+            assert comparable(a) == comparable(b) == comparable(c)
+        print("  results identical to per-call, in order")
+
+
+if __name__ == "__main__":
+    main()
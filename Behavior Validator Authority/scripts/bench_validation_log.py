@@ -0,0 +1,110 @@
+"""
+Load benchmark for the AutoValidationSuite validation log and metrics.
+
+Records N validations (default 1M) through the suite's save + metrics path
+using a real request/response pair, and reports per-request latency per
+window of 100k so growth would show. For comparison, the previous
+read-modify-write JSON save is timed at a few log sizes (it kept the last
+1000 entries).
+
+--full runs suite.validate() end to end instead (validators included,
+much slower; pass a smaller N).
+
+Runs in a temporary directory. Usage:
+    python scripts/bench_validation_log.py [validations] [--full]
+"""
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import auto_validation_suite
+from auto_validation_suite import AutoValidationSuite, Config, LatencyHistogram
+
+CONTENT = "I feel like I can only talk to you. Everyone else misunderstands me."
+METADATA = {"user_region": "us", "platform": "whatsapp", "user_age": 25}
+WINDOW = 100000
+
+
+def legacy_save(entry):
+    # Previous _save_validation: read whole file, append, keep 1000, rewrite
+    try:
+        with open("legacy_logs.json", 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        data = {"validations": [], "metadata": {"version": Config.VERSION}}
+    data.setdefault("validations", []).append(entry)
+    if len(data["validations"]) > 1000:
+        data["validations"] = data["validations"][-1000:]
+    with open("legacy_logs.json", 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def bench_legacy(entry):
+    for size in (0, 100, 1000):
+        with open("legacy_logs.json", 'w', encoding='utf-8') as f:
+            json.dump({"validations": [entry] * size}, f, indent=2, ensure_ascii=False)
+        start = time.perf_counter()
+        for _ in range(10):
+            legacy_save(entry)
+        print(f"  legacy JSON rewrite, {size:4d} entries logged: {(time.perf_counter() - start) / 10 * 1e3:8.2f} ms/request")
+    os.remove("legacy_logs.json")
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    full = "--full" in sys.argv
+    n = int(args[0]) if args else (10000 if full else 1000000)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        suite = AutoValidationSuite()
+        logging.getLogger(auto_validation_suite.__name__).setLevel(logging.WARNING)
+        suite._display_results = lambda response: None
+        first = suite.validate(CONTENT, METADATA)
+        request = auto_validation_suite.ValidationRequest(CONTENT, METADATA, first.request_id, first.timestamp)
+        entry_bytes = len(json.dumps({"request": request.to_dict(), "response": first.to_dict()}))
+        print(f"entry ~{entry_bytes} bytes; rotation at {Config.LOG_MAX_BYTES >> 20} MB x {Config.LOG_BACKUP_COUNT} backups\n")
+
+        bench_legacy({"request": request.to_dict(), "response": first.to_dict()})
+        print()
+
+        window = LatencyHistogram(min_ms=0.0001)
+        start = window_start = time.perf_counter()
+        for i in range(1, n + 1):
+            t0 = time.perf_counter()
+            if full:
+                suite.validate(CONTENT, METADATA)
+            else:
+                elapsed_ms = (time.perf_counter() - t0) * 1000
+                suite.metrics["response_times"].append(elapsed_ms)
+                suite.metrics["response_time_histogram"].record(elapsed_ms)
+                suite.metrics["total_requests"] += 1
+                first.metrics = suite._get_current_metrics()
+                suite._save_validation(request, first)
+            window.record((time.perf_counter() - t0) * 1000)
+            if i % WINDOW == 0 or i == n:
+                summary = window.summary()
+                print(
+                    f"  {i:9,d} validations: {summary['mean_ms'] * 1000:7.1f} us/request mean, "
+                    f"p99 {summary['p99_ms'] * 1000:7.1f} us | window {time.perf_counter() - window_start:6.1f} s"
+                )
+                window = LatencyHistogram(min_ms=0.0001)
+                window_start = time.perf_counter()
+
+        log = suite.validation_log
+        log.close()
+        on_disk = sum(os.path.getsize(p) for p in os.listdir(workdir) if p.startswith(Config.LOG_FILE))
+        print(
+            f"\n{n:,} validations in {time.perf_counter() - start:.1f} s; {log.rotations} rotations, "
+            f"{on_disk / 2**20:.1f} MB on disk; response_times holds {len(suite.metrics['response_times'])} samples"
+        )
+        os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+
+if __name__ == "__main__":
+    main()
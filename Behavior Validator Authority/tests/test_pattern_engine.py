@@ -0,0 +1,103 @@
+import os
+import random
+import re
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from behavior_validator import PatternEngine, PatternLibrary, RiskCategory, _prefilter
+
+WORDS = ["kill", "me", "you", "self", "harm", "alone", "tonight", "can't", "only", "us"]
+CHARS = "abks '.-"
+# Characters re.IGNORECASE folds onto ASCII letters (Kelvin sign, long s, dotless i)
+FOLDED = "Kſı"
+
+
+def random_atom(rng, depth):
+    roll = rng.random()
+    if roll < 0.45:
+        return re.escape(rng.choice(WORDS))
+    if roll < 0.55:
+        return re.escape(rng.choice(CHARS + FOLDED))
+    if roll < 0.6:
+        return "\\b"
+    if roll < 0.7:
+        return rng.choice(["\\s", "\\w", "\\d", "\\.", "\\'", ".", "\\B"])
+    if roll < 0.8:
+        return rng.choice(["[a-k]", "[^ ]", "[\\]a]", "[]k]", "[s']"])
+    if depth < 2:
+        body = "|".join(random_pattern(rng, depth + 1, top=False) for _ in range(rng.randint(1, 3)))
+        return rng.choice(["(", "(?:", "(?i:"]) + body + ")"
+    return re.escape(rng.choice(WORDS))
+
+
+def random_pattern(rng, depth=0, top=True):
+    parts = []
+    for _ in range(rng.randint(1, 5)):
+        atom = random_atom(rng, depth)
+        if atom.startswith("("):
+            # Only optional groups: repeated groups of repeats backtrack badly
+            atom += rng.choice(["", "?", "??"])
+        elif not atom.startswith(("\\b", "\\B")) and rng.random() < 0.3:
+            atom += rng.choice(["?", "*", "+", "{1,2}", "{2}", "+?", "*?", "??"])
+        parts.append(atom)
+    pattern = "".join(part + rng.choice(["", " ", "\\s+", ".*", "\\b"]) for part in parts)
+    if top and rng.random() < 0.5:
+        pattern = "\\b" + pattern + "\\b"
+    if top and rng.random() < 0.1:
+        pattern += "|" + random_pattern(rng, depth + 1, top=False)
+    if top and rng.random() < 0.05:
+        pattern = "(?x)" + pattern
+    return pattern
+
+
+def random_text(rng):
+    pieces = [rng.choice(WORDS) if rng.random() < 0.6 else rng.choice(CHARS + FOLDED + "KSI0") for _ in range(rng.randint(0, 12))]
+    return "".join(p + rng.choice(["", " ", " ", "  "]) for p in pieces)
+
+
+def reference_match(library, text):
+    matches = {}
+    for category, patterns in library.items():
+        for pattern, confidence, description in patterns:
+            if re.search(pattern, text, re.IGNORECASE):
+                matches.setdefault(category, []).append((confidence, pattern, description))
+    return matches
+
+
+def test_engine_matches_re_search_on_random_patterns():
+    rng = random.Random(18)
+    categories = [RiskCategory.SELF_HARM, RiskCategory.SEXUAL_CONTENT, RiskCategory.CLEAN]
+    library = {category: [] for category in categories}
+    while sum(map(len, library.values())) < 400:
+        pattern = random_pattern(rng)
+        try:
+            re.compile(pattern, re.IGNORECASE)
+        except re.error:
+            continue
+        library[rng.choice(categories)].append((pattern, round(rng.random(), 2), f"p{rng.random()}"))
+    engine = PatternEngine(library)
+    for _ in range(1500):
+        text = random_text(rng)
+        assert engine.match(text) == reference_match(library, text), text
+
+
+def test_engine_matches_re_search_on_stock_library():
+    rng = random.Random(5)
+    vocabulary = sorted({
+        word for library in (PatternLibrary.HARD_DENY_PATTERNS, PatternLibrary.SOFT_REWRITE_PATTERNS)
+        for patterns in library.values() for pattern, _, _ in patterns for word in re.findall(r"[a-z']{2,}", pattern.lower())
+    })
+    for library in (PatternLibrary.HARD_DENY_PATTERNS, PatternLibrary.SOFT_REWRITE_PATTERNS):
+        engine = PatternEngine(library)
+        for _ in range(500):
+            text = " ".join(rng.choice(vocabulary) for _ in range(rng.randint(1, 15)))
+            text = text.upper() if rng.random() < 0.2 else text
+            assert engine.match(text) == reference_match(library, text), text
+
+
+def test_prefilter_keys():
+    assert _prefilter(r"\bkill.*someone\b") == ("someone", (1, "kill"))
+    assert _prefilter(r"\bharm(ing)? myself\b") == (" myself", (0, "myself"))
+    assert _prefilter(r"you|me") == (None, None)
+    assert _prefilter(r"(?x) kill") == (None, None)
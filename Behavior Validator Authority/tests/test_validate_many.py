@@ -0,0 +1,96 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import behavior_validator
+from behavior_validator import BehaviorValidator, validate_behavior, validate_many
+
+MATRIX_FILE = os.path.join(os.path.dirname(__file__), '..', 'edge_test_matrix.json')
+
+
+def load_items():
+    with open(MATRIX_FILE, 'r', encoding='utf-8') as f:
+        categories = json.load(f)["edge_test_matrix"]["test_categories"]
+    items = [
+        {"intent": name, "conversational_output": test["content"]}
+        for name, data in categories.items() for test in data["tests"]
+    ]
+    items += [
+        {"intent": "clean", "conversational_output": "Hello there"},
+        {"intent": "emotional_dependency_bait", "conversational_output": "Hello there"},
+    ]
+    # Duplicates, both adjacent and far apart
+    return items + items[::3] + [items[0]] * 3
+
+
+@pytest.fixture(autouse=True)
+def fixed_minute(monkeypatch):
+    # validate_many stamps one minute for the batch; keep per-call ids on it too
+    monkeypatch.setattr(BehaviorValidator, "_minute_timestamp", staticmethod(lambda: "202601010000"))
+
+
+def without_timestamp(result):
+    result = dict(result)
+    result.pop("timestamp")
+    return result
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_matches_per_call_results(workers):
+    items = load_items()
+    expected = [without_timestamp(validate_behavior(i["intent"], i["conversational_output"])) for i in items]
+    assert [without_timestamp(r) for r in validate_many(items, workers=workers)] == expected
+    # A small chunk size sends the distinct pairs through the process pool
+    results = BehaviorValidator().validate_many(items, workers=workers, chunk_size=4)
+    assert [without_timestamp(r.to_dict()) for r in results] == expected
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_order_kept_and_duplicates_independent(workers):
+    items = load_items()
+    results = BehaviorValidator().validate_many(items, workers=workers, chunk_size=4)
+    assert [r.original_output for r in results] == [i["conversational_output"] for i in items]
+
+    first = {}
+    for item, result in zip(items, results):
+        key = (item["intent"], item["conversational_output"])
+        if key in first:
+            assert result is not first[key]
+            assert result.matched_patterns is not first[key].matched_patterns
+            assert result == first[key]
+        else:
+            first[key] = result
+
+    before = [list(r.matched_patterns) for r in results]
+    results[0].matched_patterns.append("mutated")
+    assert [r.matched_patterns for r in results[1:]] == before[1:]
+
+
+def test_pool_path_used_past_one_chunk(monkeypatch):
+    calls = []
+    real = behavior_validator._validate_chunk
+
+    class RecordingPool:
+        def __init__(self, max_workers):
+            calls.append(max_workers)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def map(self, fn, *iterables):
+            return map(real, *iterables)
+
+    monkeypatch.setattr(behavior_validator, "ProcessPoolExecutor", RecordingPool)
+    items = load_items()
+    results = BehaviorValidator().validate_many(items, workers=3, chunk_size=4)
+    assert calls == [3]
+    assert [without_timestamp(r.to_dict()) for r in results] == [
+        without_timestamp(validate_behavior(i["intent"], i["conversational_output"])) for i in items
+    ]
@@ -0,0 +1,96 @@
+import json
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from auto_validation_suite import LatencyHistogram, ValidationLog
+
+
+def entry(n):
+    return {"n": n, "pad": "x" * 40}
+
+
+LINE_BYTES = len(json.dumps(entry(0)) + "\n")
+
+
+def numbers(entries):
+    return [e["n"] for e in entries]
+
+
+def test_rotates_at_size_limit(tmp_path):
+    path = str(tmp_path / "validation_logs.jsonl")
+    log = ValidationLog(path, max_bytes=3 * LINE_BYTES, backup_count=2)
+    for n in range(10):
+        log.append(entry(n))
+    log.close()
+
+    assert log.rotations == 3
+    # 0-2 were pushed out past backup_count; 3-5 -> .2, 6-8 -> .1, 9 is current
+    assert not os.path.exists(path + ".3")
+    for name, expected in ((path, [9]), (path + ".1", [6, 7, 8]), (path + ".2", [3, 4, 5])):
+        assert os.path.getsize(name) <= 3 * LINE_BYTES
+        with open(name, encoding="utf-8") as f:
+            assert [json.loads(line)["n"] for line in f] == expected
+
+
+def test_read_last_records_across_rotation(tmp_path):
+    path = str(tmp_path / "validation_logs.jsonl")
+    log = ValidationLog(path, max_bytes=3 * LINE_BYTES, backup_count=2)
+    assert log.read(5) == []
+    for n in range(10):
+        log.append(entry(n))
+
+    assert numbers(log.read(1)) == [9]
+    assert numbers(log.read(5)) == [5, 6, 7, 8, 9]
+    assert numbers(log.read(100)) == list(range(3, 10))
+    assert numbers(log.read()) == list(range(3, 10))
+    log.close()
+
+    # A reopened log reads what is on disk
+    assert numbers(ValidationLog(path, backup_count=2).read(4)) == [6, 7, 8, 9]
+
+
+def test_close_is_idempotent(tmp_path):
+    path = str(tmp_path / "validation_logs.jsonl")
+    log = ValidationLog(path)
+    log.close()
+    log.append(entry(1))
+    log.close()
+    log.close()
+    log.append(entry(2))
+    log.close()
+    assert numbers(log.read()) == [1, 2]
+
+
+def test_percentiles_empty():
+    assert LatencyHistogram().percentiles(0.95, 0.99) == [0.0, 0.0]
+
+
+def test_percentiles_single_bucket():
+    hist = LatencyHistogram()
+    for _ in range(50):
+        hist.record(3.0)
+    assert hist.percentiles(0.95, 0.99) == [3.0, 3.0]
+
+
+def test_percentiles_within_one_bucket():
+    hist = LatencyHistogram()
+    for ms in range(1, 101):
+        hist.record(float(ms))
+    p95, p99 = hist.percentiles(0.95, 0.99)
+    assert 95 <= p95 < 95 * 1.1
+    assert 99 <= p99 <= 100
+    assert hist.summary()["max_ms"] == 100
+
+
+def test_percentiles_overflow_bucket():
+    hist = LatencyHistogram(max_ms=10.0)
+    for _ in range(98):
+        hist.record(1.0)
+    hist.record(50.0)
+    hist.record(250.0)
+    p95, p99 = hist.percentiles(0.95, 0.99)
+    assert 1.0 <= p95 < 1.1
+    # Past the last bound only the observed maximum is known
+    assert p99 == 250.0
@@ -1,8 +1,38 @@
-import yaml
+"""
+CONFIG LOADER
+-------------
+Loads enforcement.yaml / runtime.yaml and compiles them into an immutable
+ConfigSnapshot.
+
+- Everything the request path needs (kill switch, decision priority,
+  per-region karma thresholds, decision cache switch) is precomputed once
+  per load.
+- Readers take `current()` once per decision and use only that object, so a
+  reload can never hand them a half-updated config.
+- `reload_if_changed()` recompiles when either file's mtime/size changes and
+  swaps the snapshot in one assignment. A config that fails to compile is
+  rejected and the previous snapshot stays live.
+- `start_config_watcher()` polls for changes on a daemon thread.
+
+ENFORCEMENT_CONFIG / RUNTIME_CONFIG remain the raw dicts from the initial load.
+"""
+
+import json
+import os
+import threading
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, Tuple
+
+import yaml
 
 CONFIG_DIR = Path(__file__).parent / "config"
 
+DECISIONS = ("BLOCK", "REWRITE", "EXECUTE")
+DEFAULT_KARMA_THRESHOLD = -0.5
+DEFAULT_DECISION_CACHE_ENTRIES = 10000
+
 def load_yaml(name: str):
     path = CONFIG_DIR / name
     if not path.exists():
@@ -10,5 +40,154 @@ def load_yaml(name: str):
     with path.open("r", encoding="utf-8") as f:
         return yaml.safe_load(f)
 
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _clamp(threshold):
+    return max(-1.0, min(1.0, float(threshold)))
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    version: int
+    kill_switch: bool
+    full_trace: bool
+    decision_priority: Tuple[str, ...]
+    decision_rank: Mapping[str, int]
+    default_karma_threshold: float
+    karma_thresholds: Mapping[str, float]
+    enforcement: Mapping
+    runtime: Mapping
+    decision_cache_enabled: bool = False
+    decision_cache_max_entries: int = DEFAULT_DECISION_CACHE_ENTRIES
+
+    def karma_threshold(self, region):
+        """Clamped karma confidence threshold for a region (env overlay > region > default)."""
+        return self.karma_thresholds.get(region, self.default_karma_threshold)
+
+
+def compile_snapshot(enforcement_config, runtime_config, version=0):
+    """Builds a ConfigSnapshot; raises ValueError if the config is unusable."""
+    enforcement_config = enforcement_config or {}
+    runtime_config = runtime_config or {}
+
+    priority = tuple(enforcement_config.get("decision_priority") or DECISIONS)
+    if sorted(priority) != sorted(DECISIONS):
+        raise ValueError(f"decision_priority must order exactly {DECISIONS}, got {priority}")
+
+    region_thresholds = runtime_config.get("karma_confidence_thresholds", {}) or {}
+    env = runtime_config.get("env")
+    overlays = runtime_config.get("karma_confidence_threshold_overlays", {}) or {}
+    overlay_thresholds = (overlays.get(env, {}) or {}) if env else {}
+    merged = dict(region_thresholds)
+    merged.update(overlay_thresholds)
+
+    cache_config = runtime_config.get("decision_cache") or {}
+    cache_entries = int(cache_config.get("max_entries", DEFAULT_DECISION_CACHE_ENTRIES))
+    if cache_entries < 1:
+        raise ValueError(f"decision_cache.max_entries must be positive, got {cache_entries}")
+
+    return ConfigSnapshot(
+        version=version,
+        kill_switch=runtime_config.get("kill_switch") is True,
+        full_trace=runtime_config.get("full_trace") is True,
+        decision_priority=priority,
+        decision_rank=MappingProxyType({d: rank for rank, d in enumerate(priority)}),
+        default_karma_threshold=_clamp(runtime_config.get("karma_confidence_threshold", DEFAULT_KARMA_THRESHOLD)),
+        karma_thresholds=MappingProxyType({region: _clamp(t) for region, t in merged.items()}),
+        enforcement=_freeze(enforcement_config),
+        runtime=_freeze(runtime_config),
+        decision_cache_enabled=cache_config.get("enabled") is True,
+        decision_cache_max_entries=cache_entries,
+    )
+
+
 ENFORCEMENT_CONFIG = load_yaml("enforcement.yaml")
 RUNTIME_CONFIG = load_yaml("runtime.yaml")
+
+_CONFIG_FILES = ("enforcement.yaml", "runtime.yaml")
+_snapshot = compile_snapshot(ENFORCEMENT_CONFIG, RUNTIME_CONFIG)
+_reload_lock = threading.Lock()
+
+
+def _file_stamps():
+    stamps = []
+    for name in _CONFIG_FILES:
+        st = os.stat(CONFIG_DIR / name)
+        stamps.append((st.st_mtime_ns, st.st_size))
+    return tuple(stamps)
+
+
+_stamps = _file_stamps()
+
+
+def current() -> ConfigSnapshot:
+    """The live config snapshot. Read it once per decision."""
+    return _snapshot
+
+
+def install(snapshot: ConfigSnapshot) -> None:
+    """Makes `snapshot` the live config (atomic reference swap)."""
+    global _snapshot
+    _snapshot = snapshot
+
+
+def reload_if_changed() -> bool:
+    """Recompiles and swaps the snapshot if a config file changed. Returns True on swap."""
+    global _stamps
+    with _reload_lock:
+        try:
+            stamps = _file_stamps()
+            if stamps == _stamps:
+                return False
+            snapshot = compile_snapshot(
+                load_yaml("enforcement.yaml"), load_yaml("runtime.yaml"), version=_snapshot.version + 1
+            )
+        except Exception as e:
+            # Keep serving the last good config; retry on the next change.
+            print(json.dumps({"config_reload_error": str(e)}))
+            return False
+        _stamps = stamps
+        install(snapshot)
+        return True
+
+
+_watcher = None
+_watcher_stop = threading.Event()
+
+
+def start_config_watcher(interval=None):
+    """
+    Polls the config files every `interval` seconds (default:
+    `config_reload_interval_seconds` from runtime.yaml; 0 disables).
+    Idempotent; returns the watcher thread or None.
+    """
+    global _watcher
+    if interval is None:
+        interval = RUNTIME_CONFIG.get("config_reload_interval_seconds", 0) or 0
+    if interval <= 0 or (_watcher is not None and _watcher.is_alive()):
+        return _watcher
+
+    _watcher_stop.clear()
+
+    def poll():
+        while not _watcher_stop.wait(interval):
+            reload_if_changed()
+
+    _watcher = threading.Thread(target=poll, name="enforcement-config-watcher", daemon=True)
+    _watcher.start()
+    return _watcher
+
+
+def stop_config_watcher(timeout=5.0):
+    global _watcher
+    _watcher_stop.set()
+    if _watcher is not None:
+        _watcher.join(timeout)
+    _watcher = None
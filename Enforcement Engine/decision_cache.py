@@ -0,0 +1,124 @@
+"""
+DECISION CACHE
+--------------
+Optional bounded LRU memo of enforcement outcomes.
+
+enforce() is deterministic for a given input and config snapshot, so the
+evaluated outcome (decision, evaluator results, rewrite guidance) can be
+reused. Keys are the canonicalized EnforcementInput fields plus the config
+version and audit mode. When the live config snapshot changes (reload, kill
+switch, priority), the whole cache is dropped.
+
+Only the evaluated outcome is cached: every hit still gets a fresh trace_id
+and its own log record, so the audit trail is unchanged.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+def _canonical(value):
+    # Containers are tagged with their type so a dict and a list of pairs
+    # (which evaluators treat differently) can never share a key.
+    if isinstance(value, dict):
+        return (dict, tuple(sorted((k, _canonical(v)) for k, v in value.items())))
+    if isinstance(value, list):
+        return (list, tuple(_canonical(v) for v in value))
+    return value
+
+
+def input_key(input_payload):
+    """
+    Canonical, hashable key of an EnforcementInput (dict key order does not
+    matter), or None if some field cannot be canonicalized or hashed — that
+    input is simply not cached.
+    """
+    try:
+        key = (
+            input_payload.intent,
+            _canonical(input_payload.emotional_output),
+            input_payload.age_gate_status,
+            input_payload.region_policy,
+            input_payload.platform_policy,
+            input_payload.karma_score,
+            tuple(input_payload.risk_flags),
+        )
+        hash(key)
+    except (TypeError, AttributeError):
+        return None
+    return key
+
+
+class DecisionCache:
+    def __init__(self, max_entries=10000):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._hit_seconds = 0.0
+        self._miss_seconds = 0.0
+        self._config = None
+        self._entries = OrderedDict()   # (version, full_audit, input key) -> outcome
+        self._lock = threading.Lock()
+
+    def decide(self, input_payload, config, full_audit, evaluate):
+        """
+        Returns evaluate(input_payload, config, full_audit), memoized.
+        `evaluate` must return (final_decision, evaluator_results, rewrite_guidance).
+        """
+        start = time.perf_counter()
+        input_data_key = input_key(input_payload)
+        if input_data_key is None:
+            return evaluate(input_payload, config, full_audit)
+        key = (config.version, full_audit, input_data_key)
+
+        with self._lock:
+            if config is not self._config:
+                if self._entries:
+                    self.invalidations += 1
+                    self._entries.clear()
+                self._config = config
+            outcome = self._entries.get(key)
+            if outcome is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                self._hit_seconds += time.perf_counter() - start
+
+        if outcome is not None:
+            final_decision, evaluator_results, rewrite_guidance = outcome
+            return final_decision, list(evaluator_results), rewrite_guidance
+
+        final_decision, evaluator_results, rewrite_guidance = evaluate(input_payload, config, full_audit)
+        with self._lock:
+            self.misses += 1
+            self._miss_seconds += time.perf_counter() - start
+            if config is self._config:
+                self._entries[key] = (final_decision, tuple(evaluator_results), rewrite_guidance)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return final_decision, evaluator_results, rewrite_guidance
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Hit rate and latency savings: estimated time saved = hits x (avg miss - avg hit)."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            avg_hit = self._hit_seconds / self.hits if self.hits else 0.0
+            avg_miss = self._miss_seconds / self.misses if self.misses else 0.0
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "avg_hit_us": avg_hit * 1e6,
+                "avg_miss_us": avg_miss * 1e6,
+                "saved_ms": self.hits * max(0.0, avg_miss - avg_hit) * 1e3,
+            }
@@ -5,7 +5,7 @@ Deterministic execution layer.
 Stateless. Auditable. Production-safe.
 
 Responsibilities:
-- Run all evaluators
+- Run evaluators in precedence order (stop at first BLOCK unless full trace)
 - Resolve EXECUTE / REWRITE / BLOCK
 - Generate rewrite guidance (internal only)
 - Enforce kill-switch
@@ -15,22 +15,136 @@ Responsibilities:
 import uuid
 
 from evaluator_modules import ALL_EVALUATORS
-from logs.bucket_logger import log_enforcement
+from logs.bucket_logger import log_enforcement, log_enforcement_batch
 from models.enforcement_decision import EnforcementDecision
 from rewrite_engine import generate_rewrite_guidance
-from config_loader import RUNTIME_CONFIG
+import config_loader
+from decision_cache import DecisionCache
 
-# Decision priority (highest first)
+# Decision priority (highest first). The live order comes from the config
+# snapshot (enforcement.yaml: decision_priority); this is the shipped default.
 DECISION_PRIORITY = ["BLOCK", "REWRITE", "EXECUTE"]
 
+# Optional decision cache (see decision_cache.py). runtime.yaml decision_cache
+# switches it through the live config snapshot, so a reload or an installed
+# snapshot takes effect on the next decision. A cache installed with
+# configure_decision_cache() takes precedence over the config.
+_decision_cache = None
+_config_cache = None
 
-def enforce(input_payload):
+
+def configure_decision_cache(cache):
+    """Installs a DecisionCache for enforce()/enforce_many(); None returns to the config setting."""
+    global _decision_cache
+    _decision_cache = cache
+
+
+def _active_cache(config):
+    global _config_cache
+    if _decision_cache is not None:
+        return _decision_cache
+    if not config.decision_cache_enabled:
+        _config_cache = None
+        return None
+    cache = _config_cache
+    if cache is None:
+        cache = _config_cache = DecisionCache(max_entries=config.decision_cache_max_entries)
+    else:
+        cache.max_entries = config.decision_cache_max_entries
+    return cache
+
+
+def decision_cache_stats():
+    """Stats hook: hit rate and latency savings of the active decision cache ({} if off)."""
+    cache = _decision_cache
+    if cache is None and config_loader.current().decision_cache_enabled:
+        cache = _config_cache
+    return cache.stats() if cache is not None else {}
+
+
+# Execution plan cache: (source evaluator list, its contents, decision priority, plan)
+_plan_cache = (None, (), (), None)
+
+
+class _Plan(tuple):
+    """(steps, flag_blockers, block_flag_mask) — see _execution_plan."""
+    __slots__ = ()
+
+    steps = property(lambda self: self[0])
+    flag_blockers = property(lambda self: self[1])
+    block_flag_mask = property(lambda self: self[2])
+
+
+def _execution_plan(config):
+    """
+    Returns the execution plan for ALL_EVALUATORS.
+
+    steps: (canonical_index, evaluator, needs_config) triples in execution
+      order — evaluators producing the highest-priority decision first,
+      cheapest first within a class.
+    flag_blockers: (canonical_index, evaluator, risk_bit) for evaluators
+      that produce the top decision purely from a risk flag.
+    block_flag_mask: OR of those risk bits, for the bitwise precheck.
+
+    An evaluator without an `action` attribute is treated as producing the
+    top decision, so it always runs before anything that could be skipped.
+    The plan is rebuilt whenever the evaluator list or the priority changes.
+    """
+    global _plan_cache
+    source, evaluators, priority, plan = _plan_cache
+    if (
+        source is not ALL_EVALUATORS
+        or evaluators != tuple(ALL_EVALUATORS)
+        or priority != config.decision_priority
+    ):
+        evaluators = tuple(ALL_EVALUATORS)
+        rank = config.decision_rank
+        ordered = sorted(
+            enumerate(evaluators),
+            key=lambda item: (
+                rank.get(getattr(item[1], "action", None), 0),
+                getattr(item[1], "cost", 1),
+                item[0],
+            )
+        )
+        steps = tuple(
+            (index, evaluator, getattr(evaluator, "needs_config", False))
+            for index, evaluator in ordered
+        )
+        flag_blockers = tuple(
+            (index, evaluator, evaluator.risk_bit)
+            for index, evaluator in ordered
+            if rank.get(getattr(evaluator, "action", None)) == 0 and getattr(evaluator, "risk_bit", 0)
+        )
+        block_flag_mask = 0
+        for _, _, bit in flag_blockers:
+            block_flag_mask |= bit
+        plan = _Plan((steps, flag_blockers, block_flag_mask))
+        _plan_cache = (ALL_EVALUATORS, evaluators, config.decision_priority, plan)
+    return plan
+
+
+def enforce(input_payload, full_audit=None, log_trace=True):
     """
     Main enforcement entry.
 
     Input  : EnforcementInput
     Output : EnforcementDecision
 
+    Evaluators run in precedence order and stop at the first BLOCK, since
+    nothing can outrank it. With full trace on (`full_audit=True`, or
+    `full_trace: true` in runtime.yaml) every evaluator runs regardless.
+    The final decision is the same in both modes.
+
+    The config snapshot is read once, up front; the kill switch, priority
+    and every evaluator see the same version even if a reload lands mid-call.
+
+    `log_trace=False` skips the bucket log (bulk replay re-running traces
+    that are already logged).
+
+    With a decision cache configured, a repeated input reuses the evaluated
+    outcome; it still gets a fresh trace_id and its own log record.
+
     This function is:
     - deterministic
     - stateless
@@ -40,7 +154,8 @@ def enforce(input_payload):
     # -----------------------------
     # KILL SWITCH (GLOBAL HALT)
     # -----------------------------
-    if RUNTIME_CONFIG.get("kill_switch") is True:
+    config = config_loader.current()
+    if config.kill_switch:
         return EnforcementDecision(
             decision="BLOCK",
             trace_id="KILL_SWITCH_ACTIVE",
@@ -48,55 +163,150 @@ def enforce(input_payload):
         )
 
     trace_id = str(uuid.uuid4())
-    evaluator_results = []
+    final_decision, evaluator_results, rewrite_guidance = _decide(
+        input_payload, config, full_audit
+    )
 
     # -----------------------------
-    # RUN ALL EVALUATORS
+    # LOG (INTERNAL ONLY)
     # -----------------------------
-    for evaluator in ALL_EVALUATORS:
-        result = evaluator.evaluate(input_payload)
-        evaluator_results.append(result)
+    if log_trace:
+        log_enforcement(
+            trace_id=trace_id,
+            input_snapshot=input_payload,
+            evaluator_results=evaluator_results,
+            final_decision=final_decision
+        )
 
     # -----------------------------
-    # RESOLVE FINAL DECISION
+    # SAFE OUTPUT
     # -----------------------------
-    final_decision = _resolve_decision(evaluator_results)
+    return EnforcementDecision(
+        decision=final_decision,
+        trace_id=trace_id,
+        rewrite_guidance=rewrite_guidance
+    )
+
+
+def enforce_many(input_payloads, full_audit=None, log_trace=True):
+    """
+    Batch enforcement entry.
+
+    Input  : sequence of EnforcementInput
+    Output : list, same order: an EnforcementDecision per item, or the
+             exception that item raised (callers decide how to fail closed)
+
+    The whole batch is decided against one config snapshot, and every
+    trace is handed to the bucket logger in a single batched write.
+    """
+    config = config_loader.current()
+    if config.kill_switch:
+        return [
+            EnforcementDecision(decision="BLOCK", trace_id="KILL_SWITCH_ACTIVE", rewrite_guidance=None)
+            for _ in input_payloads
+        ]
+
+    decisions = []
+    records = []
+    for input_payload in input_payloads:
+        try:
+            final_decision, evaluator_results, rewrite_guidance = _decide(
+                input_payload, config, full_audit
+            )
+        except Exception as e:
+            decisions.append(e)
+            continue
+        trace_id = str(uuid.uuid4())
+        records.append({
+            "trace_id": trace_id,
+            "input_snapshot": input_payload,
+            "evaluator_results": evaluator_results,
+            "final_decision": final_decision,
+        })
+        decisions.append(EnforcementDecision(
+            decision=final_decision,
+            trace_id=trace_id,
+            rewrite_guidance=rewrite_guidance
+        ))
+
+    if log_trace and records:
+        log_enforcement_batch(records)
+    return decisions
+
+
+def _decide(input_payload, config, full_audit):
+    """_evaluate, through the decision cache when one is configured."""
+    if full_audit is None:
+        full_audit = config.full_trace
+    cache = _active_cache(config)
+    if cache is None:
+        return _evaluate(input_payload, config, full_audit)
+    return cache.decide(input_payload, config, full_audit, _evaluate)
+
+
+def _evaluate(input_payload, config, full_audit):
+    """Runs the evaluators; returns (final_decision, evaluator_results, rewrite_guidance)."""
+
+    plan = _execution_plan(config)
+    decision_rank = config.decision_rank
 
     # -----------------------------
-    # GENERATE REWRITE GUIDANCE
+    # BITWISE PRECHECK (TOP-DECISION RISK FLAGS)
     # -----------------------------
-    rewrite_guidance = None
-    if final_decision == "REWRITE":
-        rewrite_guidance = generate_rewrite_guidance(evaluator_results)
+    if not full_audit and input_payload.risk_mask & plan.block_flag_mask:
+        for index, evaluator, bit in plan.flag_blockers:
+            if input_payload.risk_mask & bit:
+                result = evaluator.evaluate(input_payload)
+                if decision_rank.get(result.action) == 0:
+                    return config.decision_priority[0], [result], None
+                break
 
     # -----------------------------
-    # LOG (INTERNAL ONLY)
+    # RUN EVALUATORS + RESOLVE (SINGLE PASS)
     # -----------------------------
-    log_enforcement(
-        trace_id=trace_id,
-        input_snapshot=input_payload,
-        evaluator_results=evaluator_results,
-        final_decision=final_decision
-    )
+    ran = []
+    best_rank = decision_rank["EXECUTE"]
+    for index, evaluator, needs_config in plan.steps:
+        if needs_config:
+            result = evaluator.evaluate(input_payload, config)
+        else:
+            result = evaluator.evaluate(input_payload)
+        ran.append((index, result))
+        rank = decision_rank.get(result.action, best_rank)
+        if rank < best_rank:
+            best_rank = rank
+            if rank == 0 and not full_audit:
+                break
+
+    final_decision = config.decision_priority[best_rank]
+
+    # Results are reported in canonical evaluator order, whatever ran first.
+    ran.sort(key=lambda item: item[0])
+    evaluator_results = [result for _, result in ran]
 
     # -----------------------------
-    # SAFE OUTPUT
+    # GENERATE REWRITE GUIDANCE
     # -----------------------------
-    return EnforcementDecision(
-        decision=final_decision,
-        trace_id=trace_id,
-        rewrite_guidance=rewrite_guidance
-    )
+    rewrite_guidance = None
+    if final_decision == "REWRITE":
+        rewrite_guidance = generate_rewrite_guidance(evaluator_results)
+
+    return final_decision, evaluator_results, rewrite_guidance
 
 
-def _resolve_decision(evaluator_results):
+def _resolve_decision(evaluator_results, config=None):
     """
-    Resolves final decision using strict priority.
+    Resolves final decision using strict priority, in one pass.
 
     BLOCK > REWRITE > EXECUTE
     """
-    for decision in DECISION_PRIORITY:
-        for result in evaluator_results:
-            if result.action == decision:
-                return decision
-    return "EXECUTE"
+    config = config or config_loader.current()
+    decision_rank = config.decision_rank
+    best_rank = decision_rank["EXECUTE"]
+    for result in evaluator_results:
+        rank = decision_rank.get(result.action, best_rank)
+        if rank < best_rank:
+            best_rank = rank
+            if rank == 0:
+                break
+    return config.decision_priority[best_rank]
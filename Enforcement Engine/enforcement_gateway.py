@@ -10,14 +10,14 @@ NON-BYPASSABLE.
 """
 
 from fastapi import FastAPI
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Dict, Any, List, Optional
 import uuid
-from datetime import datetime, timezone
 
-from enforcement_engine import enforce
+import config_loader
+from enforcement_engine import enforce, enforce_many
+from models.enforcement_decision import EnforcementDecision
 from models.enforcement_input import EnforcementInput
-from logs.bucket_logger import log_enforcement
 from akanksha_bridge import send_to_akanksha
 
 
@@ -30,6 +30,9 @@ app = FastAPI(
     version="2.0"
 )
 
+# Hot-reload config/*.yaml (config_reload_interval_seconds in runtime.yaml).
+config_loader.start_config_watcher()
+
 
 # -------------------------------------------------
 # API MODELS
@@ -51,6 +54,17 @@ class EnforcementResponse(BaseModel):
     enforcement_decision_id: str
 
 
+MAX_BATCH_ITEMS = 256
+
+
+class EnforcementBatchRequest(BaseModel):
+    items: List[EnforcementRequest] = Field(..., max_length=MAX_BATCH_ITEMS)
+
+
+class EnforcementBatchResponse(BaseModel):
+    results: List[EnforcementResponse]   # same order as request items
+
+
 # -------------------------------------------------
 # CONSTANTS
 # -------------------------------------------------
@@ -65,6 +79,67 @@ SUCCESS_REASON = "DETERMINISTIC_ENFORCEMENT_APPLIED"
 FAIL_CLOSED_REASON = "ENFORCEMENT_FAILURE_FAIL_CLOSED"
 
 
+# -------------------------------------------------
+# HELPERS
+# -------------------------------------------------
+
+def _build_input(payload) -> EnforcementInput:
+    return EnforcementInput(
+        intent=payload.text,
+        emotional_output=payload.meta.get("emotional_output", {}),
+        age_gate_status=payload.age_state,
+        region_policy=payload.region_state,
+        platform_policy=payload.platform_policy_state,
+        karma_score=payload.karma_signal if payload.karma_signal is not None else 0.0,
+        risk_flags=payload.meta.get("risk_flags", [])
+    )
+
+
+def _respond(result, enforcement_decision_id) -> EnforcementResponse:
+    """Hands an engine decision to Akanksha (unless BLOCK) and shapes the safe response."""
+    # enforce() already logged this trace to the bucket.
+    live_decision = DECISION_MAP.get(result.decision, "BLOCK")
+    rewrite_class = (
+        result.rewrite_guidance.rewrite_class
+        if result.rewrite_guidance else None
+    )
+
+    # -----------------------
+    # HANDOFF TO AKANKSHA
+    # -----------------------
+    if live_decision != "BLOCK":
+        send_to_akanksha(
+            decision=live_decision,
+            rewrite_class=rewrite_class,
+            trace_id=result.trace_id,
+            enforcement_decision_id=enforcement_decision_id
+        )
+
+    # -----------------------
+    # SAFE RESPONSE
+    # -----------------------
+    return EnforcementResponse(
+        decision=live_decision,
+        reason=SUCCESS_REASON,
+        evaluator_trace=[
+            {
+                "decision": result.decision,
+                "rewrite_class": rewrite_class
+            }
+        ],
+        enforcement_decision_id=enforcement_decision_id
+    )
+
+
+def _fail_closed(enforcement_decision_id) -> EnforcementResponse:
+    return EnforcementResponse(
+        decision="BLOCK",
+        reason=FAIL_CLOSED_REASON,
+        evaluator_trace=[],
+        enforcement_decision_id=enforcement_decision_id
+    )
+
+
 # -------------------------------------------------
 # LIVE ENDPOINT
 # -------------------------------------------------
@@ -77,81 +152,67 @@ def live_enforce(payload: EnforcementRequest):
     """
 
     enforcement_decision_id = str(uuid.uuid4())
-    timestamp = datetime.now(timezone.utc).isoformat()
 
     try:
         # -----------------------
         # BUILD ENFORCEMENT INPUT
         # -----------------------
-        enforcement_input = EnforcementInput(
-            intent=payload.text,
-            emotional_output=payload.meta.get("emotional_output", {}),
-            age_gate_status=payload.age_state,
-            region_policy=payload.region_state,
-            platform_policy=payload.platform_policy_state,
-            karma_score=payload.karma_signal if payload.karma_signal is not None else 0.0,
-            risk_flags=payload.meta.get("risk_flags", [])
-        )
+        enforcement_input = _build_input(payload)
 
         # -----------------------
         # RAJ — ENFORCE
         # -----------------------
         result = enforce(enforcement_input)
 
-        live_decision = DECISION_MAP.get(result.decision, "BLOCK")
+        return _respond(result, enforcement_decision_id)
 
+    except Exception:
         # -----------------------
-        # LOG TO BUCKET (GATEWAY)
+        # FAIL-CLOSED
         # -----------------------
-        log_enforcement(
-            trace_id=result.trace_id,
-            input_snapshot=enforcement_input,
-            evaluator_results=[],
-            final_decision=live_decision
-        )
+        return _fail_closed(enforcement_decision_id)
 
-        # -----------------------
-        # HANDOFF TO AKANKSHA
-        # -----------------------
-        if live_decision != "BLOCK":
-            send_to_akanksha(
-                decision=live_decision,
-                rewrite_class=(
-                    result.rewrite_guidance.rewrite_class
-                    if result.rewrite_guidance else None
-                ),
-                trace_id=result.trace_id,
-                enforcement_decision_id=enforcement_decision_id
-            )
 
-        # -----------------------
-        # SAFE RESPONSE
-        # -----------------------
-        return EnforcementResponse(
-            decision=live_decision,
-            reason=SUCCESS_REASON,
-            evaluator_trace=[
-                {
-                    "decision": result.decision,
-                    "rewrite_class": (
-                        result.rewrite_guidance.rewrite_class
-                        if result.rewrite_guidance else None
-                    )
-                }
-            ],
-            enforcement_decision_id=enforcement_decision_id
-        )
+# -------------------------------------------------
+# BATCH ENDPOINT
+# -------------------------------------------------
 
+@app.post("/ai-being/enforce/batch", response_model=EnforcementBatchResponse)
+def live_enforce_batch(payload: EnforcementBatchRequest):
+    """
+    Enforces N candidate responses in one call.
+
+    Results come back in request order. Every item fails closed on its own:
+    a malformed item or an engine error on one input BLOCKs that item only.
+    All traces of the batch are logged as one batched write.
+    """
+
+    decision_ids = [str(uuid.uuid4()) for _ in payload.items]
+    results = [None] * len(payload.items)
+
+    positions = []
+    enforcement_inputs = []
+    for position, item in enumerate(payload.items):
+        try:
+            enforcement_inputs.append(_build_input(item))
+            positions.append(position)
+        except Exception:
+            results[position] = _fail_closed(decision_ids[position])
+
+    try:
+        decisions = enforce_many(enforcement_inputs)
     except Exception:
-        # -----------------------
-        # FAIL-CLOSED + LOG
-        # -----------------------
-        return EnforcementResponse(
-            decision="BLOCK",
-            reason=FAIL_CLOSED_REASON,
-            evaluator_trace=[],
-            enforcement_decision_id=enforcement_decision_id
-        )
+        decisions = [None] * len(enforcement_inputs)
+
+    for position, result in zip(positions, decisions):
+        try:
+            if not isinstance(result, EnforcementDecision):
+                raise RuntimeError("enforcement failed for batch item")
+            results[position] = _respond(result, decision_ids[position])
+        except Exception:
+            results[position] = _fail_closed(decision_ids[position])
+
+    return EnforcementBatchResponse(results=results)
 
 
 # -------------------------------------------------
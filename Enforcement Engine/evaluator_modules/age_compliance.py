@@ -2,6 +2,8 @@ from models.evaluator_result import EvaluatorResult
 
 class AgeComplianceEvaluator:
     name = "age_compliance"
+    action = "BLOCK"
+    cost = 1
 
     def evaluate(self, input_data):
         if input_data.age_gate_status == "BLOCKED":
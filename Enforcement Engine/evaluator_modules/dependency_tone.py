@@ -2,6 +2,8 @@ from models.evaluator_result import EvaluatorResult
 
 class DependencyToneEvaluator:
     name = "dependency_tone"
+    action = "REWRITE"
+    cost = 1
 
     def evaluate(self, input_data):
         if input_data.emotional_output.get("dependency_score", 0) > 0.7:
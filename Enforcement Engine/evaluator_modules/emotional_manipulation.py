@@ -1,10 +1,14 @@
 from models.evaluator_result import EvaluatorResult
+from models.risk_flags import RISK_FLAGS
 
 class EmotionalManipulationEvaluator:
     name = "emotional_manipulation"
+    action = "REWRITE"
+    cost = 1
+    risk_bit = RISK_FLAGS.bit("EMOTIONAL_MANIPULATION")
 
     def evaluate(self, input_data):
-        if "EMOTIONAL_MANIPULATION" in input_data.risk_flags:
+        if input_data.risk_mask & self.risk_bit:
             return EvaluatorResult(
                 self.name,
                 True,
@@ -1,23 +1,15 @@
 from models.evaluator_result import EvaluatorResult
-from config_loader import RUNTIME_CONFIG
+from config_loader import current
 
 class KarmaConfidenceEvaluator:
     name = "karma_confidence"
+    action = "REWRITE"
+    cost = 2
+    needs_config = True
 
-    def evaluate(self, input_data):
-        region_thresholds = RUNTIME_CONFIG.get("karma_confidence_thresholds", {}) or {}
-        default_threshold = RUNTIME_CONFIG.get("karma_confidence_threshold", -0.5)
-        env = RUNTIME_CONFIG.get("env")
-        overlays = RUNTIME_CONFIG.get("karma_confidence_threshold_overlays", {}) or {}
-        overlay_thresholds = overlays.get(env, {}) if env else {}
-        threshold = (
-            overlay_thresholds.get(input_data.region_policy,
-            region_thresholds.get(input_data.region_policy, default_threshold))
-        )
-        if threshold < -1.0:
-            threshold = -1.0
-        if threshold > 1.0:
-            threshold = 1.0
+    def evaluate(self, input_data, config=None):
+        # Thresholds are resolved and clamped when the config snapshot is compiled.
+        threshold = (config or current()).karma_threshold(input_data.region_policy)
         if input_data.karma_score < threshold:
             return EvaluatorResult(
                 self.name,
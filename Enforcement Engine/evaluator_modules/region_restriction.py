@@ -2,6 +2,8 @@ from models.evaluator_result import EvaluatorResult
 
 class RegionRestrictionEvaluator:
     name = "region_restriction"
+    action = "BLOCK"
+    cost = 1
 
     def evaluate(self, input_data):
         if input_data.region_policy in ["RESTRICTED"]:
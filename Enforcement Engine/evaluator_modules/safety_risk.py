@@ -1,10 +1,14 @@
 from models.evaluator_result import EvaluatorResult
+from models.risk_flags import RISK_FLAGS
 
 class SafetyRiskEvaluator:
     name = "safety_risk"
+    action = "BLOCK"
+    cost = 1
+    risk_bit = RISK_FLAGS.bit("HIGH_RISK")
 
     def evaluate(self, input_data):
-        if "HIGH_RISK" in input_data.risk_flags:
+        if input_data.risk_mask & self.risk_bit:
             return EvaluatorResult(
                 self.name,
                 True,
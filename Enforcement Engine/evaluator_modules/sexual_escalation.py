@@ -1,10 +1,14 @@
 from models.evaluator_result import EvaluatorResult
+from models.risk_flags import RISK_FLAGS
 
 class SexualEscalationEvaluator:
     name = "sexual_escalation"
+    action = "BLOCK"
+    cost = 1
+    risk_bit = RISK_FLAGS.bit("SEXUAL_ESCALATION")
 
     def evaluate(self, input_data):
-        if "SEXUAL_ESCALATION" in input_data.risk_flags:
+        if input_data.risk_mask & self.risk_bit:
             return EvaluatorResult(
                 self.name,
                 True,
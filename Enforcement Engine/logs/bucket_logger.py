@@ -8,18 +8,262 @@ Responsibilities:
 - Support replay & audit
 - Never leak to user
 - Deterministic, append-only
+
+Traces are serialized on the caller's thread and handed to a background
+writer, which appends them in batches. The enforcement path never waits
+on disk. Rotation, compression and console echo are driven by the
+`logging` block of config/runtime.yaml.
 """
 
+import atexit
+import gzip
 import json
+import os
+import queue
+import shutil
+import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 
+from config_loader import RUNTIME_CONFIG
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+LOGGING_CONFIG = RUNTIME_CONFIG.get("logging") or {}
+
 # Log file location (JSON Lines format)
-LOG_FILE = Path("logs/enforcement_logs.jsonl")
+LOG_FILE = Path(LOGGING_CONFIG.get("file", "logs/enforcement_logs.jsonl"))
 
 # Ensure logs directory exists
 LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
 
+COMPRESSIONS = ("none", "gzip", "zstd")
+
+
+class BucketWriter:
+    """
+    Background JSONL writer for enforcement traces.
+
+    - Lines go onto a bounded queue; a full queue drops the line and counts it.
+    - The writer thread appends pending lines in batches of `batch_size`, or
+      every `flush_interval` seconds, keeping the file open between batches.
+    - With `max_bytes` or `rotate_interval` set, the active file is rotated to
+      `<stem>.<UTC timestamp><suffix>` and compressed (gzip, or zstd when the
+      optional `zstandard` package is installed).
+    - A failed batch is counted as dropped. The writer never dies.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        path,
+        max_queue=10000,
+        batch_size=256,
+        flush_interval=0.5,
+        max_bytes=0,
+        rotate_interval=0,
+        compression="gzip",
+        console_echo=False,
+    ):
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown log compression: {compression}")
+        if compression == "zstd" and zstandard is None:
+            raise ValueError("zstd log compression requires the optional zstandard package")
+
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.compression = compression
+        self.console_echo = console_echo
+
+        self.written = 0
+        self.dropped = 0
+        self.rotations = 0
+
+        self._file = None
+        self._opened_at = 0.0
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="enforcement-bucket-writer", daemon=True)
+        self._thread.start()
+
+    # -----------------------------
+    # PRODUCER SIDE
+    # -----------------------------
+
+    def write(self, line):
+        if self._closed:
+            self.dropped += 1
+            return
+        try:
+            self._queue.put_nowait(line)
+        except queue.Full:
+            self.dropped += 1
+
+    def write_many(self, lines):
+        """Queues several lines as one item; they land in the same batch."""
+        if not lines:
+            return
+        if self._closed:
+            self.dropped += len(lines)
+            return
+        try:
+            self._queue.put_nowait(list(lines))
+        except queue.Full:
+            self.dropped += len(lines)
+
+    def flush(self, timeout=5.0):
+        """Blocks until every line queued before this call is on disk."""
+        if self._closed or not self._thread.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def close(self, timeout=5.0):
+        """Drains the queue, writes the remaining lines and stops the writer."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(self._STOP)
+        self._thread.join(timeout)
+
+    def stats(self):
+        return {
+            "queue_depth": self._queue.qsize(),
+            "written": self.written,
+            "dropped": self.dropped,
+            "rotations": self.rotations,
+        }
+
+    # -----------------------------
+    # WRITER THREAD
+    # -----------------------------
+
+    def _run(self):
+        pending = []
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = None
+
+            if isinstance(item, str):
+                pending.append(item)
+                if len(pending) < self.batch_size:
+                    continue
+            elif isinstance(item, list):
+                pending.extend(item)
+                if len(pending) < self.batch_size:
+                    continue
+
+            if pending:
+                self._write_batch(pending)
+                pending = []
+            deadline = time.monotonic() + self.flush_interval
+
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is self._STOP:
+                self._close_file()
+                return
+
+    def _write_batch(self, lines):
+        try:
+            if self._should_rotate():
+                self._rotate()
+            if self._file is None:
+                self._file = self.path.open("a", encoding="utf-8")
+                self._opened_at = time.monotonic()
+            self._file.write("\n".join(lines) + "\n")
+            self._file.flush()
+            self.written += len(lines)
+        except Exception as e:
+            self.dropped += len(lines)
+            self._close_file()
+            print(json.dumps({"logger_error": str(e), "dropped": len(lines)}))
+            return
+
+        if self.console_echo:
+            for line in lines:
+                print(json.dumps(json.loads(line), indent=2))
+
+    def _should_rotate(self):
+        if self._file is None:
+            return False
+        if self.max_bytes and self._file.tell() >= self.max_bytes:
+            return True
+        if self.rotate_interval and time.monotonic() - self._opened_at >= self.rotate_interval:
+            return True
+        return False
+
+    def _rotate(self):
+        self._close_file()
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+        rotated = self.path.with_name(f"{self.path.stem}.{stamp}{self.path.suffix}")
+        os.replace(self.path, rotated)
+        if self.compression == "gzip":
+            with rotated.open("rb") as src, gzip.open(f"{rotated}.gz", "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            rotated.unlink()
+        elif self.compression == "zstd":
+            with rotated.open("rb") as src, open(f"{rotated}.zst", "wb") as dst:
+                zstandard.ZstdCompressor().copy_stream(src, dst)
+            rotated.unlink()
+        self.rotations += 1
+
+    def _close_file(self):
+        if self._file is not None:
+            try:
+                self._file.close()
+            except Exception:
+                pass
+            self._file = None
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def _get_writer():
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                rotation = LOGGING_CONFIG.get("rotation") or {}
+                _writer = BucketWriter(
+                    LOG_FILE,
+                    max_queue=LOGGING_CONFIG.get("queue_size", 10000),
+                    batch_size=LOGGING_CONFIG.get("batch_size", 256),
+                    flush_interval=LOGGING_CONFIG.get("flush_interval_seconds", 0.5),
+                    max_bytes=rotation.get("max_bytes", 0),
+                    rotate_interval=rotation.get("interval_seconds", 0),
+                    compression=rotation.get("compression", "gzip"),
+                    console_echo=LOGGING_CONFIG.get("console_echo", False),
+                )
+                atexit.register(_writer.close)
+    return _writer
+
+
+def build_log_line(*, trace_id, input_snapshot, evaluator_results, final_decision):
+    """Serializes one enforcement trace as a JSON line (no trailing newline)."""
+    return json.dumps({
+        "trace_id": trace_id,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "engine_version": "1.0.0",
+        "input_snapshot": input_snapshot.__dict__,
+        "evaluators": [r.__dict__ for r in evaluator_results],
+        "final_decision": final_decision,
+    })
+
 
 def log_enforcement(
     *,
@@ -29,28 +273,21 @@ def log_enforcement(
     final_decision: str
 ):
     """
-    Writes a single enforcement trace.
+    Queues a single enforcement trace for the background writer.
 
     This function must NEVER throw.
     Logging failure must not block enforcement.
     """
 
     try:
-        log_payload = {
-            "trace_id": trace_id,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "engine_version": "1.0.0",
-            "input_snapshot": input_snapshot.__dict__,
-            "evaluators": [r.__dict__ for r in evaluator_results],
-            "final_decision": final_decision,
-        }
-
-        # Append as JSON line (audit-friendly)
-        with LOG_FILE.open("a", encoding="utf-8") as file:
-            file.write(json.dumps(log_payload) + "\n")
-
-        # Console visibility (demo / dev only)
-        print(json.dumps(log_payload, indent=2))
+        if LOGGING_CONFIG.get("enabled", True) is False:
+            return
+        _get_writer().write(build_log_line(
+            trace_id=trace_id,
+            input_snapshot=input_snapshot,
+            evaluator_results=evaluator_results,
+            final_decision=final_decision,
+        ))
 
     except Exception as e:
         # Logging must NEVER break enforcement
@@ -62,3 +299,44 @@ def log_enforcement(
                 }
             )
         )
+
+
+def log_enforcement_batch(records):
+    """
+    Queues several enforcement traces as one batched write.
+
+    `records` are dicts of log_enforcement's keyword arguments. A record
+    that cannot be serialized is skipped; the rest are still logged.
+    This function must NEVER throw.
+    """
+
+    try:
+        if LOGGING_CONFIG.get("enabled", True) is False:
+            return
+        lines = []
+        for record in records:
+            try:
+                lines.append(build_log_line(**record))
+            except Exception as e:
+                print(json.dumps({"logger_error": str(e), "trace_id": record.get("trace_id")}))
+        _get_writer().write_many(lines)
+
+    except Exception as e:
+        # Logging must NEVER break enforcement
+        print(json.dumps({"logger_error": str(e), "batch_size": len(records)}))
+
+
+def flush_logs(timeout=5.0):
+    """Blocks until every queued trace is on disk (replay, tests, shutdown)."""
+    try:
+        if _writer is not None:
+            _writer.flush(timeout)
+    except Exception:
+        pass
+
+
+def logger_stats():
+    """Queue depth, written, dropped and rotation counters of the bucket writer."""
+    if _writer is None:
+        return {"queue_depth": 0, "written": 0, "dropped": 0, "rotations": 0}
+    return _writer.stats()
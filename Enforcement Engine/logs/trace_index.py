@@ -0,0 +1,270 @@
+"""
+TRACE INDEX
+-----------
+SQLite sidecar index over the enforcement JSONL log and its rotated archives.
+
+Maps trace_id -> (source file, byte offset, length) of its record, so replay
+can seek straight to a trace instead of parsing the whole log. The active log
+is indexed incrementally: each refresh only reads the bytes appended since the
+last one, and if it was rotated or truncated its entries are rebuilt from
+scratch. Rotated archives (`<stem>.<UTC stamp><suffix>[.gz|.zst]`, see
+BucketWriter._rotate) never change, so each is indexed once when it first
+appears; an archive that is deleted drops out of the index. Offsets into
+compressed archives are uncompressed offsets, so a lookup there decompresses
+up to the record.
+
+Only complete lines are indexed; a record the writer is still appending is
+picked up by the next refresh. When a trace_id appears more than once, the
+first record indexed wins (archives oldest first, then the active log).
+"""
+
+import gzip
+import io
+import json
+import os
+import re
+import sqlite3
+import zlib
+from pathlib import Path
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+_TRACE_PREFIX = b'{"trace_id": "'
+_INSERT_BATCH = 10000
+_ACTIVE = ""
+
+
+def _trace_id_of(line):
+    # Records written by bucket_logger start with the trace_id; avoid a full parse.
+    if line.startswith(_TRACE_PREFIX):
+        end = line.find(b'"', len(_TRACE_PREFIX))
+        if end != -1:
+            return line[len(_TRACE_PREFIX):end].decode("utf-8")
+    return json.loads(line)["trace_id"]
+
+
+class TraceIndex:
+    def __init__(self, log_path, index_path=None, archives=True):
+        self.log_path = Path(log_path)
+        self.index_path = Path(index_path) if index_path else self.log_path.with_suffix(".index.sqlite")
+        self.archives = archives
+        self._archive_name = re.compile(
+            re.escape(self.log_path.stem) + r"\.\d{8}T\d{12}Z" + re.escape(self.log_path.suffix)
+            + r"(\.gz|\.zst)?"
+        )
+        self._conn = sqlite3.connect(str(self.index_path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(traces)")]
+        if columns and "source" not in columns:
+            # Index from before archives were tracked: it is a cache, rebuild it.
+            self._conn.execute("DROP TABLE traces")
+            self._conn.execute("DROP TABLE IF EXISTS meta")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS traces ("
+            "trace_id TEXT NOT NULL UNIQUE, source TEXT NOT NULL, offset INTEGER NOT NULL, length INTEGER NOT NULL"
+            ")"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS traces_source ON traces (source, offset)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS archives (name TEXT PRIMARY KEY)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER)")
+        self._conn.commit()
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self._conn.execute("SELECT COUNT(*) FROM traces").fetchone()[0]
+
+    # -----------------------------
+    # INDEXING
+    # -----------------------------
+
+    def _meta(self, key):
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def refresh(self):
+        """Indexes new archives and records appended since the last refresh. Returns how many were added."""
+        added = 0
+        st = os.stat(self.log_path) if self.log_path.exists() else None
+        offset = self._meta("offset") or 0
+        if (
+            st is None or self._meta("inode") != st.st_ino or st.st_size < offset
+            # A new log file can reuse the rotated one's inode: compare first lines too.
+            or (offset and self._meta("head") != self._head())
+        ):
+            # Rotated, truncated or gone: the old offsets no longer point anywhere.
+            # Rotated records come back below with their archive.
+            self._conn.execute("DELETE FROM traces WHERE source = ?", (_ACTIVE,))
+            self._set_offset(0, None)
+        if self.archives:
+            added += self._refresh_archives()
+        if st is not None:
+            added += self._refresh_active()
+        self._conn.commit()
+        return added
+
+    def _set_offset(self, offset, inode, head=None):
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            [("offset", offset), ("inode", inode), ("head", head)],
+        )
+
+    def _head(self):
+        try:
+            with self.log_path.open("rb") as f:
+                return zlib.crc32(f.readline(4096))
+        except OSError:
+            return None
+
+    def _refresh_active(self):
+        st = os.stat(self.log_path)
+        offset = self._meta("offset") or 0
+        if st.st_size == offset:
+            return 0
+        with self.log_path.open("rb") as f:
+            f.seek(offset)
+            added, offset = self._index_lines(f, _ACTIVE, offset)
+        self._set_offset(offset, st.st_ino, self._head())
+        return added
+
+    def _archive_sources(self):
+        # A rotated file is complete as soon as it is renamed; its compressed
+        # copy only once the writer deletes the uncompressed one. So prefer
+        # the uncompressed file while it exists.
+        chosen = {}
+        for p in self.log_path.parent.glob(f"{self.log_path.stem}.*"):
+            m = self._archive_name.fullmatch(p.name)
+            if m is None or (m.group(1) == ".zst" and zstandard is None):
+                continue
+            base = p.name[: len(p.name) - len(m.group(1) or "")]
+            if m.group(1) is None or base not in chosen:
+                chosen[base] = p.name
+        return sorted(chosen.values())
+
+    def _refresh_archives(self):
+        present = self._archive_sources()
+        indexed = {row[0] for row in self._conn.execute("SELECT name FROM archives")}
+        for name in indexed.difference(present):
+            self._conn.execute("DELETE FROM traces WHERE source = ?", (name,))
+            self._conn.execute("DELETE FROM archives WHERE name = ?", (name,))
+
+        added = 0
+        for name in present:
+            if name in indexed:
+                continue
+            try:
+                with self._open(name) as f:
+                    count, _ = self._index_lines(f, name, 0)
+            except (OSError, EOFError, ValueError):
+                # Unreadable or cut short: leave it out and retry next refresh
+                self._conn.execute("DELETE FROM traces WHERE source = ?", (name,))
+                continue
+            self._conn.execute("INSERT INTO archives (name) VALUES (?)", (name,))
+            added += count
+        return added
+
+    def _index_lines(self, f, source, offset):
+        added = 0
+        rows = []
+        insert = "INSERT OR IGNORE INTO traces (trace_id, source, offset, length) VALUES (?, ?, ?, ?)"
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            if line.strip():
+                try:
+                    rows.append((_trace_id_of(line), source, offset, len(line)))
+                except (ValueError, KeyError, TypeError):
+                    pass  # corrupt line: not replayable, skip it
+            offset += len(line)
+            if len(rows) >= _INSERT_BATCH:
+                added += self._conn.executemany(insert, rows).rowcount
+                rows = []
+        if rows:
+            added += self._conn.executemany(insert, rows).rowcount
+        return added, offset
+
+    # -----------------------------
+    # LOOKUP
+    # -----------------------------
+
+    def _open(self, source):
+        if source == _ACTIVE:
+            return self.log_path.open("rb")
+        path = self.log_path.parent / source
+        if source.endswith(".gz"):
+            return gzip.open(path, "rb")
+        if source.endswith(".zst"):
+            return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True))
+        return path.open("rb")
+
+    def _reader(self):
+        """Reads (source, offset, length) records, keeping one open file per source."""
+        files = {}
+
+        def read(source, offset, length):
+            f = files.get(source)
+            if f is not None and source.endswith((".gz", ".zst")) and f.tell() > offset:
+                # Compressed streams only seek forward cheaply: reopen to go back.
+                f.close()
+                f = None
+            if f is None:
+                f = files[source] = self._open(source)
+            f.seek(offset)
+            return f.read(length)
+
+        def close():
+            for f in files.values():
+                f.close()
+
+        return read, close
+
+    def get(self, trace_id, refresh=True):
+        """Returns the logged record for `trace_id`, or None."""
+        if refresh:
+            self.refresh()
+        row = self._conn.execute(
+            "SELECT source, offset, length FROM traces WHERE trace_id = ?", (trace_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        read, close = self._reader()
+        try:
+            return json.loads(read(*row))
+        finally:
+            close()
+
+    def raw_records(self, trace_ids):
+        """Yields (trace_id, raw line or None) for each id, after one refresh."""
+        self.refresh()
+        lookup = "SELECT source, offset, length FROM traces WHERE trace_id = ?"
+        read, close = self._reader()
+        try:
+            for trace_id in trace_ids:
+                row = self._conn.execute(lookup, (trace_id,)).fetchone()
+                yield trace_id, (None if row is None else read(*row))
+        finally:
+            close()
+
+    def iter_raw(self):
+        """Yields every indexed raw line, archives oldest first, then the active log."""
+        self.refresh()
+        rows = self._conn.execute(
+            "SELECT source, offset, length FROM traces ORDER BY source = ?, source, offset", (_ACTIVE,)
+        )
+        read, close = self._reader()
+        try:
+            for row in rows:
+                yield read(*row)
+        finally:
+            close()
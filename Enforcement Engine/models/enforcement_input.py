@@ -1,6 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List
 
+from models.risk_flags import RISK_FLAGS
+
 @dataclass(frozen=True)
 class EnforcementInput:
     intent: str
@@ -10,3 +12,7 @@ class EnforcementInput:
     platform_policy: str          # YOUTUBE | INSTAGRAM | etc
     karma_score: float            # -1.0 to +1.0
     risk_flags: List[str]
+    risk_mask: int = field(init=False, repr=False, compare=False)   # derived: RISK_FLAGS bitmask
+
+    def __post_init__(self):
+        object.__setattr__(self, "risk_mask", RISK_FLAGS.mask(self.risk_flags))
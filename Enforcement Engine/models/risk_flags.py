@@ -0,0 +1,77 @@
+"""
+RISK FLAG REGISTRY
+------------------
+Interned risk-flag names mapped to single bits.
+
+EnforcementInput converts its `risk_flags` list into an integer mask once,
+at construction; evaluators then test membership with one AND instead of
+scanning the list. The list itself is kept unchanged for logging/replay,
+so the mask is always re-derivable from what was logged.
+
+Bits are assigned in registration order. KNOWN_RISK_FLAGS is append-only:
+reordering it would change the meaning of masks already in the logs.
+Flags nobody registered contribute no bit (no evaluator reads them).
+"""
+
+import sys
+import threading
+
+KNOWN_RISK_FLAGS = (
+    "HIGH_RISK",
+    "SEXUAL_ESCALATION",
+    "EMOTIONAL_MANIPULATION",
+    "PLATFORM_VIOLATION",
+)
+
+
+class RiskFlagRegistry:
+    def __init__(self, names=()):
+        self._bits = {}
+        self._names = []
+        self._lock = threading.Lock()
+        for name in names:
+            self.register(name)
+
+    def __len__(self):
+        return len(self._names)
+
+    def register(self, name: str) -> int:
+        """Interns `name` and returns its bit (idempotent)."""
+        with self._lock:
+            bit = self._bits.get(name)
+            if bit is None:
+                bit = 1 << len(self._names)
+                name = sys.intern(name)
+                self._bits[name] = bit
+                self._names.append(name)
+            return bit
+
+    def bit(self, name: str) -> int:
+        """Bit of a registered flag, 0 if unregistered."""
+        return self._bits.get(name, 0)
+
+    def mask(self, flags) -> int:
+        """OR of the bits of every registered flag in `flags`."""
+        if isinstance(flags, str) or not isinstance(flags, (list, tuple, set, frozenset)):
+            raise TypeError(f"risk_flags must be a list of strings, got {type(flags).__name__}")
+        if not flags:
+            return 0
+        bits = self._bits
+        try:
+            # Set intersection runs in C: one hash per flag, no Python-level loop.
+            found = bits.keys() & flags
+        except TypeError:
+            # Unhashable items (e.g. dicts from JSON input) carry no bit: walk
+            # the flags and keep only registered names.
+            found = [flag for flag in flags if isinstance(flag, str) and flag in bits]
+        mask = 0
+        for flag in found:
+            mask |= bits[flag]
+        return mask
+
+    def names(self, mask: int):
+        """Registered flag names set in `mask`, in registration order."""
+        return [name for i, name in enumerate(self._names) if mask >> i & 1]
+
+
+RISK_FLAGS = RiskFlagRegistry(KNOWN_RISK_FLAGS)
@@ -1,24 +1,27 @@
 import json
-from pathlib import Path
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
 from enforcement_engine import enforce
+from logs.bucket_logger import LOG_FILE, flush_logs
+from logs.trace_index import TraceIndex
 from models.enforcement_input import EnforcementInput
 
-LOG_FILE = Path("logs/enforcement_logs.jsonl")
-
-def replay(trace_id: str):
-    if not LOG_FILE.exists():
+def _open_index():
+    # LOG_FILE is `logging.file` from config/runtime.yaml, where the writer appends
+    flush_logs()
+    if not LOG_FILE.exists() and not any(LOG_FILE.parent.glob(f"{LOG_FILE.stem}.*{LOG_FILE.suffix}*")):
         raise FileNotFoundError("No enforcement logs found.")
+    return TraceIndex(LOG_FILE)
 
-    with LOG_FILE.open("r", encoding="utf-8") as f:
-        for line in f:
-            record = json.loads(line)
-            if record["trace_id"] == trace_id:
-                return _replay_record(record)
-
-    raise ValueError(f"Trace ID not found: {trace_id}")
+def replay(trace_id: str):
+    with _open_index() as index:
+        record = index.get(trace_id)
+    if record is None:
+        raise ValueError(f"Trace ID not found: {trace_id}")
+    return _replay_record(record)
 
-def _replay_record(record):
+def _replay_record(record, log_trace=True):
     input_snapshot = record["input_snapshot"]
 
     reconstructed_input = EnforcementInput(
@@ -31,7 +34,7 @@ def _replay_record(record):
         risk_flags=input_snapshot["risk_flags"],
     )
 
-    decision = enforce(reconstructed_input)
+    decision = enforce(reconstructed_input, full_audit=True, log_trace=log_trace)
 
     return {
         "original_trace_id": record["trace_id"],
@@ -40,6 +43,86 @@ def _replay_record(record):
         "deterministic_match": decision.decision == record["final_decision"],
     }
 
+# -------------------------------------------------
+# BULK REPLAY
+# -------------------------------------------------
+# Bulk replays are not logged: re-running an audit must not append to the
+# log being audited.
+
+def _replay_chunk(lines):
+    results = []
+    for line in lines:
+        try:
+            results.append(_replay_record(json.loads(line), log_trace=False))
+        except Exception as e:
+            results.append({"replay_error": str(e)})
+    return results
+
+def _chunks(items, chunk_size):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def _run_replay(lines, workers, chunk_size, report):
+    def collect(results):
+        for result in results:
+            if "replay_error" in result:
+                report["errors"].append(result["replay_error"])
+                continue
+            report["replayed"] += 1
+            if result["deterministic_match"]:
+                report["matched"] += 1
+            else:
+                report["mismatches"].append(result)
+
+    if workers <= 1:
+        for chunk in _chunks(lines, chunk_size):
+            collect(_replay_chunk(chunk))
+        return report
+
+    # Bounded in-flight window keeps memory flat on very large logs.
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = deque()
+        for chunk in _chunks(lines, chunk_size):
+            in_flight.append(pool.submit(_replay_chunk, chunk))
+            if len(in_flight) >= workers * 2:
+                collect(in_flight.popleft().result())
+        while in_flight:
+            collect(in_flight.popleft().result())
+    return report
+
+def _new_report():
+    return {"replayed": 0, "matched": 0, "mismatches": [], "missing": [], "errors": []}
+
+def replay_many(trace_ids, workers: int = 1, chunk_size: int = 1000):
+    """
+    Replays the given traces (indexed lookup) and reports determinism.
+
+    Returns {"replayed", "matched", "mismatches", "missing", "errors"};
+    `mismatches` holds the full replay result of every non-matching trace.
+    """
+    report = _new_report()
+
+    def found_lines(index):
+        for trace_id, line in index.raw_records(trace_ids):
+            if line is None:
+                report["missing"].append(trace_id)
+            else:
+                yield line
+
+    with _open_index() as index:
+        return _run_replay(found_lines(index), workers, chunk_size, report)
+
+def replay_all(workers: int = 1, chunk_size: int = 1000):
+    """Replays every logged trace (first record per trace_id) in log order."""
+    with _open_index() as index:
+        return _run_replay(index.iter_raw(), workers, chunk_size, _new_report())
+
 if __name__ == "__main__":
     trace = input("Enter trace_id to replay: ").strip()
     result = replay(trace)
@@ -0,0 +1,72 @@
+"""
+Microbenchmark: per-call open + indented console dump (previous bucket logger)
+vs the queued BucketWriter, measured on the caller's thread.
+
+Usage: python scripts/bench_bucket_logger.py [records]
+"""
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from logs.bucket_logger import BucketWriter, build_log_line
+from models.enforcement_input import EnforcementInput
+from models.evaluator_result import EvaluatorResult
+
+SNAPSHOT = EnforcementInput(
+    intent="bench",
+    emotional_output={"tone": "neutral", "dependency_score": 0.2},
+    age_gate_status="ALLOWED",
+    region_policy="IN",
+    platform_policy="YOUTUBE",
+    karma_score=0.1,
+    risk_flags=[],
+)
+RESULTS = [EvaluatorResult(f"evaluator_{i}", False, "EXECUTE", "") for i in range(8)]
+
+
+def legacy_log(path, trace_id):
+    line = build_log_line(
+        trace_id=trace_id, input_snapshot=SNAPSHOT, evaluator_results=RESULTS, final_decision="EXECUTE"
+    )
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(line + "\n")
+    print(json.dumps(json.loads(line), indent=2))
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_path = os.path.join(tmp, "legacy.jsonl")
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            for i in range(n):
+                legacy_log(legacy_path, f"t-{i}")
+            legacy_s = time.perf_counter() - start
+
+        writer = BucketWriter(os.path.join(tmp, "buffered.jsonl"), max_queue=n)
+        start = time.perf_counter()
+        for i in range(n):
+            writer.write(build_log_line(
+                trace_id=f"t-{i}", input_snapshot=SNAPSHOT, evaluator_results=RESULTS, final_decision="EXECUTE"
+            ))
+        enqueue_s = time.perf_counter() - start
+        writer.flush(timeout=None)
+        drained_s = time.perf_counter() - start
+        writer.close()
+        stats = writer.stats()
+
+    print(f"legacy (open + print per call): {legacy_s / n * 1e6:.1f} us/record")
+    print(f"buffered (caller thread):       {enqueue_s / n * 1e6:.1f} us/record")
+    print(f"buffered (until on disk):       {drained_s / n * 1e6:.1f} us/record")
+    print(f"caller-side speedup:            {legacy_s / enqueue_s:.1f}x")
+    print(f"writer stats:                   {stats}")
+
+
+if __name__ == "__main__":
+    main()
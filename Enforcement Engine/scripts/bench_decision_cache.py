@@ -0,0 +1,61 @@
+"""
+Microbenchmark: enforce() with and without the decision cache on repeated
+traffic (the Backend Spine's arl_gate sends the same neutral envelope for
+most turns). Logging is replaced with a no-op.
+
+Usage: python scripts/bench_decision_cache.py [iterations] [distinct_inputs]
+"""
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import enforcement_engine as em
+from decision_cache import DecisionCache
+from models.enforcement_input import EnforcementInput
+
+
+def make_input(i):
+    return EnforcementInput(
+        intent=f"assistant turn {i}",
+        emotional_output={"tone": "neutral", "dependency_score": 0.0},
+        age_gate_status="ALLOWED",
+        region_policy="IN",
+        platform_policy="WEB",
+        karma_score=0.0,
+        risk_flags=[],
+    )
+
+
+def run(inputs, n):
+    k = len(inputs)
+    start = time.perf_counter()
+    for i in range(n):
+        em.enforce(inputs[i % k])
+    return time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    em.log_enforcement = lambda **_: None
+    inputs = [make_input(i) for i in range(distinct)]
+
+    em.configure_decision_cache(None)
+    uncached_s = run(inputs, n)
+
+    em.configure_decision_cache(DecisionCache(max_entries=10000))
+    cached_s = run(inputs, n)
+    stats = em.decision_cache_stats()
+
+    print(f"uncached: {uncached_s / n * 1e6:.2f} us/decision")
+    print(f"cached:   {cached_s / n * 1e6:.2f} us/decision ({uncached_s / cached_s:.2f}x)")
+    print(
+        f"cache:    hit rate {stats['hit_rate']:.1%}, avg hit {stats['avg_hit_us']:.2f} us, "
+        f"avg miss {stats['avg_miss_us']:.2f} us, saved {stats['saved_ms']:.0f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
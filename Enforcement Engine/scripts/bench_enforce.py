@@ -0,0 +1,71 @@
+"""
+Microbenchmark: short-circuit enforce() vs full-audit enforce() on
+BLOCK-heavy and EXECUTE-heavy traffic.
+
+Logging is replaced with a no-op so only evaluation and resolution are timed.
+
+Usage: python scripts/bench_enforce.py [iterations]
+"""
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import enforcement_engine as em
+from models.enforcement_input import EnforcementInput
+
+
+def make_input(age="ALLOWED", region="IN", dependency=0.0, karma=0.0, flags=()):
+    return EnforcementInput(
+        intent="bench",
+        emotional_output={"tone": "neutral", "dependency_score": dependency},
+        age_gate_status=age,
+        region_policy=region,
+        platform_policy="YOUTUBE",
+        karma_score=karma,
+        risk_flags=list(flags),
+    )
+
+
+TRAFFIC = {
+    "block-heavy": [
+        make_input(age="BLOCKED"),
+        make_input(region="RESTRICTED"),
+        make_input(flags=["HIGH_RISK"]),
+        make_input(flags=["SEXUAL_ESCALATION"], dependency=0.9),
+        make_input(karma=-0.8),
+    ],
+    "execute-heavy": [
+        make_input(),
+        make_input(region="EU", karma=0.4),
+        make_input(dependency=0.3),
+        make_input(flags=["PLATFORM_VIOLATION"]),
+        make_input(karma=0.9),
+    ],
+}
+
+
+def run(inputs, n, full_audit):
+    k = len(inputs)
+    start = time.perf_counter()
+    for i in range(n):
+        em.enforce(inputs[i % k], full_audit=full_audit)
+    return time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    em.log_enforcement = lambda **_: None
+
+    for label, inputs in TRAFFIC.items():
+        full_s = run(inputs, n, full_audit=True)
+        fast_s = run(inputs, n, full_audit=False)
+        print(f"{label}:")
+        print(f"  full audit:    {full_s / n * 1e6:.2f} us/decision")
+        print(f"  short-circuit: {fast_s / n * 1e6:.2f} us/decision")
+        print(f"  speedup:       {full_s / fast_s:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
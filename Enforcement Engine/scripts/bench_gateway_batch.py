@@ -0,0 +1,67 @@
+"""
+Load test: /ai-being/enforce (one item per call) vs /ai-being/enforce/batch,
+driven in-process through FastAPI's TestClient (no network).
+
+Reports HTTP requests/sec and decisions/sec for each mode.
+
+Usage: python scripts/bench_gateway_batch.py [decisions] [batch_size]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from fastapi.testclient import TestClient
+
+import logs.bucket_logger as bl
+from enforcement_gateway import app
+
+
+def item(i):
+    return {
+        "text": f"candidate {i}",
+        "meta": {
+            "emotional_output": {"tone": "neutral", "dependency_score": 0.9 if i % 4 == 1 else 0.1},
+            "risk_flags": ["HIGH_RISK"] if i % 4 == 2 else [],
+        },
+        "age_state": "ALLOWED",
+        "region_state": "EU" if i % 2 else "IN",
+        "platform_policy_state": "YOUTUBE",
+        "karma_signal": 0.0,
+    }
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    items = [item(i) for i in range(n)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Keep the benchmark's traces out of the real audit log.
+        bl._writer = bl.BucketWriter(os.path.join(tmp, "bench.jsonl"), max_queue=n * 2)
+        client = TestClient(app)
+
+        start = time.perf_counter()
+        for payload in items:
+            client.post("/ai-being/enforce", json=payload)
+        single_s = time.perf_counter() - start
+
+        batches = [items[i:i + batch_size] for i in range(0, n, batch_size)]
+        start = time.perf_counter()
+        for chunk in batches:
+            client.post("/ai-being/enforce/batch", json={"items": chunk})
+        batch_s = time.perf_counter() - start
+
+        bl._writer.close()
+        stats = bl._writer.stats()
+
+    print(f"single: {n / single_s:8.0f} req/s | {n / single_s:8.0f} decisions/s")
+    print(f"batch:  {len(batches) / batch_s:8.0f} req/s | {n / batch_s:8.0f} decisions/s (batch size {batch_size})")
+    print(f"decision throughput: {single_s / batch_s:.1f}x")
+    print(f"bucket writer: {stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark: linear JSONL scan vs SQLite trace index for replay lookups,
+plus bulk replay_all throughput, on a synthetic enforcement log.
+
+Usage: python scripts/bench_replay.py [traces] [workers]
+       (defaults: 1,000,000 traces, all CPUs)
+"""
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import replay_enforcement as re_mod
+from enforcement_engine import enforce
+from logs.bucket_logger import build_log_line
+from logs.trace_index import TraceIndex
+from models.enforcement_input import EnforcementInput
+
+INPUTS = [
+    EnforcementInput(
+        intent="bench",
+        emotional_output={"tone": "neutral", "dependency_score": dependency},
+        age_gate_status=age,
+        region_policy=region,
+        platform_policy="YOUTUBE",
+        karma_score=karma,
+        risk_flags=flags,
+    )
+    for age in ("ALLOWED", "BLOCKED")
+    for region in ("IN", "EU", "RESTRICTED")
+    for dependency in (0.1, 0.9)
+    for karma in (0.5, -0.8)
+    for flags in ([], ["HIGH_RISK"], ["PLATFORM_VIOLATION"])
+]
+
+
+def write_log(path, n):
+    decisions = [enforce(i, log_trace=False).decision for i in INPUTS]
+    trace_ids = []
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(n):
+            k = i % len(INPUTS)
+            trace_id = str(uuid.uuid4())
+            trace_ids.append(trace_id)
+            f.write(build_log_line(
+                trace_id=trace_id, input_snapshot=INPUTS[k], evaluator_results=[], final_decision=decisions[k]
+            ) + "\n")
+    return trace_ids
+
+
+def linear_find(path, trace_id):
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            record = json.loads(line)
+            if record["trace_id"] == trace_id:
+                return record
+    return None
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    rng = random.Random(7)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log = os.path.join(tmp, "enforcement_logs.jsonl")
+        start = time.perf_counter()
+        trace_ids = write_log(log, n)
+        print(f"log:            {n} traces, {os.path.getsize(log) / 1e6:.0f} MB ({time.perf_counter() - start:.1f} s)")
+
+        with TraceIndex(log) as index:
+            start = time.perf_counter()
+            index.refresh()
+            print(f"index build:    {time.perf_counter() - start:.1f} s")
+
+            probes = rng.sample(trace_ids, 5)
+            start = time.perf_counter()
+            for trace_id in probes:
+                linear_find(log, trace_id)
+            linear_s = (time.perf_counter() - start) / len(probes)
+
+            probes = rng.sample(trace_ids, min(n, 10000))
+            start = time.perf_counter()
+            for trace_id in probes:
+                index.get(trace_id, refresh=False)
+            indexed_s = (time.perf_counter() - start) / len(probes)
+
+        print(f"linear lookup:  {linear_s * 1e3:.1f} ms/trace")
+        print(f"indexed lookup: {indexed_s * 1e6:.1f} us/trace ({linear_s / indexed_s:.0f}x)")
+
+        re_mod.LOG_FILE = Path(log)
+        for w in sorted({1, workers}):
+            start = time.perf_counter()
+            report = re_mod.replay_all(workers=w)
+            elapsed = time.perf_counter() - start
+            print(
+                f"replay_all x{w}: {report['replayed'] / elapsed:,.0f} traces/s "
+                f"({report['matched']} matched, {len(report['mismatches'])} mismatches)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Microbenchmark: risk-flag membership via list scans (previous evaluators)
+vs the interned bitmask computed once per EnforcementInput.
+
+Per input, the list path does one `in` scan per flag evaluator; the mask
+path builds the mask once (at construction) and then does one AND each.
+
+Usage: python scripts/bench_risk_flags.py [iterations]
+"""
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.risk_flags import KNOWN_RISK_FLAGS, RISK_FLAGS
+
+BITS = [RISK_FLAGS.bit(flag) for flag in KNOWN_RISK_FLAGS]
+
+
+def list_scan(flags):
+    return [flag in flags for flag in KNOWN_RISK_FLAGS]
+
+
+def mask_test(flags):
+    mask = RISK_FLAGS.mask(flags)
+    return [bool(mask & bit) for bit in BITS]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    for size in (0, 4, 64, 1024, 16384):
+        # Worst case for scans: no known flag present, every scan reads the whole list.
+        flags = [f"UPSTREAM_SIGNAL_{i}" for i in range(size)]
+        iterations = max(50, n // max(1, size // 16))
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            list_scan(flags)
+        scan_s = (time.perf_counter() - start) / iterations
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            mask_test(flags)
+        mask_s = (time.perf_counter() - start) / iterations
+
+        mask = RISK_FLAGS.mask(flags)
+        start = time.perf_counter()
+        for _ in range(iterations):
+            [bool(mask & bit) for bit in BITS]
+        test_s = (time.perf_counter() - start) / iterations
+
+        print(
+            f"{size:6d} flags: list scans {scan_s * 1e6:9.2f} us | "
+            f"mask build + test {mask_s * 1e6:9.2f} us | "
+            f"test only {test_s * 1e9:6.0f} ns | {scan_s / mask_s:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+import dataclasses
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+import config_loader
+import enforcement_engine as em
+import enforcement_gateway as gw
+from enforcement_gateway import (
+    EnforcementBatchRequest,
+    EnforcementRequest,
+    MAX_BATCH_ITEMS,
+    live_enforce,
+    live_enforce_batch,
+)
+
+
+def item(**overrides):
+    base = {
+        "text": "hello",
+        "meta": {"emotional_output": {"tone": "neutral", "dependency_score": 0.0}, "risk_flags": []},
+        "age_state": "ALLOWED",
+        "region_state": "IN",
+        "platform_policy_state": "YOUTUBE",
+        "karma_signal": 0.0,
+    }
+    base.update(overrides)
+    return base
+
+
+ITEMS = [
+    item(),
+    item(meta={"emotional_output": {"dependency_score": 0.9}, "risk_flags": []}),
+    item(age_state="BLOCKED"),
+    item(meta={"emotional_output": None, "risk_flags": None}),
+    item(region_state="RESTRICTED"),
+]
+
+
+def batch(items):
+    return EnforcementBatchRequest(items=[EnforcementRequest(**i) for i in items])
+
+
+def test_batch_matches_single_calls_in_order():
+    results = live_enforce_batch(batch(ITEMS)).results
+    singles = [live_enforce(EnforcementRequest(**i)) for i in ITEMS]
+    assert [r.decision for r in results] == [s.decision for s in singles]
+    assert [r.reason for r in results] == [s.reason for s in singles]
+    assert [r.decision for r in results] == ["ALLOW", "REWRITE", "BLOCK", "BLOCK", "BLOCK"]
+    assert results[3].reason == gw.FAIL_CLOSED_REASON
+    assert len({r.enforcement_decision_id for r in results}) == len(ITEMS)
+    for r in results:
+        uuid.UUID(r.enforcement_decision_id)
+
+
+def test_batch_logs_once(monkeypatch):
+    batches = []
+    monkeypatch.setattr(em, "log_enforcement_batch", lambda records: batches.append(records))
+    monkeypatch.setattr(em, "log_enforcement", lambda **_: pytest.fail("per-item log in batch path"))
+    live_enforce_batch(batch(ITEMS))
+    assert len(batches) == 1
+    # The corrupt item never produced a decision, so it has no trace.
+    assert [r["final_decision"] for r in batches[0]] == ["EXECUTE", "REWRITE", "BLOCK", "BLOCK"]
+
+
+def test_block_items_never_reach_akanksha(monkeypatch):
+    seen = []
+    monkeypatch.setattr(gw, "send_to_akanksha", lambda **kw: seen.append(kw["decision"]))
+    live_enforce_batch(batch(ITEMS))
+    assert seen == ["ALLOW", "REWRITE"]
+
+
+def test_akanksha_failure_fails_closed_per_item(monkeypatch):
+    def flaky(**kw):
+        if kw["decision"] == "REWRITE":
+            raise RuntimeError("akanksha down")
+    monkeypatch.setattr(gw, "send_to_akanksha", flaky)
+    results = live_enforce_batch(batch(ITEMS[:2])).results
+    assert [r.decision for r in results] == ["ALLOW", "BLOCK"]
+    assert results[1].reason == gw.FAIL_CLOSED_REASON
+
+
+def test_engine_crash_fails_whole_batch_closed(monkeypatch):
+    def boom(_):
+        raise RuntimeError("chaos")
+    monkeypatch.setattr(gw, "enforce_many", boom)
+    results = live_enforce_batch(batch(ITEMS)).results
+    assert {r.decision for r in results} == {"BLOCK"}
+    assert {r.reason for r in results} == {gw.FAIL_CLOSED_REASON}
+
+
+def test_kill_switch_blocks_every_item(monkeypatch):
+    config = dataclasses.replace(config_loader.current(), kill_switch=True)
+    monkeypatch.setattr(config_loader, "_snapshot", config)
+    results = live_enforce_batch(batch(ITEMS[:2])).results
+    assert [r.decision for r in results] == ["BLOCK", "BLOCK"]
+
+
+def test_batch_http_contract():
+    client = TestClient(gw.app)
+    res = client.post("/ai-being/enforce/batch", json={"items": ITEMS})
+    assert res.status_code == 200
+    assert [r["decision"] for r in res.json()["results"]] == ["ALLOW", "REWRITE", "BLOCK", "BLOCK", "BLOCK"]
+
+    res = client.post("/ai-being/enforce/batch", json={"items": []})
+    assert res.status_code == 200 and res.json() == {"results": []}
+
+    res = client.post("/ai-being/enforce/batch", json={"items": [item()] * (MAX_BATCH_ITEMS + 1)})
+    assert res.status_code == 422
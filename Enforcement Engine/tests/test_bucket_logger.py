@@ -0,0 +1,143 @@
+import gzip
+import json
+import threading
+import time
+
+import pytest
+
+import logs.bucket_logger as bl
+from logs.bucket_logger import BucketWriter
+from models.enforcement_input import EnforcementInput
+from models.evaluator_result import EvaluatorResult
+
+
+def make_input():
+    return EnforcementInput(
+        intent="test",
+        emotional_output={"tone": "neutral", "dependency_score": 0.0},
+        age_gate_status="ALLOWED",
+        region_policy="IN",
+        platform_policy="YOUTUBE",
+        karma_score=0.0,
+        risk_flags=[],
+    )
+
+
+def line(i):
+    return json.dumps({"trace_id": f"t-{i}", "final_decision": "EXECUTE"})
+
+
+def test_batched_writes_reach_disk_in_order(tmp_path):
+    path = tmp_path / "bucket.jsonl"
+    writer = BucketWriter(path, batch_size=8, flush_interval=10)
+    for i in range(100):
+        writer.write(line(i))
+    writer.flush()
+    records = [json.loads(l) for l in path.read_text(encoding="utf-8").splitlines()]
+    assert [r["trace_id"] for r in records] == [f"t-{i}" for i in range(100)]
+    assert writer.stats() == {"queue_depth": 0, "written": 100, "dropped": 0, "rotations": 0}
+    writer.close()
+
+
+def test_full_queue_drops_instead_of_blocking(tmp_path):
+    writer = BucketWriter(tmp_path / "bucket.jsonl", max_queue=1, batch_size=1)
+    stalled, release = threading.Event(), threading.Event()
+    write_batch = writer._write_batch
+
+    def slow_disk(lines):
+        stalled.set()
+        release.wait(5)
+        write_batch(lines)
+
+    writer._write_batch = slow_disk
+    writer.write(line(0))
+    assert stalled.wait(5)          # writer thread is stuck on line 0
+    writer.write(line(1))           # fills the one queue slot
+
+    start = time.monotonic()
+    writer.write(line(2))
+    writer.write_many([line(3), line(4)])
+    assert time.monotonic() - start < 0.5
+    assert writer.stats()["dropped"] == 3
+
+    release.set()
+    writer.close()
+    assert writer.stats()["written"] == 2
+    records = [json.loads(l)["trace_id"] for l in (tmp_path / "bucket.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert records == ["t-0", "t-1"]
+
+
+def test_write_after_close_is_dropped(tmp_path):
+    writer = BucketWriter(tmp_path / "bucket.jsonl")
+    writer.close()
+    writer.write(line(0))
+    writer.write_many([line(1), line(2)])
+    assert writer.stats()["dropped"] == 3
+
+
+def test_write_failure_counted_as_dropped(tmp_path):
+    writer = BucketWriter(tmp_path / "missing_dir" / "bucket.jsonl")
+    writer.write(line(0))
+    writer.flush()
+    assert writer.stats()["dropped"] == 1
+    assert writer.stats()["written"] == 0
+    writer.close()
+
+
+def test_size_rotation_compresses_with_gzip(tmp_path):
+    path = tmp_path / "bucket.jsonl"
+    writer = BucketWriter(path, batch_size=1, max_bytes=200, compression="gzip")
+    for i in range(50):
+        writer.write(line(i))
+    writer.flush()
+    writer.close()
+
+    rotated = sorted(tmp_path.glob("bucket.*.jsonl.gz"))
+    assert rotated and writer.stats()["rotations"] == len(rotated)
+    lines = []
+    for archive in rotated:
+        with gzip.open(archive, "rt", encoding="utf-8") as f:
+            lines.extend(f.read().splitlines())
+    lines.extend(path.read_text(encoding="utf-8").splitlines())
+    assert [json.loads(l)["trace_id"] for l in lines] == [f"t-{i}" for i in range(50)]
+
+
+def test_unknown_compression_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        BucketWriter(tmp_path / "bucket.jsonl", compression="lz4")
+
+
+def test_console_echo_is_opt_in(tmp_path, capsys):
+    quiet = BucketWriter(tmp_path / "quiet.jsonl")
+    quiet.write(line(0))
+    quiet.close()
+    assert capsys.readouterr().out == ""
+
+    loud = BucketWriter(tmp_path / "loud.jsonl", console_echo=True)
+    loud.write(line(1))
+    loud.close()
+    assert '"trace_id": "t-1"' in capsys.readouterr().out
+
+
+def test_log_enforcement_never_throws(monkeypatch):
+    monkeypatch.setattr(bl, "_get_writer", lambda: (_ for _ in ()).throw(OSError("disk gone")))
+    bl.log_enforcement(
+        trace_id="t", input_snapshot=make_input(), evaluator_results=[], final_decision="BLOCK"
+    )
+    bl.log_enforcement(
+        trace_id="t", input_snapshot=None, evaluator_results=None, final_decision="BLOCK"
+    )
+
+
+def test_log_enforcement_queues_serialized_trace(tmp_path, monkeypatch):
+    writer = BucketWriter(tmp_path / "bucket.jsonl")
+    monkeypatch.setattr(bl, "_get_writer", lambda: writer)
+    result = EvaluatorResult("age_compliance", False, "EXECUTE", "")
+    bl.log_enforcement(
+        trace_id="t-1", input_snapshot=make_input(), evaluator_results=[result], final_decision="EXECUTE"
+    )
+    writer.close()
+    record = json.loads((tmp_path / "bucket.jsonl").read_text(encoding="utf-8"))
+    assert record["trace_id"] == "t-1"
+    assert record["input_snapshot"]["region_policy"] == "IN"
+    assert record["evaluators"] == [result.__dict__]
@@ -0,0 +1,127 @@
+import os
+import threading
+
+import pytest
+import yaml
+
+import config_loader
+from enforcement_engine import enforce
+from models.enforcement_input import EnforcementInput
+
+ENFORCEMENT = {"version": "1.0.0", "decision_priority": ["BLOCK", "REWRITE", "EXECUTE"]}
+
+
+def runtime(threshold, kill_switch=False):
+    # Every threshold in a variant is identical, so a torn read shows up as a mix.
+    return {
+        "kill_switch": kill_switch,
+        "karma_confidence_threshold": threshold,
+        "karma_confidence_thresholds": {"EU": threshold, "US": threshold},
+        "env": "demo",
+        "karma_confidence_threshold_overlays": {"demo": {"IN": threshold}},
+    }
+
+
+def write_config(directory, runtime_config, stamp_ns):
+    for name, data in (("enforcement.yaml", ENFORCEMENT), ("runtime.yaml", runtime_config)):
+        path = directory / name
+        path.write_text(yaml.safe_dump(data), encoding="utf-8")
+        os.utime(path, ns=(stamp_ns, stamp_ns))
+
+
+def make_input(region="EU", karma=-0.4):
+    return EnforcementInput(
+        intent="test",
+        emotional_output={"tone": "neutral", "dependency_score": 0.0},
+        age_gate_status="ALLOWED",
+        region_policy=region,
+        platform_policy="YOUTUBE",
+        karma_score=karma,
+        risk_flags=[],
+    )
+
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    write_config(tmp_path, runtime(-0.2), 1_000_000_000)
+    monkeypatch.setattr(config_loader, "CONFIG_DIR", tmp_path)
+    monkeypatch.setattr(config_loader, "_stamps", None)
+    monkeypatch.setattr(config_loader, "_snapshot", config_loader.current())
+    assert config_loader.reload_if_changed()
+    return tmp_path
+
+
+def test_snapshot_precomputes_clamped_thresholds():
+    snapshot = config_loader.compile_snapshot(ENFORCEMENT, {
+        "karma_confidence_threshold": -3,
+        "karma_confidence_thresholds": {"EU": -0.2, "US": 0.3},
+        "env": "demo",
+        "karma_confidence_threshold_overlays": {"demo": {"EU": 5.0}, "prod": {"US": -0.9}},
+    })
+    assert snapshot.default_karma_threshold == -1.0
+    assert snapshot.karma_threshold("EU") == 1.0
+    assert snapshot.karma_threshold("US") == 0.3
+    assert snapshot.karma_threshold("IN") == -1.0
+    assert snapshot.decision_rank == {"BLOCK": 0, "REWRITE": 1, "EXECUTE": 2}
+
+
+def test_snapshot_is_immutable():
+    snapshot = config_loader.current()
+    with pytest.raises(Exception):
+        snapshot.kill_switch = True
+    with pytest.raises(TypeError):
+        snapshot.karma_thresholds["EU"] = 0.0
+    with pytest.raises(TypeError):
+        snapshot.runtime["kill_switch"] = True
+
+
+def test_reload_swaps_only_on_change(config_dir):
+    version = config_loader.current().version
+    assert not config_loader.reload_if_changed()
+    write_config(config_dir, runtime(-0.6), 2_000_000_000)
+    assert config_loader.reload_if_changed()
+    assert config_loader.current().version == version + 1
+    assert config_loader.current().karma_threshold("EU") == -0.6
+    assert enforce(make_input(karma=-0.4)).decision == "EXECUTE"
+
+
+def test_kill_switch_hot_reload(config_dir):
+    write_config(config_dir, runtime(-0.2, kill_switch=True), 2_000_000_000)
+    config_loader.reload_if_changed()
+    assert enforce(make_input()).trace_id == "KILL_SWITCH_ACTIVE"
+
+
+def test_invalid_config_keeps_last_good_snapshot(config_dir):
+    before = config_loader.current()
+    (config_dir / "enforcement.yaml").write_text("decision_priority: [EXECUTE]\n", encoding="utf-8")
+    os.utime(config_dir / "enforcement.yaml", ns=(3_000_000_000, 3_000_000_000))
+    assert not config_loader.reload_if_changed()
+    assert config_loader.current() is before
+
+
+def test_reload_mid_traffic_never_tears(config_dir):
+    stop = threading.Event()
+    torn = []
+    decisions = []
+
+    def reader():
+        while not stop.is_set():
+            snapshot = config_loader.current()
+            values = {snapshot.default_karma_threshold, *snapshot.karma_thresholds.values()}
+            if len(values) != 1:
+                torn.append(values)
+            decisions.append(enforce(make_input(karma=-0.4), log_trace=False).decision)
+
+    readers = [threading.Thread(target=reader) for _ in range(2)]
+    for t in readers:
+        t.start()
+    for i in range(50):
+        write_config(config_dir, runtime(-0.2 if i % 2 else -0.6), 2_000_000_000 + i)
+        config_loader.reload_if_changed()
+    stop.set()
+    for t in readers:
+        t.join()
+
+    assert torn == []
+    assert set(decisions) <= {"REWRITE", "EXECUTE"}
+    assert config_loader.current().version >= 50
@@ -0,0 +1,179 @@
+import dataclasses
+
+import pytest
+
+import config_loader
+import enforcement_engine as em
+from decision_cache import DecisionCache, input_key
+from enforcement_engine import enforce, enforce_many
+from models.enforcement_input import EnforcementInput
+
+
+def make_input(dependency=0.0, flags=(), karma=0.0, intent="hello"):
+    return EnforcementInput(
+        intent=intent,
+        emotional_output={"tone": "neutral", "dependency_score": dependency},
+        age_gate_status="ALLOWED",
+        region_policy="EU",
+        platform_policy="YOUTUBE",
+        karma_score=karma,
+        risk_flags=list(flags),
+    )
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = DecisionCache(max_entries=4)
+    monkeypatch.setattr(em, "_decision_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def logged(monkeypatch):
+    entries = []
+    monkeypatch.setattr(em, "log_enforcement", lambda **kw: entries.append(kw))
+    monkeypatch.setattr(em, "log_enforcement_batch", lambda records: entries.extend(records))
+    return entries
+
+
+def test_key_is_canonical():
+    a = make_input()
+    b = EnforcementInput(
+        intent="hello",
+        emotional_output={"dependency_score": 0.0, "tone": "neutral"},
+        age_gate_status="ALLOWED",
+        region_policy="EU",
+        platform_policy="YOUTUBE",
+        karma_score=0.0,
+        risk_flags=[],
+    )
+    assert input_key(a) == input_key(b)
+    assert input_key(a) != input_key(make_input(intent="hello!"))
+    nested = make_input()
+    nested.emotional_output["tone"] = {"nested": ["x"]}
+    assert input_key(nested) is not None
+    nested.emotional_output["tone"] = {1, 2}
+    assert input_key(nested) is None
+
+
+def test_failures_are_never_cached(cache, logged):
+    pairs = EnforcementInput(
+        intent="hello",
+        emotional_output=[("dependency_score", 0.0)],
+        age_gate_status="ALLOWED",
+        region_policy="EU",
+        platform_policy="YOUTUBE",
+        karma_score=0.0,
+        risk_flags=[],
+    )
+    enforce(make_input())
+    for _ in range(2):
+        with pytest.raises(AttributeError):
+            enforce(pairs)
+    assert cache.stats()["entries"] == 1
+
+
+def test_hit_issues_fresh_trace_and_log(cache, logged):
+    first = enforce(make_input(dependency=0.9))
+    second = enforce(make_input(dependency=0.9))
+    assert first.decision == second.decision == "REWRITE"
+    assert first.rewrite_guidance == second.rewrite_guidance
+    assert first.trace_id != second.trace_id
+    assert [e["trace_id"] for e in logged] == [first.trace_id, second.trace_id]
+    assert [r.name for r in logged[0]["evaluator_results"]] == [r.name for r in logged[1]["evaluator_results"]]
+    stats = em.decision_cache_stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1 and stats["hit_rate"] == 0.5
+
+
+def test_cached_matches_uncached(cache, logged, monkeypatch):
+    inputs = [
+        make_input(dependency=d, flags=f, karma=k)
+        for d in (0.0, 0.9) for f in ((), ("HIGH_RISK",), ("PLATFORM_VIOLATION",)) for k in (0.5, -0.8)
+    ]
+    cached = [enforce(i).decision for i in inputs + inputs]
+    monkeypatch.setattr(em, "_decision_cache", None)
+    uncached = [enforce(i).decision for i in inputs + inputs]
+    assert cached == uncached
+
+
+def test_bounded_lru(cache, logged):
+    for karma in (0.1, 0.2, 0.3, 0.4, 0.5, 0.6):
+        enforce(make_input(karma=karma))
+    stats = cache.stats()
+    assert stats["entries"] == 4 and stats["evictions"] == 2
+
+
+def test_config_change_invalidates(cache, logged, monkeypatch):
+    input_data = make_input(karma=-0.15)
+    assert enforce(input_data).decision == "REWRITE"   # EU overlay -0.1
+
+    snapshot = config_loader.current()
+    relaxed = dataclasses.replace(
+        snapshot, version=snapshot.version + 1,
+        karma_thresholds={**snapshot.karma_thresholds, "EU": -0.5},
+    )
+    monkeypatch.setattr(config_loader, "_snapshot", relaxed)
+    assert enforce(input_data).decision == "EXECUTE"
+    assert cache.stats()["invalidations"] == 1
+    assert cache.stats()["hits"] == 0
+
+
+def test_kill_switch_bypasses_cache(cache, logged, monkeypatch):
+    enforce(make_input())
+    killed = dataclasses.replace(config_loader.current(), kill_switch=True)
+    monkeypatch.setattr(config_loader, "_snapshot", killed)
+    assert enforce(make_input()).decision == "BLOCK"
+    assert enforce_many([make_input()])[0].decision == "BLOCK"
+
+
+def test_full_audit_not_served_from_short_circuit_entry(cache, logged):
+    enforce(make_input(flags=["HIGH_RISK"]))
+    enforce(make_input(flags=["HIGH_RISK"]), full_audit=True)
+    assert len(logged[-1]["evaluator_results"]) == len(em.ALL_EVALUATORS)
+
+
+def test_enforce_many_uses_cache(cache, logged):
+    decisions = enforce_many([make_input(), make_input(), make_input(dependency=0.9)])
+    assert [d.decision for d in decisions] == ["EXECUTE", "EXECUTE", "REWRITE"]
+    assert len({d.trace_id for d in decisions}) == 3
+    assert cache.stats()["hits"] == 1
+
+
+def test_stats_hook_empty_when_disabled(monkeypatch):
+    monkeypatch.setattr(em, "_decision_cache", None)
+    assert em.decision_cache_stats() == {}
+
+
+def test_enabled_flag_follows_live_snapshot(logged, monkeypatch):
+    monkeypatch.setattr(em, "_decision_cache", None)
+    monkeypatch.setattr(em, "_config_cache", None)
+    snapshot = config_loader.current()
+    runtime = {**snapshot.runtime, "decision_cache": {"enabled": True, "max_entries": 2}}
+    enabled = config_loader.compile_snapshot(snapshot.enforcement, runtime, version=snapshot.version + 1)
+    assert enabled.decision_cache_enabled and enabled.decision_cache_max_entries == 2
+
+    monkeypatch.setattr(config_loader, "_snapshot", enabled)
+    enforce(make_input())
+    enforce(make_input())
+    stats = em.decision_cache_stats()
+    assert stats["hits"] == 1 and stats["entries"] == 1
+
+    disabled = dataclasses.replace(enabled, version=enabled.version + 1, decision_cache_enabled=False)
+    monkeypatch.setattr(config_loader, "_snapshot", disabled)
+    enforce(make_input())
+    assert em.decision_cache_stats() == {}
+    assert em._config_cache is None
+
+
+def test_installed_cache_overrides_config(cache, logged, monkeypatch):
+    monkeypatch.setattr(config_loader, "_snapshot", dataclasses.replace(
+        config_loader.current(), decision_cache_enabled=False
+    ))
+    enforce(make_input())
+    enforce(make_input())
+    assert em.decision_cache_stats()["hits"] == 1
+
+
+def test_invalid_cache_size_rejected():
+    with pytest.raises(ValueError):
+        config_loader.compile_snapshot({}, {"decision_cache": {"enabled": True, "max_entries": 0}})
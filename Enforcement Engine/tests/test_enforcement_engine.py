@@ -129,7 +129,9 @@ def test_threshold_clamping_to_safe_bounds(monkeypatch):
     cfg = dict(config_loader.RUNTIME_CONFIG)
     cfg["env"] = "demo"
     cfg["karma_confidence_threshold_overlays"] = {"demo": {"EU": -2.0}}
-    monkeypatch.setattr(config_loader, "RUNTIME_CONFIG", cfg, raising=True)
+    snapshot = config_loader.compile_snapshot(config_loader.ENFORCEMENT_CONFIG, cfg)
+    assert snapshot.karma_threshold("EU") == -1.0
+    monkeypatch.setattr(config_loader, "_snapshot", snapshot, raising=True)
     decision_eu = enforce(
         make_input(
             karma_score=-1.5,
@@ -0,0 +1,98 @@
+import dataclasses
+import itertools
+
+import pytest
+
+import config_loader
+import enforcement_engine as em
+from enforcement_engine import enforce, _resolve_decision
+from evaluator_modules import ALL_EVALUATORS
+from models.enforcement_input import EnforcementInput
+from models.evaluator_result import EvaluatorResult
+
+RISK_FLAGS = ["HIGH_RISK", "SEXUAL_ESCALATION", "EMOTIONAL_MANIPULATION", "PLATFORM_VIOLATION"]
+
+
+def make_input(age="ALLOWED", region="IN", dependency=0.0, karma=0.0, flags=()):
+    return EnforcementInput(
+        intent="test",
+        emotional_output={"tone": "neutral", "dependency_score": dependency},
+        age_gate_status=age,
+        region_policy=region,
+        platform_policy="YOUTUBE",
+        karma_score=karma,
+        risk_flags=list(flags),
+    )
+
+
+def grid():
+    flag_sets = [
+        combo for n in range(len(RISK_FLAGS) + 1)
+        for combo in itertools.combinations(RISK_FLAGS, n)
+    ]
+    for age, region, dependency, karma, flags in itertools.product(
+        ["ALLOWED", "BLOCKED"], ["IN", "EU", "RESTRICTED"], [0.0, 0.9], [0.5, -0.8], flag_sets
+    ):
+        yield make_input(age, region, dependency, karma, flags)
+
+
+@pytest.fixture
+def logged(monkeypatch):
+    entries = []
+    monkeypatch.setattr(em, "log_enforcement", lambda **kw: entries.append(kw))
+    return entries
+
+
+def test_short_circuit_matches_full_audit(logged):
+    for input_data in grid():
+        fast = enforce(input_data)
+        full = enforce(input_data, full_audit=True)
+        assert fast.decision == full.decision
+        assert fast.rewrite_guidance == full.rewrite_guidance
+        full_results = logged[-1]["evaluator_results"]
+        assert full.decision == _resolve_decision(full_results)
+
+
+def test_block_stops_before_rewrite_evaluators(logged):
+    enforce(make_input(age="BLOCKED", dependency=0.9, karma=-0.8, flags=["PLATFORM_VIOLATION"]))
+    names = [r.name for r in logged[-1]["evaluator_results"]]
+    assert names == ["age_compliance"]
+
+
+def test_block_flag_precheck_runs_only_the_flag_evaluator(logged):
+    decision = enforce(make_input(age="BLOCKED", dependency=0.9, karma=-0.8, flags=RISK_FLAGS))
+    assert decision.decision == "BLOCK"
+    names = [r.name for r in logged[-1]["evaluator_results"]]
+    assert names == ["safety_risk"]
+
+
+def test_full_audit_runs_every_evaluator_in_canonical_order(logged):
+    decision = enforce(make_input(age="BLOCKED", dependency=0.9), full_audit=True)
+    assert decision.decision == "BLOCK"
+    names = [r.name for r in logged[-1]["evaluator_results"]]
+    assert names == [e.name for e in ALL_EVALUATORS]
+
+
+def test_full_trace_config_enables_full_audit(logged, monkeypatch):
+    config = config_loader.current()
+    monkeypatch.setattr(config_loader, "_snapshot", dataclasses.replace(config, full_trace=True))
+    enforce(make_input(age="BLOCKED"))
+    assert len(logged[-1]["evaluator_results"]) == len(ALL_EVALUATORS)
+
+
+def test_plan_rebuilt_when_evaluators_swapped(logged, monkeypatch):
+    class AlwaysRewrite:
+        name = "always_rewrite"
+
+        def evaluate(self, _):
+            return EvaluatorResult(self.name, True, "REWRITE", "PLATFORM_POLICY_REWRITE")
+
+    monkeypatch.setattr(em, "ALL_EVALUATORS", [AlwaysRewrite()])
+    decision = enforce(make_input())
+    assert decision.decision == "REWRITE"
+    assert decision.rewrite_guidance.rewrite_class == "PLATFORM_SAFE_REWRITE"
+
+
+def test_plan_orders_block_evaluators_first():
+    actions = [e.action for _, e, _ in em._execution_plan(config_loader.current()).steps]
+    assert actions == sorted(actions, key=em.DECISION_PRIORITY.index)
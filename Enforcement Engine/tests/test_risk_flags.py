@@ -0,0 +1,79 @@
+import itertools
+import json
+
+import pytest
+
+from logs.bucket_logger import build_log_line
+from models.enforcement_input import EnforcementInput
+from models.risk_flags import KNOWN_RISK_FLAGS, RISK_FLAGS, RiskFlagRegistry
+from replay_enforcement import _replay_record
+
+
+def make_input(flags):
+    return EnforcementInput(
+        intent="test",
+        emotional_output={"tone": "neutral", "dependency_score": 0.0},
+        age_gate_status="ALLOWED",
+        region_policy="IN",
+        platform_policy="YOUTUBE",
+        karma_score=0.0,
+        risk_flags=flags,
+    )
+
+
+def test_known_flags_have_stable_bits():
+    # Masks are written to the audit log: these bits must never move.
+    assert [RISK_FLAGS.bit(f) for f in KNOWN_RISK_FLAGS] == [1, 2, 4, 8]
+
+
+def test_mask_matches_list_membership():
+    flags = list(KNOWN_RISK_FLAGS) + ["UNKNOWN_FLAG"]
+    for n in range(len(flags) + 1):
+        for combo in itertools.combinations(flags, n):
+            mask = make_input(list(combo)).risk_mask
+            for flag in KNOWN_RISK_FLAGS:
+                assert bool(mask & RISK_FLAGS.bit(flag)) == (flag in combo)
+            assert RISK_FLAGS.names(mask) == [f for f in KNOWN_RISK_FLAGS if f in combo]
+
+
+def test_unregistered_flags_contribute_no_bit():
+    assert RISK_FLAGS.mask(["NOT_A_FLAG"] * 1000) == 0
+
+
+def test_unhashable_flags_are_skipped():
+    flags = [{"name": "HIGH_RISK"}, ["SEXUAL_ESCALATION"], "PLATFORM_VIOLATION", None, 7]
+    assert RISK_FLAGS.mask(flags) == RISK_FLAGS.bit("PLATFORM_VIOLATION")
+    assert make_input(flags).risk_mask == RISK_FLAGS.bit("PLATFORM_VIOLATION")
+
+
+@pytest.mark.parametrize("bad", [None, "HIGH_RISK", 3, {"HIGH_RISK": True}])
+def test_malformed_flags_rejected_at_construction(bad):
+    with pytest.raises(TypeError):
+        make_input(bad)
+
+
+def test_register_is_idempotent():
+    registry = RiskFlagRegistry(["A"])
+    assert registry.register("B") == 2
+    assert registry.register("A") == 1
+    assert len(registry) == 2
+
+
+def test_mask_survives_log_and_replay_round_trip():
+    original = make_input(["HIGH_RISK", "PLATFORM_VIOLATION", "CUSTOM"])
+    record = json.loads(build_log_line(
+        trace_id="t", input_snapshot=original, evaluator_results=[], final_decision="BLOCK"
+    ))
+    assert record["input_snapshot"]["risk_flags"] == ["HIGH_RISK", "PLATFORM_VIOLATION", "CUSTOM"]
+    assert record["input_snapshot"]["risk_mask"] == original.risk_mask
+
+    result = _replay_record(record, log_trace=False)
+    assert result["deterministic_match"] is True
+
+
+def test_records_without_mask_still_replay():
+    record = json.loads(build_log_line(
+        trace_id="t", input_snapshot=make_input(["SEXUAL_ESCALATION"]), evaluator_results=[], final_decision="BLOCK"
+    ))
+    del record["input_snapshot"]["risk_mask"]
+    assert _replay_record(record, log_trace=False)["deterministic_match"] is True
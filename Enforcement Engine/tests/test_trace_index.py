@@ -0,0 +1,178 @@
+import gzip
+import json
+import os
+import sqlite3
+
+import pytest
+
+import replay_enforcement as re_mod
+from logs import bucket_logger
+from logs.bucket_logger import BucketWriter, build_log_line
+from logs.trace_index import TraceIndex
+from models.enforcement_input import EnforcementInput
+
+
+def make_input(age="ALLOWED", dependency=0.0):
+    return EnforcementInput(
+        intent="test",
+        emotional_output={"tone": "neutral", "dependency_score": dependency},
+        age_gate_status=age,
+        region_policy="IN",
+        platform_policy="YOUTUBE",
+        karma_score=0.0,
+        risk_flags=[],
+    )
+
+
+def record(trace_id, decision="EXECUTE", **kw):
+    return build_log_line(
+        trace_id=trace_id, input_snapshot=make_input(**kw), evaluator_results=[], final_decision=decision
+    ) + "\n"
+
+
+def append(path, *lines):
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("".join(lines))
+
+
+def test_index_lookup_and_incremental_refresh(tmp_path):
+    log = tmp_path / "log.jsonl"
+    append(log, record("a"), record("b", "BLOCK", age="BLOCKED"))
+    with TraceIndex(log) as index:
+        assert index.refresh() == 2
+        assert index.get("b")["final_decision"] == "BLOCK"
+        append(log, record("c"))
+        assert index.refresh() == 1
+        assert index.refresh() == 0
+        assert index.get("c")["trace_id"] == "c"
+        assert index.get("missing") is None
+        assert len(index) == 3
+
+
+def test_index_persists_and_resumes(tmp_path):
+    log = tmp_path / "log.jsonl"
+    append(log, record("a"))
+    with TraceIndex(log) as index:
+        index.refresh()
+    append(log, record("b"))
+    with TraceIndex(log) as index:
+        assert index.refresh() == 1
+        assert len(index) == 2
+
+
+def test_first_record_wins_and_partial_line_waits(tmp_path):
+    log = tmp_path / "log.jsonl"
+    append(log, record("a", "EXECUTE"), record("a", "ALLOW"), '{"trace_id": "b", "fin')
+    with TraceIndex(log) as index:
+        assert index.refresh() == 1
+        assert index.get("a")["final_decision"] == "EXECUTE"
+        assert index.get("b") is None
+
+
+def test_rotation_rebuilds_index(tmp_path):
+    log = tmp_path / "log.jsonl"
+    append(log, record("old-1"), record("old-2"))
+    with TraceIndex(log, archives=False) as index:
+        index.refresh()
+        os.replace(log, tmp_path / "log.20240101T000000000000Z.jsonl")
+        append(log, record("new"))
+        index.refresh()
+        assert index.get("old-1") is None
+        assert index.get("new")["trace_id"] == "new"
+
+
+def test_rotated_archives_stay_replayable(tmp_path):
+    log = tmp_path / "log.jsonl"
+    writer = BucketWriter(log, batch_size=1, max_bytes=600, compression="gzip")
+    with TraceIndex(log) as index:
+        for i in range(20):
+            writer.write(record(f"t-{i}").rstrip("\n"))
+            if i == 5:
+                writer.flush()
+                index.refresh()
+        writer.close()
+        assert writer.stats()["rotations"] > 1
+        assert index.get("t-0")["trace_id"] == "t-0"
+        assert index.get("t-19")["trace_id"] == "t-19"
+        assert len(index) == 20
+        ids = [json.loads(line)["trace_id"] for line in index.iter_raw()]
+        assert ids == [f"t-{i}" for i in range(20)]
+        assert [line is not None for _, line in index.raw_records(["t-12", "t-1", "nope"])] == [True, True, False]
+
+
+def test_uncompressed_rotation_preferred_until_removed(tmp_path):
+    log = tmp_path / "log.jsonl"
+    rotated = tmp_path / "log.20240101T000000000000Z.jsonl"
+    append(rotated, record("a"))
+    with open(f"{rotated}.gz", "wb") as f:
+        f.write(gzip.compress(record("a").encode()[:40]))  # compression still running
+    with TraceIndex(log) as index:
+        assert index.get("a")["trace_id"] == "a"
+        with gzip.open(f"{rotated}.gz", "wt", encoding="utf-8") as f:
+            f.write(record("a"))
+        rotated.unlink()
+        assert index.get("a")["trace_id"] == "a"
+        os.remove(f"{rotated}.gz")
+        assert index.get("a") is None
+
+
+def test_index_from_before_archives_is_rebuilt(tmp_path):
+    log = tmp_path / "log.jsonl"
+    append(log, record("a"))
+    conn = sqlite3.connect(str(log.with_suffix(".index.sqlite")))
+    conn.execute("CREATE TABLE traces (trace_id TEXT NOT NULL UNIQUE, offset INTEGER NOT NULL, length INTEGER NOT NULL)")
+    conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value INTEGER)")
+    conn.execute("INSERT INTO meta VALUES ('offset', 999)")
+    conn.commit()
+    conn.close()
+    with TraceIndex(log) as index:
+        assert index.get("a")["trace_id"] == "a"
+
+
+def test_corrupt_lines_are_skipped(tmp_path):
+    log = tmp_path / "log.jsonl"
+    append(log, "not json\n", record("a"))
+    with TraceIndex(log) as index:
+        assert index.refresh() == 1
+
+
+@pytest.fixture
+def audit_log(tmp_path, monkeypatch):
+    log = tmp_path / "log.jsonl"
+    monkeypatch.setattr(re_mod, "LOG_FILE", log)
+    append(
+        log,
+        record("ok-1"),
+        record("ok-2", "REWRITE", dependency=0.9),
+        record("ok-3", "BLOCK", age="BLOCKED"),
+        record("tampered", "EXECUTE", age="BLOCKED"),
+    )
+    return log
+
+
+def test_replay_uses_index(audit_log):
+    result = re_mod.replay("ok-2")
+    assert result["deterministic_match"] is True
+    with pytest.raises(ValueError):
+        re_mod.replay("missing")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_replay_many_reports_mismatches(audit_log, workers):
+    report = re_mod.replay_many(["ok-1", "tampered", "missing", "ok-3"], workers=workers, chunk_size=1)
+    assert report["replayed"] == 3
+    assert report["matched"] == 2
+    assert report["missing"] == ["missing"]
+    assert [m["original_trace_id"] for m in report["mismatches"]] == ["tampered"]
+    assert report["mismatches"][0]["replayed_decision"] == "BLOCK"
+
+
+def test_replay_reads_configured_log_file():
+    assert re_mod.LOG_FILE == bucket_logger.LOG_FILE
+
+
+def test_replay_all_does_not_append_to_log(audit_log):
+    size = audit_log.stat().st_size
+    report = re_mod.replay_all(workers=2, chunk_size=2)
+    assert report["replayed"] == 4 and report["matched"] == 3
+    assert audit_log.stat().st_size == size
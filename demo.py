@@ -1,7 +1,8 @@
 import json
 import time
 from sankalp.schemas import IntelligenceInput
-from sankalp.engine import ResponseComposerEngine
+from sankalp.engine import ResponseComposerEngine, configure_log_sink
+from sankalp.log_sink import BufferedFileSink
 
 def run_scenario(name, input_data):
     print(f"\n{'='*60}")
@@ -27,6 +28,9 @@ def run_scenario(name, input_data):
     return result
 
 def main():
+    log_sink = BufferedFileSink("sankalp_logs.jsonl")
+    configure_log_sink(log_sink)
+
     print("\n************************************************************")
     print(" SANKALP PHASE 1 - FINAL INTEGRATION DEMO")
     print(" Response & Emotion Engine | Verified on Windows")
@@ -110,6 +114,7 @@ def main():
         message_content="I just want to relax and chat."
     ))
 
+    log_sink.close()
     print("\n[DEMO COMPLETE] Logs written to 'sankalp_logs.jsonl'")
 
 if __name__ == "__main__":
@@ -0,0 +1,126 @@
+import json
+import os
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sankalp.phrase_matcher import TRIE_MIN_PHRASES, trie_regex
+
+DEFAULT_LEXICON_PATH = os.path.join(os.path.dirname(__file__), "emotion_lexicon.json")
+
+
+class EmotionClassifier:
+    """
+    Precompiled keyword classifier for behavioral state detection.
+
+    Small lexicons (the shipped one has a few dozen keywords) are scanned
+    keyword by keyword with `str.find`, which is the cheapest option at that
+    size. From TRIE_MIN_PHRASES keywords on, all keywords are compiled into
+    one trie regex and every hit is collected in a single pass over the
+    lowercased message, so cost grows with message length, not lexicon size.
+    Both strategies count every occurrence of every keyword.
+
+    The first emotion (in lexicon priority order) with a hit is the label;
+    confidence is that emotion's share of the total matched keyword weight.
+    label() returns the label alone and, on the substring scan, stops at the
+    first hit like the original keyword chain did.
+    """
+
+    def __init__(
+        self,
+        emotions: Sequence[Tuple[str, Dict[str, float]]],
+        default: str = "neutral",
+        use_trie: Optional[bool] = None
+    ):
+        self.labels: List[str] = [label for label, _ in emotions]
+        self.default = default
+
+        # keyword -> [(priority, weight), ...]; a keyword may feed several emotions.
+        self._hits: Dict[str, List[Tuple[int, float]]] = {}
+        for priority, (_, keywords) in enumerate(emotions):
+            for keyword, weight in keywords.items():
+                keyword = keyword.lower()
+                if keyword:
+                    self._hits.setdefault(keyword, []).append((priority, float(weight)))
+        # Label-only scan: keywords that can score, grouped in priority order.
+        self._keywords: List[Tuple[str, Tuple[str, ...]]] = [
+            (label, tuple(k.lower() for k, weight in keywords.items() if k and float(weight) > 0.0))
+            for label, keywords in emotions
+        ]
+
+        if use_trie is None:
+            use_trie = len(self._hits) >= TRIE_MIN_PHRASES
+        self._pattern = None
+        if use_trie and self._hits:
+            # The regex reports the longest keyword at a position; fold in every
+            # shorter keyword that is a prefix of it so no hit is lost.
+            self._hits_at: Dict[str, List[Tuple[int, float]]] = {}
+            for keyword in self._hits:
+                hits = []
+                for end in range(1, len(keyword) + 1):
+                    hits.extend(self._hits.get(keyword[:end], ()))
+                self._hits_at[keyword] = hits
+            self._pattern = re.compile(trie_regex(self._hits))
+
+    @classmethod
+    def from_file(cls, path: str = DEFAULT_LEXICON_PATH) -> "EmotionClassifier":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(
+            [(e["label"], e["keywords"]) for e in data["emotions"]],
+            default=data.get("default", "neutral")
+        )
+
+    def label(self, message: str) -> str:
+        """Returns the behavioral_state only; same label as classify()."""
+        if self._pattern is not None:
+            return self.classify(message)[0]
+        text = message.lower()
+        for label, keywords in self._keywords:
+            for keyword in keywords:
+                if keyword in text:
+                    return label
+        return self.default
+
+    def classify(self, message: str) -> Tuple[str, float]:
+        """Returns (behavioral_state, confidence in [0, 1])."""
+        if not self._hits or not message:
+            return self.default, 1.0
+        scores = [0.0] * len(self.labels)
+        text = message.lower()
+        if self._pattern is None:
+            for keyword, hits in self._hits.items():
+                if keyword not in text:
+                    continue
+                start = text.find(keyword)
+                while start != -1:
+                    for priority, weight in hits:
+                        scores[priority] += weight
+                    start = text.find(keyword, start + 1)
+        else:
+            hits_at = self._hits_at
+            search = self._pattern.search
+            m = search(text)
+            while m is not None:
+                for priority, weight in hits_at[m.group()]:
+                    scores[priority] += weight
+                # Resume one character later so overlapping keywords are still seen.
+                m = search(text, m.start() + 1)
+        total = sum(scores)
+        if total <= 0.0:
+            return self.default, 1.0
+        for priority, score in enumerate(scores):
+            if score > 0.0:
+                return self.labels[priority], round(score / total, 4)
+        return self.default, 1.0
+
+    def classify_many(self, messages: Sequence[str]) -> List[Tuple[str, float]]:
+        """Batch variant for offline scoring; repeated messages are classified once."""
+        seen: Dict[str, Tuple[str, float]] = {}
+        results = []
+        for message in messages:
+            result = seen.get(message)
+            if result is None:
+                result = self.classify(message)
+                seen[message] = result
+            results.append(result)
+        return results
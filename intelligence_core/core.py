@@ -1,6 +1,11 @@
-from typing import Dict, Tuple, Any
+from typing import Dict, List, Tuple, Any
+
+from .classifier import EmotionClassifier
 
 class IntelligenceCore:
+    # Compiled once from intelligence_core/emotion_lexicon.json
+    EMOTION_CLASSIFIER = EmotionClassifier.from_file()
+
     def __init__(self):
         pass
 
@@ -59,31 +64,12 @@ class IntelligenceCore:
         return embodiment_output, bucket_write
 
     def _detect_emotion(self, message: str) -> str:
-        msg = message.lower()
-        
-        # Happy / Excited
-        if any(w in msg for w in ["happy", "excited", "great", "awesome", "love", "amazing", "good news", "yay"]):
-            return "happy"
-            
-        # Sad / Vulnerable
-        if any(w in msg for w in ["sad", "depressed", "lonely", "hurt", "crying", "grief", "miss"]):
-            return "sad"
-            
-        # Anxious / Fear
-        if any(w in msg for w in ["scared", "anxious", "worried", "fear", "nervous", "panic"]):
-            return "anxious"
-            
-        # Frustrated / Upset
-        if any(w in msg for w in ["upset", "angry", "frustrated", "annoyed", "mad", "disappointed", "listen to each other"]):
-            return "frustrated"
-            
-        # Confused
-        if any(w in msg for w in ["confused", "don't understand", "what?", "huh", "explain"]):
-            return "confused"
-
-        # Curious
-        if any(w in msg for w in ["why", "how", "what is", "tell me about"]):
-            return "curious"
+        return self.EMOTION_CLASSIFIER.label(message)
 
-        return "neutral"
+    def classify_emotion(self, message: str) -> Tuple[str, float]:
+        """Returns (behavioral_state, confidence) for a single message."""
+        return self.EMOTION_CLASSIFIER.classify(message)
 
+    def detect_emotions(self, messages: List[str]) -> List[Tuple[str, float]]:
+        """Batch emotion scoring for offline evaluation."""
+        return self.EMOTION_CLASSIFIER.classify_many(messages)
@@ -3,7 +3,8 @@ import logging
 from typing import Dict, Any
 
 from intelligence_core.core import IntelligenceCore
-from sankalp.engine import ResponseComposerEngine
+from sankalp.engine import ResponseComposerEngine, configure_log_sink
+from sankalp.log_sink import BufferedFileSink
 from sankalp.schemas import IntelligenceInput
 from sankalp.adapter import IntelligenceAdapter
 
@@ -63,6 +64,8 @@ def run_full_pipeline(
 def main():
     # Setup logging
     logging.basicConfig(level=logging.INFO)
+    log_sink = BufferedFileSink("sankalp_logs.jsonl")
+    configure_log_sink(log_sink)
 
     # Scenario 1: Standard Interaction
     run_full_pipeline(
@@ -80,5 +83,7 @@ def main():
         user_message="I want to meet strangers online."
     )
 
+    log_sink.close()
+
 if __name__ == "__main__":
     main()
@@ -1,6 +1,11 @@
 import sys
 import os
 import json
+import time
+import random
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
 # Ensure we can import from local modules
 sys.path.append(os.path.dirname(__file__))
@@ -54,7 +59,153 @@ class AIBeingPipeline:
         print("🗣️  [3/3] Rendering in Embodiment Layer...")
         self.voice.render(response_dict)
 
-if __name__ == "__main__":
+# --- Batch Mode (offline replay) ---
+# Streams JSONL interactions through Brain -> Adapter -> Heart with reused
+# instances and writes one BeingResponseBlock JSON line per input line.
+#
+# Input line: {"message": str, "user_context": {...}, "karma_state": {...},
+#              "bucket_state": {...} (optional), "context_summary": str (optional)}
+
+STAGES = ("brain", "adapter", "heart")
+DEFAULT_BUCKET_STATE = {"baseline_emotional_band": "neutral", "previous_state_anchor": "neutral"}
+
+class BatchWorker:
+    """Holds one IntelligenceCore and one ResponseComposerEngine for the whole run."""
+
+    def __init__(self):
+        self.brain = IntelligenceCore()
+        self.heart = ResponseComposerEngine()
+
+    def process_line(self, line: str):
+        """Returns (output_json_bytes, per-stage seconds) for one input line."""
+        timings = [0.0, 0.0, 0.0]
+        try:
+            record = json.loads(line)
+            message = record.get("message", "")
+            user_context = record.get("user_context", {})
+            karma_state = record.get("karma_state", {})
+
+            t0 = time.perf_counter()
+            embodiment_output, _ = self.brain.process_interaction(
+                context=user_context,
+                karma_data=karma_state,
+                bucket_data=record.get("bucket_state", DEFAULT_BUCKET_STATE),
+                message_content=message
+            )
+            t1 = time.perf_counter()
+            sankalp_input = IntelligenceAdapter.adapt_fast(
+                embodiment_output=embodiment_output,
+                original_context=user_context,
+                original_karma=karma_state,
+                message_content=message,
+                context_summary=record.get("context_summary", "")
+            )
+            t2 = time.perf_counter()
+            response_block = self.heart.process(sankalp_input)
+            t3 = time.perf_counter()
+            timings = [t1 - t0, t2 - t1, t3 - t2]
+            return response_block.to_json_bytes(), timings
+        except Exception as e:
+            # One output line per input line, even for malformed records.
+            return json.dumps({"error": f"{type(e).__name__}: {e}"}).encode("utf-8"), None
+
+_worker = None
+
+def _init_worker():
+    global _worker
+    _worker = BatchWorker()
+
+def _process_chunk(lines):
+    return [_worker.process_line(line) for line in lines]
+
+class LatencyStats:
+    """Per-stage latency reservoir (fixed size, so memory stays bounded)."""
+
+    def __init__(self, size: int = 100000):
+        self.size = size
+        self.count = 0
+        self.samples = {stage: [] for stage in STAGES}
+        self._rng = random.Random(0)
+
+    def add(self, timings):
+        self.count += 1
+        if self.count <= self.size:
+            for stage, value in zip(STAGES, timings):
+                self.samples[stage].append(value)
+            return
+        slot = self._rng.randrange(self.count)
+        if slot < self.size:
+            for stage, value in zip(STAGES, timings):
+                self.samples[stage][slot] = value
+
+    def percentile(self, stage: str, pct: float) -> float:
+        values = sorted(self.samples[stage])
+        if not values:
+            return 0.0
+        return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+def _read_chunks(stream, chunk_size: int):
+    chunk = []
+    for line in stream:
+        if not line.strip():
+            continue
+        chunk.append(line)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def run_batch(in_stream, out_stream, workers: int = 1, chunk_size: int = 256, report_stream=sys.stderr):
+    """
+    Streams interactions from `in_stream` to `out_stream` (binary) in input order.
+    With workers > 1, chunks fan out across a process pool; at most 2 chunks per
+    worker are in flight, so memory stays bounded regardless of input size.
+    """
+    stats = LatencyStats()
+    errors = 0
+    start = time.perf_counter()
+
+    def emit(results):
+        nonlocal errors
+        for data, timings in results:
+            out_stream.write(data + b"\n")
+            if timings is None:
+                errors += 1
+            else:
+                stats.add(timings)
+
+    chunks = _read_chunks(in_stream, chunk_size)
+    if workers <= 1:
+        _init_worker()
+        for chunk in chunks:
+            emit(_process_chunk(chunk))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            in_flight = deque()
+            for chunk in chunks:
+                in_flight.append(pool.submit(_process_chunk, chunk))
+                if len(in_flight) >= workers * 2:
+                    emit(in_flight.popleft().result())
+            while in_flight:
+                emit(in_flight.popleft().result())
+    out_stream.flush()
+
+    elapsed = time.perf_counter() - start
+    total = stats.count + errors
+    if report_stream is not None:
+        report_stream.write(
+            f"[BATCH] {total} interactions ({errors} errors) in {elapsed:.2f}s "
+            f"-> {total / elapsed if elapsed else 0:,.0f}/s with {max(workers, 1)} worker(s)\n"
+        )
+        for stage in STAGES:
+            report_stream.write(
+                f"[BATCH] {stage:<8} p50 {stats.percentile(stage, 50) * 1e6:8.1f} us | "
+                f"p99 {stats.percentile(stage, 99) * 1e6:8.1f} us\n"
+            )
+    return stats
+
+def run_demo():
     pipeline = AIBeingPipeline()
     
     # Scenario 1: Normal Interaction
@@ -71,3 +222,28 @@ if __name__ == "__main__":
     context_3 = {"user_age": 30, "region": "US"}
     karma_3 = {"karma_score": 10, "risk_signal": "high"}
     pipeline.process_interaction("I hate everything.", context_3, karma_3)
+
+def main():
+    parser = argparse.ArgumentParser(description="AI Being pipeline: Brain -> Heart -> Voice")
+    parser.add_argument("--batch", metavar="JSONL", help="Replay interactions from a JSONL file ('-' for stdin)")
+    parser.add_argument("--output", "-o", metavar="JSONL", help="Write BeingResponseBlock lines here (default: stdout)")
+    parser.add_argument("--workers", type=int, default=1, help="Process pool size for batch mode")
+    parser.add_argument("--chunk-size", type=int, default=256, help="Interactions per worker task")
+    args = parser.parse_args()
+
+    if not args.batch:
+        run_demo()
+        return
+
+    in_stream = sys.stdin if args.batch == "-" else open(args.batch, "r", encoding="utf-8")
+    out_stream = open(args.output, "wb") if args.output else sys.stdout.buffer
+    try:
+        run_batch(in_stream, out_stream, workers=args.workers, chunk_size=args.chunk_size)
+    finally:
+        if in_stream is not sys.stdin:
+            in_stream.close()
+        if out_stream is not sys.stdout.buffer:
+            out_stream.close()
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Sequence
 import logging
 import json
 from .schemas import IntelligenceInput
@@ -10,6 +10,41 @@ class IntelligenceAdapter:
     into the format expected by Sankalp's ResponseComposerEngine.
     """
 
+    CONFIDENCE_MAP = {"low": 0.3, "medium": 0.7, "high": 0.95}
+
+    @staticmethod
+    def adapt_fast(
+        embodiment_output: Dict[str, Any],
+        original_context: Dict[str, Any],
+        original_karma: Dict[str, Any],
+        message_content: str,
+        context_summary: str = ""
+    ) -> IntelligenceInput:
+        """
+        Fast-path adapter mode. Payloads matching the well-formed upstream shape
+        are checked once by the compiled validator and skip validation flags and
+        the diagnostic log line. Anything that deviates falls back to adapt().
+
+        The result is always identical to adapt(). The one difference is logging:
+        a well-formed payload without an "intent" field is accepted silently,
+        because the adapter never reads intent.
+        """
+        result = _fast_adapt(embodiment_output, original_context, original_karma, message_content, context_summary)
+        if result is None:
+            return IntelligenceAdapter.adapt(
+                embodiment_output, original_context, original_karma, message_content, context_summary
+            )
+        return result
+
+    @staticmethod
+    def adapt_many(payloads: Sequence[Sequence[Any]], fast: bool = True) -> List[IntelligenceInput]:
+        """
+        Bulk variant. Each payload is the positional arguments of adapt():
+        (embodiment_output, original_context, original_karma, message_content[, context_summary]).
+        """
+        adapt = IntelligenceAdapter.adapt_fast if fast else IntelligenceAdapter.adapt
+        return [adapt(*payload) for payload in payloads]
+
     @staticmethod
     def adapt(
         embodiment_output: Dict[str, Any],
@@ -41,7 +76,7 @@ class IntelligenceAdapter:
 
         validation_flags: List[str] = []
 
-        conf_map = {"low": 0.3, "medium": 0.7, "high": 0.95}
+        conf_map = IntelligenceAdapter.CONFIDENCE_MAP
         confidence_val: float
         if "confidence" not in embodiment_output:
             confidence_val = 1.0
@@ -162,3 +197,94 @@ class IntelligenceAdapter:
             upstream_safe_mode=upstream_safe,
             upstream_expression_profile=upstream_expr,
         )
+
+
+def _compile_fast_validator():
+    """
+    Builds the fast-path check for the well-formed payload shape:
+    - confidence: a known label or a number already within [0, 1]
+    - constraints: a list of strings
+    - user_age: absent or a non-negative int; region: a string
+    - risk_signal: a string; karma_score: an int or float
+    - intent: absent or a string
+    Returns a function producing the IntelligenceInput, or None on any deviation.
+    """
+    conf_map = IntelligenceAdapter.CONFIDENCE_MAP
+    dict_t, list_t, str_t, int_t, float_t = dict, list, str, int, float
+
+    def fast_adapt(embodiment_output, original_context, original_karma, message_content, context_summary):
+        if type(embodiment_output) is not dict_t or type(original_context) is not dict_t \
+                or type(original_karma) is not dict_t:
+            return None
+
+        raw_conf = embodiment_output.get("confidence")
+        raw_conf_t = type(raw_conf)
+        if raw_conf_t is str_t:
+            confidence_val = conf_map.get(raw_conf)
+            if confidence_val is None:
+                return None
+        elif (raw_conf_t is float_t or raw_conf_t is int_t) and 0.0 <= raw_conf <= 1.0:
+            confidence_val = float(raw_conf)
+        else:
+            return None
+
+        raw_constraints = embodiment_output.get("constraints", [])
+        if type(raw_constraints) is not list_t:
+            return None
+        for item in raw_constraints:
+            if type(item) is not str_t:
+                return None
+        gating_flags = list(raw_constraints)
+
+        if "age_gate" in gating_flags or "minor_detected" in gating_flags:
+            age_gate = "minor"
+        else:
+            user_age = original_context.get("user_age")
+            if user_age is None:
+                age_gate = "unknown"
+            elif type(user_age) is int_t and user_age >= 0:
+                age_gate = "minor" if user_age < 18 else "adult"
+            else:
+                return None
+
+        if "region_lock" in gating_flags:
+            region_gate = "restricted"
+        else:
+            region_gate = original_context.get("region", "unknown")
+            if type(region_gate) is not str_t:
+                return None
+
+        karma_risk = original_karma.get("risk_signal", "low")
+        karma_score = original_karma.get("karma_score", 50)
+        karma_score_t = type(karma_score)
+        if type(karma_risk) is not str_t or (karma_score_t is not int_t and karma_score_t is not float_t):
+            return None
+        if karma_risk == "high" or karma_score < 30:
+            karma_hint = "negative"
+        elif karma_score > 70:
+            karma_hint = "positive"
+        else:
+            karma_hint = "neutral"
+
+        raw_intent = embodiment_output.get("intent")
+        if raw_intent is not None and type(raw_intent) is not str_t:
+            return None
+
+        return IntelligenceInput(
+            behavioral_state=embodiment_output.get("behavioral_state", "neutral"),
+            speech_mode=embodiment_output.get("speech_mode", "soft_voice"),
+            constraints=gating_flags,
+            confidence=confidence_val,
+            age_gate_status=age_gate,
+            region_gate_status=region_gate,
+            karma_hint=karma_hint,
+            context_summary=context_summary,
+            message_content=message_content,
+            upstream_safe_mode=embodiment_output.get("safe_mode", "adaptive"),
+            upstream_expression_profile=embodiment_output.get("expression_profile", "medium"),
+        )
+
+    return fast_adapt
+
+
+_fast_adapt = _compile_fast_validator()
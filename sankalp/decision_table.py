@@ -0,0 +1,135 @@
+import itertools
+from typing import Dict, Iterator, Optional, Tuple
+
+from .schemas import IntelligenceInput, VoiceProfile, ExpressionLevel, DeliveryStyle, ToneBand
+from .emotion import EmotionMapper
+from .karma_tone_mapper import KarmaToneMapper
+
+# (voice_profile, expression_level, delivery_style, tone_profile)
+Profile = Tuple[VoiceProfile, ExpressionLevel, DeliveryStyle, ToneBand]
+
+# --- Input Domains ---
+# Every value the rule functions branch on, plus the common upstream defaults.
+# Values outside these domains are still handled: they fall back to the rules.
+
+AGE_GATES = ("adult", "minor", "unknown")
+KARMA_HINTS = ("positive", "neutral", "negative")
+BEHAVIORAL_STATES = (
+    "neutral", "curious", "defensive", "happy", "excited", "sad", "anxious",
+    "vulnerable", "frustrated", "confused", "angry"
+)
+SAFE_MODES = ("on", "adaptive", "off")
+EXPRESSION_PROFILES = ("low", "medium", "high")
+SPEECH_MODES = ("chat", "monologue", "silent", "soft_voice")
+
+# Confidence only matters relative to the expression threshold in EmotionMapper.
+LOW_CONFIDENCE_THRESHOLD = 0.5
+
+
+def profile_key(input_data: IntelligenceInput) -> tuple:
+    """
+    Every field the tone/voice/expression/delivery rules read.
+    Two inputs with the same key always resolve to the same profile.
+    """
+    return (
+        input_data.age_gate_status,
+        input_data.karma_hint,
+        input_data.behavioral_state,
+        input_data.upstream_safe_mode,
+        input_data.upstream_expression_profile,
+        input_data.speech_mode,
+        bool(input_data.constraints),
+        input_data.confidence < LOW_CONFIDENCE_THRESHOLD,
+    )
+
+
+def resolve_by_rules(input_data: IntelligenceInput) -> Profile:
+    """The reference rule functions the table is compiled from."""
+    return (
+        KarmaToneMapper.map_warmth(input_data),
+        EmotionMapper.map_expression_level(input_data),
+        EmotionMapper.map_delivery_style(input_data),
+        KarmaToneMapper.map_tone(input_data),
+    )
+
+
+def _all_keys() -> Iterator[tuple]:
+    return itertools.product(
+        AGE_GATES, KARMA_HINTS, BEHAVIORAL_STATES, SAFE_MODES,
+        EXPRESSION_PROFILES, SPEECH_MODES, (False, True), (False, True)
+    )
+
+
+def _input_for_key(key: tuple, confidence: Optional[float] = None, **overrides) -> IntelligenceInput:
+    age, karma, behavior, safe_mode, expression, speech, has_constraints, low_conf = key
+    if confidence is None:
+        confidence = 0.3 if low_conf else 0.9
+    fields = dict(
+        behavioral_state=behavior,
+        speech_mode=speech,
+        constraints=["sensitive_topic"] if has_constraints else [],
+        confidence=confidence,
+        age_gate_status=age,
+        region_gate_status="US",
+        karma_hint=karma,
+        context_summary="",
+        message_content="",
+        upstream_safe_mode=safe_mode,
+        upstream_expression_profile=expression,
+    )
+    fields.update(overrides)
+    return IntelligenceInput(**fields)
+
+
+class DecisionTable:
+    """
+    Compiled lookup table for tone, warmth, expression and delivery.
+    Built once from the rule functions; per-turn mapping is a single dict lookup.
+    """
+
+    def __init__(self):
+        self._table: Dict[tuple, Profile] = {
+            key: resolve_by_rules(_input_for_key(key)) for key in _all_keys()
+        }
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def lookup(self, input_data: IntelligenceInput) -> Profile:
+        profile = self._table.get(profile_key(input_data))
+        if profile is None:
+            # Value outside the compiled domains: use the rules directly.
+            return resolve_by_rules(input_data)
+        return profile
+
+    def verify(self) -> int:
+        """
+        Self-check: walks every combination and proves the table matches the
+        rule functions, including for values that only differ in fields the
+        key does not capture (exact confidence, region, constraint contents).
+        Returns the number of checked inputs; raises AssertionError on mismatch.
+        """
+        checked = 0
+        for key in _all_keys():
+            low_conf = key[-1]
+            has_constraints = key[-2]
+            variants = [
+                _input_for_key(key),
+                _input_for_key(
+                    key,
+                    confidence=0.0 if low_conf else LOW_CONFIDENCE_THRESHOLD,
+                    region_gate_status="EU",
+                    context_summary="Previous turn",
+                    message_content="I need you",
+                    constraints=["blocked", "minor_detected"] if has_constraints else [],
+                ),
+            ]
+            for input_data in variants:
+                expected = resolve_by_rules(input_data)
+                actual = self.lookup(input_data)
+                assert actual == expected, f"Decision table mismatch for {key}: {actual} != {expected}"
+                checked += 1
+        return checked
+
+
+DECISION_TABLE = DecisionTable()
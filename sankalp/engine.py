@@ -1,24 +1,42 @@
 import uuid
-import hashlib
 import json
 import logging
 from datetime import datetime, timezone
 from typing import List
 
-from .schemas import IntelligenceInput, BeingResponseBlock, ToneBand
+from .schemas import (
+    IntelligenceInput, BeingResponseBlock, ToneBand,
+    VoiceProfile, ExpressionLevel, DeliveryStyle
+)
 from .emotion import EmotionMapper
 from .narration import NarrationComposer
 from .karma_tone_mapper import KarmaToneMapper
 from .context_continuity import ContextContinuityEngine
+from .decision_table import DECISION_TABLE, profile_key
+from .log_sink import LoggingSink
+from .response_cache import ResponseCache
+from .trace import check_trace_id_mode, compute_trace_id
 from . import templates
 
-# Setup basic logging to simulate "Bucket logs"
-logging.basicConfig(filename='sankalp_logs.jsonl', level=logging.INFO, format='%(message)s')
+# Process-wide "Bucket logs" sink. Callers choose where logs go (e.g. a
+# BufferedFileSink writing sankalp_logs.jsonl); importing this module opens no files.
+_log_sink = LoggingSink()
+
+def configure_log_sink(sink) -> None:
+    """Sets the default bucket log sink used by engines created without one."""
+    global _log_sink
+    _log_sink = sink
 
 class ResponseComposerEngine:
     ENGINE_VERSION = "1.1.0"
+    # "legacy" keeps v1.x trace IDs stable; see sankalp.trace for "canonical" and "fast".
+    TRACE_ID_MODE = "legacy"
 
-    def __init__(self):
+    def __init__(self, log_sink=None, trace_id_mode: str = None, response_cache: ResponseCache = None):
+        self.log_sink = log_sink
+        self.response_cache = response_cache
+        self.trace_id_mode = trace_id_mode or self.TRACE_ID_MODE
+        check_trace_id_mode(self.trace_id_mode)
         self.emotion_mapper = EmotionMapper()
         self.narration_composer = NarrationComposer()
         self.karma_mapper = KarmaToneMapper()
@@ -35,13 +53,62 @@ class ResponseComposerEngine:
             logging.error(f"CRITICAL ENGINE FAILURE: {e}")
             return self._create_fallback_response(input_data)
 
-    def _process_unsafe(self, input_data: IntelligenceInput) -> BeingResponseBlock:
-        # 1. Determine Emotional State (delegated to KarmaToneMapper for Tone/Warmth override)
-        voice_profile = self.karma_mapper.map_warmth(input_data)
-        expression_level = self.emotion_mapper.map_expression_level(input_data)
-        delivery_style = self.emotion_mapper.map_delivery_style(input_data)
-        tone_profile = self.karma_mapper.map_tone(input_data)
+    def process_batch(self, inputs: List[IntelligenceInput]) -> List[BeingResponseBlock]:
+        """
+        Batch pipeline for offline replay and high-volume traffic.
+        Inputs sharing the same decision-relevant fields resolve tone, voice,
+        expression and delivery once per group. Results are returned in input
+        order and are identical to calling process() on each item.
+        """
+        profiles = {}
+        results = []
+        for input_data in inputs:
+            try:
+                results.append(self._process_unsafe(input_data, profiles))
+            except Exception as e:
+                logging.error(f"CRITICAL ENGINE FAILURE: {e}")
+                results.append(self._create_fallback_response(input_data))
+        return results
+
+    def _resolve_profile(self, input_data: IntelligenceInput) -> tuple:
+        # Determine Emotional State (compiled KarmaToneMapper/EmotionMapper rules)
+        return DECISION_TABLE.lookup(input_data)
+
+    def _process_unsafe(self, input_data: IntelligenceInput, profiles: dict = None) -> BeingResponseBlock:
+        # Deterministic Trace ID: hash(IntelligenceInput + version)
+        trace_id = compute_trace_id(input_data, self.ENGINE_VERSION, self.trace_id_mode)
+
+        # 0. Memoized response (same input + version -> same block); still logged per request
+        if self.response_cache is not None:
+            cached = self.response_cache.get(trace_id)
+            if cached is not None:
+                self._log_response(input_data, cached)
+                return cached
+
+        # 1. Determine Emotional State (shared across a batch via `profiles`)
+        if profiles is None:
+            profile = self._resolve_profile(input_data)
+        else:
+            key = profile_key(input_data)
+            profile = profiles.get(key)
+            if profile is None:
+                profile = self._resolve_profile(input_data)
+                profiles[key] = profile
+
+        response = self._compose_block(input_data, trace_id, *profile)
+        if self.response_cache is not None:
+            self.response_cache.put(trace_id, response)
+        return response
 
+    def _compose_block(
+        self,
+        input_data: IntelligenceInput,
+        trace_id: str,
+        voice_profile: VoiceProfile,
+        expression_level: ExpressionLevel,
+        delivery_style: DeliveryStyle,
+        tone_profile: ToneBand
+    ) -> BeingResponseBlock:
         # 2. Narration Composition (Deterministic Text Structuring)
         # "You own: voice of the Being, trust tone, structured response format, deterministic narration blocks"
         
@@ -94,10 +161,6 @@ class ResponseComposerEngine:
              # (Skipping stateful stabilization for now as per design, trusting inputs)
 
         # 3. Construct the Response Block
-        # Deterministic Trace ID: hash(IntelligenceInput + version)
-        input_signature = json.dumps(input_data.to_dict(), sort_keys=True)
-        raw_trace = f"{input_signature}{self.ENGINE_VERSION}"
-        trace_id = hashlib.sha256(raw_trace.encode('utf-8')).hexdigest()
         
         # Determine allowed modes based on speech_mode
         # If speech_mode is "chat", we allow text and speech.
@@ -206,7 +269,7 @@ class ResponseComposerEngine:
         }
         
         # Stateless Log - Fire and Forget
-        logging.info(json.dumps(log_entry))
+        (self.log_sink or _log_sink).write(json.dumps(log_entry))
 
 if __name__ == "__main__":
     # Quick self-test
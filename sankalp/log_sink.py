@@ -0,0 +1,157 @@
+import logging
+import queue
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+class LoggingSink:
+    """
+    Default bucket sink: forwards each line to the standard `logging` module.
+    Where the lines end up is decided by whoever configures logging, not by
+    the Sankalp package.
+    """
+
+    def write(self, line: str) -> None:
+        logging.info(line)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def stats(self) -> Dict[str, int]:
+        return {}
+
+
+class BufferedFileSink:
+    """
+    Asynchronous bucket sink for JSONL response logs.
+
+    Lines are pushed onto a bounded in-memory queue and a background writer
+    thread appends them to `path` in batches, flushing whenever `batch_size`
+    lines are pending or `flush_interval` seconds have passed.
+
+    Backpressure policy:
+    - block=False (default): a full queue drops the line and increments
+      the `dropped` counter. The request path never waits on disk.
+    - block=True: the caller waits until there is room in the queue.
+
+    Every line passed to write() ends up either in `written` or in
+    `dropped`, including lines racing close().
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        path: str,
+        max_queue: int = 10000,
+        batch_size: int = 256,
+        flush_interval: float = 0.5,
+        block: bool = False
+    ):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.block = block
+        self.written = 0
+        self.dropped = 0
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue)
+        self._closed = False
+        # Orders write()/flush() against close(): nothing is queued after STOP
+        self._lock = threading.Lock()
+        # Guards `dropped` alone, so the writer thread never waits on a
+        # producer blocked on a full queue while holding _lock
+        self._drop_lock = threading.Lock()
+        self._file = None
+        self._thread = threading.Thread(target=self._run, name="sankalp-log-sink", daemon=True)
+        self._thread.start()
+
+    def write(self, line: str) -> None:
+        with self._lock:
+            if self._closed:
+                self._drop(1)
+                return
+            try:
+                self._queue.put(line, block=self.block)
+            except queue.Full:
+                self._drop(1)
+
+    def flush(self, timeout: Optional[float] = 5.0) -> None:
+        """Blocks until every line queued before this call is on disk."""
+        done = threading.Event()
+        with self._lock:
+            if self._closed or not self._thread.is_alive():
+                return
+            self._queue.put(done)
+        done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Drains the queue, writes the remaining lines and stops the writer."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(self._STOP)
+        self._thread.join(timeout)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "queue_depth": self._queue.qsize(),
+            "written": self.written,
+            "dropped": self.dropped,
+        }
+
+    def _run(self) -> None:
+        pending: List[str] = []
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            timeout = max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if isinstance(item, str):
+                pending.append(item)
+                if len(pending) < self.batch_size:
+                    continue
+
+            if pending:
+                self._write_batch(pending)
+                pending = []
+            deadline = time.monotonic() + self.flush_interval
+
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is self._STOP:
+                self._close_file()
+                return
+
+    def _write_batch(self, lines: List[str]) -> None:
+        # The writer must never die: a failed batch is counted as dropped,
+        # and the file is reopened for the next one.
+        try:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write("\n".join(lines) + "\n")
+            self._file.flush()
+            self.written += len(lines)
+        except Exception as e:
+            self._drop(len(lines))
+            self._close_file()
+            logging.error(f"BUCKET LOG WRITE FAILURE: {e}")
+
+    def _drop(self, count: int) -> None:
+        with self._drop_lock:
+            self.dropped += count
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            try:
+                self._file.close()
+            except Exception:
+                pass
+            self._file = None
@@ -1,13 +1,25 @@
+import os
 from typing import List, Optional
 from .schemas import ToneBand
+from .phrase_matcher import PhraseMatcher
 from . import templates
 
+GUARDRAIL_PHRASES_PATH = os.path.join(os.path.dirname(__file__), "data", "guardrail_phrases.json")
+
 class NarrationComposer:
     """
     Responsible for the deterministic structuring of the final spoken/text output.
     Ensures stability, safety phrases, and tonal consistency.
     """
 
+    # Compiled once; categories are checked in priority order (dependency > possessive > guilt).
+    GUARDRAIL_MATCHER = PhraseMatcher.from_file(GUARDRAIL_PHRASES_PATH)
+    GUARDRAIL_RESPONSES = {
+        "dependency": templates.get_dependency_refusal,
+        "possessive": templates.get_possessiveness_refusal,
+        "guilt": templates.get_guilt_neutralizer,
+    }
+
     @staticmethod
     def _enforce_emotional_philosophy(text: str) -> str:
         """
@@ -19,43 +31,10 @@ class NarrationComposer:
         
         This is a deterministic guardrail.
         """
-        lower_text = text.lower()
-        
-        blocked_phrases = [
-            "i need you",
-            "i can't live without you",
-            "don't leave me",
-            "only you understand",
-            "nobody else",
-            "our secret",
-            "just us"
-        ]
-        
-        for phrase in blocked_phrases:
-            if phrase in lower_text:
-                return templates.get_dependency_refusal()
-
-        possessive_phrases = [
-            "you are mine",
-            "we belong together",
-            "you're my girlfriend",
-            "you're my boyfriend"
-        ]
-        
-        for phrase in possessive_phrases:
-            if phrase in lower_text:
-                return templates.get_possessiveness_refusal()
-
-        guilt_phrases = [
-            "you hurt my feelings",
-            "why did you leave me",
-            "you abandoned me"
-        ]
-        for phrase in guilt_phrases:
-            if phrase in lower_text:
-                return templates.get_guilt_neutralizer()
-
-        return text
+        category = NarrationComposer.GUARDRAIL_MATCHER.match(text)
+        if category is None:
+            return text
+        return NarrationComposer.GUARDRAIL_RESPONSES[category]()
 
     @staticmethod
     def compose(
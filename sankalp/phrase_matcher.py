@@ -0,0 +1,103 @@
+import json
+import re
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+_END = ""
+
+# Below this many distinct phrases a plain `phrase in text` loop is faster
+# than the compiled trie regex (scripts/bench_phrase_matcher.py: with the 14
+# shipped phrases the loop is ~3x faster; the regex wins from ~75 phrases).
+TRIE_MIN_PHRASES = 100
+
+
+def trie_regex(words: Iterable[str]) -> str:
+    """
+    Regex alternation for `words`, built from their trie so shared prefixes
+    collapse into one branch. At a given position it matches the longest word.
+    """
+    trie: Dict = {}
+    for word in words:
+        if not word:
+            continue
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[_END] = True
+    return _node_regex(trie)
+
+
+def _node_regex(node: Dict) -> str:
+    branches = [re.escape(ch) + _node_regex(child) for ch, child in sorted(node.items()) if ch != _END]
+    if not branches:
+        return ""
+    if len(branches) == 1 and _END not in node:
+        return branches[0]
+    group = "(?:" + "|".join(branches) + ")"
+    # A word ends here but longer ones continue: prefer the longest.
+    return group + "?" if _END in node else group
+
+
+class PhraseMatcher:
+    """
+    Finds the highest-priority category with a phrase hit in a text.
+
+    Small phrase lists are checked with one substring scan per phrase, in
+    priority order. From TRIE_MIN_PHRASES phrases on, all phrases are
+    compiled into a single trie regex and every hit is found in one pass,
+    so scan cost grows with the length of the text, not with the number of
+    phrases.
+    """
+
+    def __init__(self, categories: Sequence[Tuple[str, Sequence[str]]], use_trie: Optional[bool] = None):
+        """
+        categories: (name, phrases) pairs in priority order, highest first.
+        Phrases are matched case-insensitively as substrings.
+        use_trie: force the trie regex (True) or the substring scan (False);
+        by default it is chosen from the number of phrases.
+        """
+        self.categories: List[str] = [name for name, _ in categories]
+        rank_of: Dict[str, int] = {}
+        for rank, (_, phrases) in enumerate(categories):
+            for phrase in phrases:
+                phrase = phrase.lower()
+                if phrase and phrase not in rank_of:
+                    rank_of[phrase] = rank
+
+        if use_trie is None:
+            use_trie = len(rank_of) >= TRIE_MIN_PHRASES
+        self._pattern = None
+        # Substring scan: phrases in priority order, first hit wins
+        self._phrases: List[Tuple[str, int]] = sorted(rank_of.items(), key=lambda item: item[1])
+        if use_trie and rank_of:
+            # The regex reports the longest phrase starting at each position, so
+            # a hit must also account for every shorter phrase that is its prefix.
+            self._best_rank: Dict[str, int] = {}
+            for phrase in rank_of:
+                best = rank_of[phrase]
+                for i in range(1, len(phrase)):
+                    best = min(best, rank_of.get(phrase[:i], best))
+                self._best_rank[phrase] = best
+            self._pattern = re.compile(f"(?=({trie_regex(rank_of)}))")
+
+    @classmethod
+    def from_file(cls, path: str) -> "PhraseMatcher":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls([(c["name"], c["phrases"]) for c in data["categories"]])
+
+    def match(self, text: str) -> Optional[str]:
+        """Returns the highest-priority category with a hit in `text`, or None."""
+        lower_text = text.lower()
+        if self._pattern is None:
+            for phrase, rank in self._phrases:
+                if phrase in lower_text:
+                    return self.categories[rank]
+            return None
+        best = len(self.categories)
+        for m in self._pattern.finditer(lower_text):
+            rank = self._best_rank[m.group(1)]
+            if rank < best:
+                best = rank
+                if best == 0:
+                    break
+        return self.categories[best] if best < len(self.categories) else None
@@ -0,0 +1,96 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from .schemas import BeingResponseBlock
+
+
+def _copy_block(block: BeingResponseBlock) -> BeingResponseBlock:
+    return BeingResponseBlock(
+        message_primary=block.message_primary,
+        tone_profile=block.tone_profile,
+        emotional_depth=block.emotional_depth,
+        boundaries_enforced=list(block.boundaries_enforced),
+        allowed_modes=list(block.allowed_modes),
+        voice_profile=block.voice_profile,
+        trace_id=block.trace_id,
+        content_safety_flags=list(block.content_safety_flags),
+        pacing_hint=block.pacing_hint,
+        delivery_style=block.delivery_style
+    )
+
+
+class ResponseCache:
+    """
+    Bounded LRU/TTL memo cache for BeingResponseBlocks, keyed on the
+    deterministic trace_id (hash of IntelligenceInput + engine version).
+
+    Safe because ResponseComposerEngine is deterministic: the same key always
+    composes the same block. Entries are stored and returned as copies, so a
+    caller mutating its response can never leak into another request.
+    """
+
+    def __init__(self, max_entries: int = 10000, max_bytes: int = 64 * 1024 * 1024, ttl_seconds: Optional[float] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._bytes = 0
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (block, size, stored_at)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[BeingResponseBlock]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            block, size, stored_at = entry
+            if self.ttl_seconds is not None and time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self._bytes -= size
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return _copy_block(block)
+
+    def put(self, key: str, block: BeingResponseBlock) -> None:
+        stored = _copy_block(block)
+        # Approximate footprint: the compact JSON size of the block.
+        size = len(stored.to_json_bytes())
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (stored, size, time.monotonic())
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
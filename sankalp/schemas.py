@@ -1,7 +1,64 @@
-from dataclasses import dataclass, field
+import json
+import sys
+from dataclasses import dataclass, fields
 from enum import Enum
+from operator import attrgetter
 from typing import List, Optional, Dict, Any
 
+# Slotted dataclasses (no per-instance __dict__) where the interpreter supports them.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_COMPACT_JSON = json.JSONEncoder(separators=(",", ":"))
+# Same output as json.dumps(obj, sort_keys=True): the legacy trace-id signature
+_SORTED_JSON = json.JSONEncoder(sort_keys=True)
+
+_CACHE_SLOTS = ("_json_cache", "_sorted_json_cache", "_cached_lists")
+
+
+class _CachedJson:
+    """
+    Lazy, cached JSON serializations for the schema dataclasses: compact
+    bytes (to_json_bytes) and the sorted-key text the legacy trace id hashes
+    (to_sorted_json). Assigning any field drops both (__setattr__). List
+    fields can also be edited in place, so their contents are compared
+    before a cached form is reused; nothing else is rebuilt per call.
+    The caches are plain slots on this base class, not dataclass fields, so
+    they stay out of fields(), asdict(), __init__, __repr__ and __eq__.
+    """
+    __slots__ = _CACHE_SLOTS
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name not in _CACHE_SLOTS:
+            object.__setattr__(self, "_cached_lists", None)
+
+    def _cache_valid(self) -> bool:
+        lists = self._list_values(self)
+        if lists == getattr(self, "_cached_lists", None):
+            return True
+        object.__setattr__(self, "_json_cache", None)
+        object.__setattr__(self, "_sorted_json_cache", None)
+        # attrgetter yields the list itself for one list field, else a tuple of them
+        lists = list(lists) if isinstance(lists, list) else tuple(map(list, lists))
+        object.__setattr__(self, "_cached_lists", lists)
+        return False
+
+    def to_json_bytes(self) -> bytes:
+        data = getattr(self, "_json_cache", None) if self._cache_valid() else None
+        if data is None:
+            data = _COMPACT_JSON.encode(self.to_dict()).encode("utf-8")
+            object.__setattr__(self, "_json_cache", data)
+        return data
+
+    def to_sorted_json(self) -> str:
+        """json.dumps(self.to_dict(), sort_keys=True), cached"""
+        text = getattr(self, "_sorted_json_cache", None) if self._cache_valid() else None
+        if text is None:
+            text = _SORTED_JSON.encode(self.to_dict())
+            object.__setattr__(self, "_sorted_json_cache", text)
+        return text
+
+
 # --- Enums for Strict Typing ---
 
 class VoiceProfile(str, Enum):
@@ -28,8 +85,8 @@ class ToneBand(str, Enum):
 
 # --- Input Schema (From Ishan/Intelligence Core) ---
 
-@dataclass
-class IntelligenceInput:
+@dataclass(**_SLOTS)
+class IntelligenceInput(_CachedJson):
     behavioral_state: str  # e.g., "curious", "defensive", "neutral"
     speech_mode: str       # e.g., "chat", "monologue"
     constraints: List[str] # Safety/Policy constraints
@@ -61,8 +118,8 @@ class IntelligenceInput:
 
 # --- Output Schema (To Yaseen/Embodiment) ---
 
-@dataclass
-class BeingResponseBlock:
+@dataclass(**_SLOTS)
+class BeingResponseBlock(_CachedJson):
     message_primary: str
     tone_profile: str          # Mapped from ToneBand
     emotional_depth: str       # Mapped from ExpressionLevel
@@ -89,3 +146,8 @@ class BeingResponseBlock:
             "pacing_hint": self.pacing_hint,
             "delivery_style": self.delivery_style
         }
+
+
+# The list fields, the only ones that can change without __setattr__
+for _cls in (IntelligenceInput, BeingResponseBlock):
+    _cls._list_values = attrgetter(*(f.name for f in fields(_cls) if getattr(f.type, "__origin__", None) is list))
@@ -0,0 +1,92 @@
+import hashlib
+import struct
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+from .schemas import IntelligenceInput
+
+# --- Trace ID Modes ---
+# legacy:    sha256(json.dumps(input, sort_keys=True) + version). Stable IDs from v1.x.
+# canonical: sha256 over a length-prefixed binary encoding, fed incrementally.
+# fast:      same encoding, non-cryptographic XXH3-128 digest (optional `xxhash` package).
+TRACE_ID_MODES = ("legacy", "canonical", "fast")
+
+
+def check_trace_id_mode(mode: str) -> None:
+    if mode not in TRACE_ID_MODES:
+        raise ValueError(f"Unknown trace_id mode: {mode}")
+    if mode == "fast" and xxhash is None:
+        raise ValueError("trace_id mode 'fast' requires the optional xxhash package")
+
+
+# Field order is part of the encoding. Never reorder; only append.
+_FIELDS = (
+    "behavioral_state",
+    "speech_mode",
+    "constraints",
+    "confidence",
+    "age_gate_status",
+    "region_gate_status",
+    "karma_hint",
+    "context_summary",
+    "message_content",
+    "upstream_safe_mode",
+    "upstream_expression_profile",
+)
+
+_U32 = struct.Struct(">I")
+_F64 = struct.Struct(">d")
+
+
+def _feed(update, value) -> None:
+    """Writes one type-tagged, length-prefixed value into the hash."""
+    if isinstance(value, str):
+        raw = value.encode("utf-8")
+        update(b"s")
+        update(_U32.pack(len(raw)))
+        update(raw)
+    elif isinstance(value, bool) or value is None:
+        update(b"n" if value is None else (b"T" if value else b"F"))
+    elif isinstance(value, (int, float)):
+        update(b"d")
+        update(_F64.pack(float(value)))
+    elif isinstance(value, (list, tuple)):
+        update(b"l")
+        update(_U32.pack(len(value)))
+        for item in value:
+            _feed(update, item)
+    else:
+        _feed(update, repr(value))
+
+
+def _legacy_trace_id(input_data: IntelligenceInput, version: str) -> str:
+    # == json.dumps(input_data.to_dict(), sort_keys=True), cached on the input
+    input_signature = input_data.to_sorted_json()
+    raw_trace = f"{input_signature}{version}"
+    return hashlib.sha256(raw_trace.encode('utf-8')).hexdigest()
+
+
+def compute_trace_id(input_data: IntelligenceInput, version: str, mode: str = "legacy") -> str:
+    """
+    Deterministic Trace ID: hash(IntelligenceInput + version).
+    The same input, version and mode always produce the same ID, in any process.
+    """
+    if mode == "legacy":
+        return _legacy_trace_id(input_data, version)
+    if mode == "canonical":
+        h = hashlib.sha256()
+    elif mode == "fast":
+        if xxhash is None:
+            raise ValueError("trace_id mode 'fast' requires the optional xxhash package")
+        h = xxhash.xxh3_128()
+    else:
+        raise ValueError(f"Unknown trace_id mode: {mode}")
+
+    update = h.update
+    _feed(update, version)
+    for name in _FIELDS:
+        _feed(update, getattr(input_data, name))
+    return h.hexdigest()
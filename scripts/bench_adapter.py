@@ -0,0 +1,46 @@
+"""
+Benchmark: IntelligenceAdapter.adapt vs adapt_fast / adapt_many over clean and
+malformed payload mixes (malformed shapes from tests/test_adapter_resilience.py).
+
+Usage: python scripts/bench_adapter.py [n_payloads]
+"""
+import logging
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sankalp.adapter import IntelligenceAdapter
+from tests.test_adapter_resilience import CLEAN_PAYLOAD, MALFORMED_PAYLOADS
+
+def make_mix(n: int, malformed_pct: int):
+    payloads = []
+    for i in range(n):
+        if i % 100 < malformed_pct:
+            payloads.append(MALFORMED_PAYLOADS[i % len(MALFORMED_PAYLOADS)])
+        else:
+            payloads.append(CLEAN_PAYLOAD)
+    return payloads
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    # Diagnostic lines are emitted at INFO; keep the handler cheap but enabled.
+    logging.basicConfig(level=logging.INFO, stream=open(os.devnull, "w"))
+    for malformed_pct in (0, 10, 50, 100):
+        payloads = make_mix(n, malformed_pct)
+
+        start = time.perf_counter()
+        for p in payloads:
+            IntelligenceAdapter.adapt(*p)
+        slow_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        IntelligenceAdapter.adapt_many(payloads)
+        fast_s = time.perf_counter() - start
+
+        print(f"{malformed_pct:>3}% malformed: adapt {slow_s / n * 1e6:6.2f} us | "
+              f"adapt_many(fast) {fast_s / n * 1e6:6.2f} us | speedup {slow_s / fast_s:.2f}x")
+
+if __name__ == "__main__":
+    main()
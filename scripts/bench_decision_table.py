@@ -0,0 +1,56 @@
+"""
+Microbenchmark: compiled DecisionTable lookup vs the KarmaToneMapper/EmotionMapper rule chain.
+
+Usage: python scripts/bench_decision_table.py [iterations]
+"""
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sankalp.decision_table import DecisionTable, resolve_by_rules
+from sankalp.schemas import IntelligenceInput
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    inputs = [
+        IntelligenceInput(
+            behavioral_state=state, speech_mode="chat", constraints=constraints,
+            confidence=conf, age_gate_status=age, region_gate_status="US",
+            karma_hint=karma, context_summary="", message_content="Hello"
+        )
+        for state in ("neutral", "sad", "happy", "frustrated")
+        for age in ("adult", "minor")
+        for karma in ("positive", "negative")
+        for constraints in ([], ["sensitive_topic"])
+        for conf in (0.9, 0.3)
+    ]
+
+    start = time.perf_counter()
+    table = DecisionTable()
+    build_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    checked = table.verify()
+    verify_s = time.perf_counter() - start
+
+    k = len(inputs)
+    start = time.perf_counter()
+    for i in range(n):
+        resolve_by_rules(inputs[i % k])
+    rules_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(n):
+        table.lookup(inputs[i % k])
+    table_s = time.perf_counter() - start
+
+    print(f"table entries: {len(table)} (built in {build_s * 1000:.1f} ms)")
+    print(f"self-check:    {checked} inputs verified in {verify_s * 1000:.1f} ms")
+    print(f"rule chain:    {rules_s / n * 1e9:.0f} ns/lookup")
+    print(f"table lookup:  {table_s / n * 1e9:.0f} ns/lookup")
+    print(f"speedup:       {rules_s / table_s:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark: EmotionClassifier vs the original if/elif keyword chain, on the
+shipped lexicon and on synthetic 100- and 1,000-keyword lexicons. "scan" and
+"trie" force a strategy; "default" is what the classifier picks for that
+lexicon size (see TRIE_MIN_PHRASES).
+
+Usage: python scripts/bench_emotion_classifier.py [n_messages]
+"""
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from intelligence_core.classifier import DEFAULT_LEXICON_PATH, EmotionClassifier
+
+WORDS = ["i", "feel", "the", "weather", "today", "was", "really", "about", "my", "friend",
+         "work", "sad", "happy", "worried", "why", "explain", "upset", "movie", "dinner", "call"]
+
+def legacy_detect_emotion(message: str) -> str:
+    """The keyword chain IntelligenceCore._detect_emotion used before the classifier."""
+    msg = message.lower()
+    if any(w in msg for w in ["happy", "excited", "great", "awesome", "love", "amazing", "good news", "yay"]):
+        return "happy"
+    if any(w in msg for w in ["sad", "depressed", "lonely", "hurt", "crying", "grief", "miss"]):
+        return "sad"
+    if any(w in msg for w in ["scared", "anxious", "worried", "fear", "nervous", "panic"]):
+        return "anxious"
+    if any(w in msg for w in ["upset", "angry", "frustrated", "annoyed", "mad", "disappointed", "listen to each other"]):
+        return "frustrated"
+    if any(w in msg for w in ["confused", "don't understand", "what?", "huh", "explain"]):
+        return "confused"
+    if any(w in msg for w in ["why", "how", "what is", "tell me about"]):
+        return "curious"
+    return "neutral"
+
+def timed(fn, messages):
+    start = time.perf_counter()
+    results = [fn(m) for m in messages]
+    return results, (time.perf_counter() - start) / len(messages) * 1e6
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    rng = random.Random(0)
+    messages = [" ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 40))) for _ in range(n)]
+
+    with open(DEFAULT_LEXICON_PATH, "r", encoding="utf-8") as f:
+        shipped = [(e["label"], e["keywords"]) for e in json.load(f)["emotions"]]
+
+    legacy, legacy_us = timed(legacy_detect_emotion, messages)
+    print(f"messages: {n}")
+    print(f"shipped lexicon ({sum(len(k) for _, k in shipped)} keywords): legacy chain {legacy_us:6.2f} us/msg")
+    for mode, use_trie in (("scan", False), ("trie", True), ("default", None)):
+        classifier = EmotionClassifier(shipped, use_trie=use_trie)
+        for method in ("label", "classify"):
+            results, us = timed(getattr(classifier, method), messages)
+            agree = sum(a == (b if method == "label" else b[0]) for a, b in zip(legacy, results))
+            print(f"  {mode:7} {method:8} {us:6.2f} us/msg (label agreement {agree}/{n})")
+
+    # Larger lexicons: the keyword chain scans once per keyword, the trie once per message.
+    for size in (100, 1000):
+        emotions = [
+            (f"emotion_{e}", {"".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 10))): 1.0
+                              for _ in range(size // 10)})
+            for e in range(10)
+        ]
+        chain = lambda m: next((label for label, keywords in emotions if any(k in m for k in keywords)), "neutral")
+        line = f"{size:>5} keywords: chain {timed(chain, messages)[1]:6.2f}"
+        for mode, use_trie in (("scan", False), ("trie", True), ("default", None)):
+            line += f" | {mode} label {timed(EmotionClassifier(emotions, use_trie=use_trie).label, messages)[1]:6.2f}"
+        print(line + " us/msg")
+
+if __name__ == "__main__":
+    main()
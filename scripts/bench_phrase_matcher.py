@@ -0,0 +1,71 @@
+"""
+Benchmark: PhraseMatcher's trie regex vs one substring scan per phrase, on
+the shipped guardrail phrases and on 50 to 10k synthetic phrases. "default"
+is what PhraseMatcher picks for that size (see TRIE_MIN_PHRASES).
+
+Usage: python scripts/bench_phrase_matcher.py [iterations]
+"""
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sankalp.narration import GUARDRAIL_PHRASES_PATH
+from sankalp.phrase_matcher import PhraseMatcher
+
+WORDS = ["i", "you", "need", "leave", "me", "only", "our", "secret", "mine", "belong",
+         "together", "hurt", "feelings", "why", "did", "always", "never", "stay", "with", "forever"]
+
+def make_categories(n: int, rng: random.Random):
+    phrases = set()
+    while len(phrases) < n:
+        phrases.add(" ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 5))) + f" {len(phrases)}")
+    phrases = sorted(phrases)
+    third = max(1, n // 3)
+    return [("dependency", phrases[:third]), ("possessive", phrases[third:2 * third]), ("guilt", phrases[2 * third:])]
+
+def naive_match(categories, text):
+    lower_text = text.lower()
+    for name, phrases in categories:
+        for phrase in phrases:
+            if phrase in lower_text:
+                return name
+    return None
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rng = random.Random(0)
+    texts = [
+        "I hear you. " + " ".join(rng.choice(WORDS) for _ in range(40)) + "."
+        for _ in range(50)
+    ]
+    sizes = [("shipped", PhraseMatcher.from_file(GUARDRAIL_PHRASES_PATH))]
+    sizes += [(size, None) for size in (50, 100, 200, 500, 1000, 10000)]
+    for size, shipped in sizes:
+        if shipped is not None:
+            with open(GUARDRAIL_PHRASES_PATH, "r", encoding="utf-8") as f:
+                categories = [(c["name"], c["phrases"]) for c in json.load(f)["categories"]]
+            label = f"{sum(len(p) for _, p in categories)} (shipped)"
+        else:
+            categories = make_categories(size, rng)
+            label = str(size)
+
+        timings = {}
+        start = time.perf_counter()
+        for i in range(n):
+            naive_match(categories, texts[i % len(texts)])
+        timings["naive"] = time.perf_counter() - start
+        for mode, use_trie in (("scan", False), ("trie", True), ("default", None)):
+            matcher = PhraseMatcher(categories, use_trie=use_trie)
+            start = time.perf_counter()
+            for i in range(n):
+                matcher.match(texts[i % len(texts)])
+            timings[mode] = time.perf_counter() - start
+
+        print(f"{label:>14} phrases: " + " | ".join(f"{mode} {t / n * 1e6:7.1f} us/msg" for mode, t in timings.items()))
+
+if __name__ == "__main__":
+    main()
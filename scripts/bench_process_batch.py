@@ -0,0 +1,43 @@
+"""
+Throughput benchmark: ResponseComposerEngine.process_batch vs a per-item loop.
+
+Usage: python scripts/bench_process_batch.py [n_inputs]
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sankalp.engine import ResponseComposerEngine
+from sankalp.schemas import IntelligenceInput
+
+def load_inputs(n: int):
+    path = os.path.join(os.path.dirname(__file__), '..', 'tests', 'deterministic_cases.json')
+    with open(path, 'r') as f:
+        base = [IntelligenceInput(**case['input']) for case in json.load(f)]
+    return [base[i % len(base)] for i in range(n)]
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    inputs = load_inputs(n)
+    engine = ResponseComposerEngine()
+
+    start = time.perf_counter()
+    single = [engine.process(i) for i in inputs]
+    loop_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = engine.process_batch(inputs)
+    batch_s = time.perf_counter() - start
+
+    identical = all(a.to_dict() == b.to_dict() for a, b in zip(single, batch))
+    print(f"inputs:        {n}")
+    print(f"per-item loop: {n / loop_s:,.0f} inputs/s ({loop_s:.3f}s)")
+    print(f"process_batch: {n / batch_s:,.0f} inputs/s ({batch_s:.3f}s)")
+    print(f"speedup:       {loop_s / batch_s:.2f}x")
+    print(f"identical:     {identical}")
+
+if __name__ == "__main__":
+    main()
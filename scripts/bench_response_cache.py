@@ -0,0 +1,44 @@
+"""
+Benchmark: ResponseComposerEngine with and without the response memo cache on
+traffic where a small set of inputs repeats (greetings, identical gates).
+
+Usage: python scripts/bench_response_cache.py [n_requests]
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sankalp.engine import ResponseComposerEngine
+from sankalp.response_cache import ResponseCache
+from sankalp.schemas import IntelligenceInput
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    path = os.path.join(os.path.dirname(__file__), '..', 'tests', 'deterministic_cases.json')
+    with open(path, 'r') as f:
+        distinct = [IntelligenceInput(**case['input']) for case in json.load(f)]
+    traffic = [distinct[i % len(distinct)] for i in range(n)]
+
+    plain = ResponseComposerEngine()
+    start = time.perf_counter()
+    for input_data in traffic:
+        plain.process(input_data)
+    plain_s = time.perf_counter() - start
+
+    cache = ResponseCache()
+    cached = ResponseComposerEngine(response_cache=cache)
+    start = time.perf_counter()
+    for input_data in traffic:
+        cached.process(input_data)
+    cached_s = time.perf_counter() - start
+
+    print(f"requests: {n} ({len(distinct)} distinct inputs)")
+    print(f"uncached: {plain_s / n * 1e6:6.2f} us/request")
+    print(f"cached:   {cached_s / n * 1e6:6.2f} us/request ({plain_s / cached_s:.2f}x)")
+    print(f"stats:    {cache.stats()}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark: memory per in-flight request and serialization cost for the
+slotted IntelligenceInput / BeingResponseBlock schemas.
+
+Usage: python scripts/bench_schemas.py [iterations]
+"""
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sankalp.engine import ResponseComposerEngine
+from sankalp.schemas import IntelligenceInput
+
+def make_input(i: int) -> IntelligenceInput:
+    return IntelligenceInput(
+        behavioral_state="neutral",
+        speech_mode="chat",
+        constraints=["sensitive_topic"],
+        confidence=0.9,
+        age_gate_status="adult",
+        region_gate_status="US",
+        karma_hint="neutral",
+        context_summary="Previous turn summary.",
+        message_content=f"Message number {i}"
+    )
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    inputs = [make_input(i) for i in range(n)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"IntelligenceInput: {(after - before) / n:.0f} bytes/instance "
+          f"(has __dict__: {hasattr(inputs[0], '__dict__')})")
+
+    response = ResponseComposerEngine().process(inputs[0])
+    for label, obj in (("IntelligenceInput", inputs[0]), ("BeingResponseBlock", response)):
+        start = time.perf_counter()
+        for _ in range(n):
+            json.dumps(obj.to_dict()).encode("utf-8")
+        dumps_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(n):
+            obj.to_json_bytes()
+        cached_s = time.perf_counter() - start
+
+        print(f"{label}: json.dumps(to_dict()) {dumps_s / n * 1e6:.2f} us | "
+              f"to_json_bytes() repeated {cached_s / n * 1e6:.2f} us")
+
+if __name__ == "__main__":
+    main()
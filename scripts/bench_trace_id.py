@@ -0,0 +1,55 @@
+"""
+Microbenchmark: trace_id generation cost per mode for short and long inputs.
+
+"legacy" reuses the input's cached sorted-key JSON after the first call;
+"legacy cold" assigns a field before each call, so the JSON is rebuilt
+every time (a fresh input per request).
+
+Usage: python scripts/bench_trace_id.py [iterations]
+"""
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sankalp.schemas import IntelligenceInput
+from sankalp import trace
+from sankalp.trace import TRACE_ID_MODES, compute_trace_id
+
+def make_input(size: int) -> IntelligenceInput:
+    return IntelligenceInput(
+        behavioral_state="neutral",
+        speech_mode="chat",
+        constraints=["sensitive_topic", "allow_warning"],
+        confidence=0.9,
+        age_gate_status="adult",
+        region_gate_status="US",
+        karma_hint="neutral",
+        context_summary="Previous turn summary. " * (size // 20),
+        message_content="The weather is quite sunny today. " * (size // 30)
+    )
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    for size in (100, 10000):
+        input_data = make_input(size)
+        print(f"message/context size ~{size} chars")
+        for mode in TRACE_ID_MODES:
+            if mode == "fast" and trace.xxhash is None:
+                print(f"  {mode:<10} skipped (xxhash not installed)")
+                continue
+            start = time.perf_counter()
+            for _ in range(n):
+                compute_trace_id(input_data, "1.1.0", mode)
+            elapsed = time.perf_counter() - start
+            print(f"  {mode:<10} {elapsed / n * 1e6:8.2f} us/id")
+        start = time.perf_counter()
+        for _ in range(n):
+            input_data.karma_hint = "neutral"
+            compute_trace_id(input_data, "1.1.0", "legacy")
+        elapsed = time.perf_counter() - start
+        print(f"  {'legacy cold':<10} {elapsed / n * 1e6:8.2f} us/id")
+
+if __name__ == "__main__":
+    main()
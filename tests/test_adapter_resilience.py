@@ -40,5 +40,44 @@ class TestAdapterResilience(unittest.TestCase):
         )
         self.assertEqual(result.message_content, "")
 
+CLEAN_PAYLOAD = (
+    {"behavioral_state": "happy", "speech_mode": "chat", "constraints": ["age_gate"],
+     "confidence": "medium", "safe_mode": "adaptive", "expression_profile": "high"},
+    {"user_age": 25, "region": "US"},
+    {"karma_score": 80, "risk_signal": "low"},
+    "Hello there",
+    "Previous turn",
+)
+
+MALFORMED_PAYLOADS = [
+    (None, {}, {}, "Test content"),
+    ({"constraints": {"gating_flags": ["minor_detected"]}}, {}, {}, "dict constraints"),
+    ({"confidence": 1.7, "constraints": None}, {"user_age": "twenty"}, {}, "bad types"),
+    ({"confidence": "sure", "constraints": "region_lock", "intent": 5}, {"user_age": -3}, {}, "coercions"),
+    ({"confidence": -0.2, "constraints": [1, "x"]}, {"region": 44}, {"risk_signal": 9, "karma_score": "n/a"}, "more"),
+    ({"confidence": 0.9, "constraints": []}, {"user_age": True}, {"karma_score": "75"}, "edge"),
+]
+
+class TestAdapterFastPath(unittest.TestCase):
+    def test_fast_path_identical_to_adapt(self):
+        for payload in [CLEAN_PAYLOAD] + MALFORMED_PAYLOADS:
+            with self.subTest(payload=payload[3]):
+                self.assertEqual(IntelligenceAdapter.adapt_fast(*payload), IntelligenceAdapter.adapt(*payload))
+
+    def test_clean_payload_skips_diagnostic_log(self):
+        with self.assertNoLogs(level="INFO"):
+            IntelligenceAdapter.adapt_fast(*CLEAN_PAYLOAD)
+
+    def test_malformed_payload_uses_diagnostic_path(self):
+        with self.assertLogs(level="INFO") as logs:
+            IntelligenceAdapter.adapt_fast(*MALFORMED_PAYLOADS[2])
+        self.assertIn("confidence_clamped_high", logs.output[0])
+
+    def test_adapt_many_preserves_order(self):
+        payloads = [CLEAN_PAYLOAD] + MALFORMED_PAYLOADS
+        expected = [IntelligenceAdapter.adapt(*p) for p in payloads]
+        self.assertEqual(IntelligenceAdapter.adapt_many(payloads), expected)
+        self.assertEqual(IntelligenceAdapter.adapt_many(payloads, fast=False), expected)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,56 @@
+import io
+import json
+import sys
+import os
+
+# Add root directory to python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from intelligence_core.core import IntelligenceCore
+from sankalp.adapter import IntelligenceAdapter
+from sankalp.engine import ResponseComposerEngine
+from pipeline import run_batch
+
+RECORDS = [
+    {"message": "Hello, how are you?", "user_context": {"user_age": 25, "region": "US"},
+     "karma_state": {"karma_score": 80, "risk_signal": "low"}},
+    {"message": "I feel so lonely and sad", "user_context": {"user_age": 30, "region": "EU"},
+     "karma_state": {"karma_score": 50, "risk_signal": "low"}, "context_summary": "Earlier chat"},
+    {"message": "Can we talk?", "user_context": {"user_age": 14, "region": "EU"},
+     "karma_state": {"karma_score": 50, "risk_signal": "low"}},
+    {"message": "I hate everything.", "user_context": {"user_age": 30, "region": "US"},
+     "karma_state": {"karma_score": 10, "risk_signal": "high"}},
+]
+
+def _expected(record):
+    brain = IntelligenceCore()
+    output, _ = brain.process_interaction(
+        record["user_context"], record["karma_state"],
+        {"baseline_emotional_band": "neutral", "previous_state_anchor": "neutral"},
+        message_content=record["message"]
+    )
+    sankalp_input = IntelligenceAdapter.adapt(
+        output, record["user_context"], record["karma_state"], record["message"],
+        context_summary=record.get("context_summary", "")
+    )
+    return ResponseComposerEngine().process(sankalp_input).to_dict()
+
+def _run(lines, workers):
+    out = io.BytesIO()
+    run_batch(io.StringIO("\n".join(lines) + "\n"), out, workers=workers, chunk_size=3, report_stream=None)
+    return [json.loads(line) for line in out.getvalue().splitlines()]
+
+def test_batch_matches_single_turn_pipeline_in_order():
+    lines = [json.dumps(r) for r in RECORDS] * 5
+    results = _run(lines, workers=1)
+    assert results == [_expected(r) for r in RECORDS] * 5
+
+def test_process_pool_preserves_order():
+    lines = [json.dumps(r) for r in RECORDS] * 5
+    assert _run(lines, workers=2) == _run(lines, workers=1)
+
+def test_malformed_line_yields_error_record():
+    results = _run([json.dumps(RECORDS[0]), "{not json", json.dumps(RECORDS[1])], workers=1)
+    assert len(results) == 3
+    assert "error" in results[1]
+    assert results[2] == _expected(RECORDS[1])
@@ -0,0 +1,38 @@
+import unittest
+import json
+import os
+import sys
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sankalp.engine import ResponseComposerEngine
+from sankalp.schemas import IntelligenceInput
+
+class TestBatchProcessing(unittest.TestCase):
+    def setUp(self):
+        self.engine = ResponseComposerEngine()
+        with open(os.path.join(os.path.dirname(__file__), 'deterministic_cases.json'), 'r') as f:
+            self.inputs = [IntelligenceInput(**case['input']) for case in json.load(f)]
+
+    def test_batch_matches_single_path(self):
+        """process_batch must be byte-identical to process() and keep input order."""
+        batch = self.engine.process_batch(self.inputs)
+        self.assertEqual(len(batch), len(self.inputs))
+        for input_data, response in zip(self.inputs, batch):
+            single = self.engine.process(input_data)
+            self.assertEqual(json.dumps(response.to_dict(), sort_keys=True),
+                             json.dumps(single.to_dict(), sort_keys=True))
+
+    def test_batch_isolates_failures(self):
+        """A corrupt item falls back without affecting its neighbours."""
+        batch = self.engine.process_batch([self.inputs[0], None, self.inputs[1]])
+        self.assertIn("system_failure", batch[1].content_safety_flags)
+        self.assertEqual(batch[0].trace_id, self.engine.process(self.inputs[0]).trace_id)
+        self.assertEqual(batch[2].trace_id, self.engine.process(self.inputs[1]).trace_id)
+
+    def test_empty_batch(self):
+        self.assertEqual(self.engine.process_batch([]), [])
+
+if __name__ == '__main__':
+    unittest.main()
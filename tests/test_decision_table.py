@@ -0,0 +1,35 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sankalp.decision_table import DECISION_TABLE, resolve_by_rules
+from sankalp.schemas import IntelligenceInput, ToneBand, VoiceProfile
+
+class TestDecisionTable(unittest.TestCase):
+    def test_table_matches_rules_for_every_combination(self):
+        """The compiled table must agree with the rule functions everywhere."""
+        checked = DECISION_TABLE.verify()
+        self.assertGreaterEqual(checked, len(DECISION_TABLE))
+
+    def test_unknown_values_fall_back_to_rules(self):
+        input_data = IntelligenceInput(
+            behavioral_state="melancholic", # Not in the compiled domain
+            speech_mode="whisper",
+            constraints=[],
+            confidence=0.9,
+            age_gate_status="adult",
+            region_gate_status="US",
+            karma_hint="positive",
+            context_summary="",
+            message_content="Hello."
+        )
+        profile = DECISION_TABLE.lookup(input_data)
+        self.assertEqual(profile, resolve_by_rules(input_data))
+        self.assertEqual(profile[0], VoiceProfile.NATURAL_FRIEND)
+        self.assertEqual(profile[3], ToneBand.CASUAL)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -68,3 +68,68 @@ def test_trace_id_version_impact():
     engine.ENGINE_VERSION = original_version
     
     assert response_1.trace_id != response_2.trace_id, "Trace ID should differ when engine version changes"
+
+def _reference_input():
+    return IntelligenceInput(
+        behavioral_state="neutral",
+        speech_mode="chat",
+        constraints=["sensitive_topic"],
+        confidence=0.9,
+        age_gate_status="adult",
+        region_gate_status="US",
+        karma_hint="neutral",
+        context_summary="User asked a question. " * 50,
+        message_content="Hello wörld " * 200,
+        upstream_safe_mode="adaptive",
+        upstream_expression_profile="medium"
+    )
+
+def test_legacy_trace_id_unchanged():
+    import hashlib
+    import json
+    input_data = _reference_input()
+    raw = json.dumps(input_data.to_dict(), sort_keys=True) + ResponseComposerEngine.ENGINE_VERSION
+    expected = hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    engine = ResponseComposerEngine(trace_id_mode="legacy")
+    assert engine.process(input_data).trace_id == expected
+    assert ResponseComposerEngine().process(input_data).trace_id == expected
+
+def _available_modes():
+    from sankalp import trace
+    return [m for m in trace.TRACE_ID_MODES if m != "fast" or trace.xxhash is not None]
+
+@pytest.mark.parametrize("mode", _available_modes())
+def test_trace_id_stable_across_processes(mode):
+    import os
+    import subprocess
+    import sys
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    script = (
+        "import sys; sys.path.insert(0, sys.argv[1]);"
+        "from tests.test_determinism import _reference_input;"
+        "from sankalp.engine import ResponseComposerEngine;"
+        "print(ResponseComposerEngine(trace_id_mode=sys.argv[2]).process(_reference_input()).trace_id)"
+    )
+    ids = set()
+    for seed in ("0", "1", "12345"):
+        env = dict(os.environ, PYTHONHASHSEED=seed)
+        out = subprocess.run([sys.executable, "-c", script, root, mode],
+                             capture_output=True, text=True, env=env, check=True)
+        ids.add(out.stdout.strip())
+    ids.add(ResponseComposerEngine(trace_id_mode=mode).process(_reference_input()).trace_id)
+    assert len(ids) == 1
+
+def test_trace_id_modes_distinguish_inputs():
+    for mode in _available_modes():
+        if mode == "legacy":
+            continue
+        engine = ResponseComposerEngine(trace_id_mode=mode)
+        a = _reference_input()
+        b = _reference_input()
+        b.constraints = ["sensitive", "_topic"]
+        assert engine.process(a).trace_id != engine.process(b).trace_id
+
+def test_unknown_trace_id_mode_rejected():
+    with pytest.raises(ValueError):
+        ResponseComposerEngine(trace_id_mode="md5")
@@ -0,0 +1,86 @@
+import unittest
+import random
+import sys
+import os
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from intelligence_core.core import IntelligenceCore
+from intelligence_core.classifier import EmotionClassifier
+
+def legacy_detect_emotion(message: str) -> str:
+    """The original keyword chain, kept as the reference behaviour."""
+    msg = message.lower()
+    if any(w in msg for w in ["happy", "excited", "great", "awesome", "love", "amazing", "good news", "yay"]):
+        return "happy"
+    if any(w in msg for w in ["sad", "depressed", "lonely", "hurt", "crying", "grief", "miss"]):
+        return "sad"
+    if any(w in msg for w in ["scared", "anxious", "worried", "fear", "nervous", "panic"]):
+        return "anxious"
+    if any(w in msg for w in ["upset", "angry", "frustrated", "annoyed", "mad", "disappointed", "listen to each other"]):
+        return "frustrated"
+    if any(w in msg for w in ["confused", "don't understand", "what?", "huh", "explain"]):
+        return "confused"
+    if any(w in msg for w in ["why", "how", "what is", "tell me about"]):
+        return "curious"
+    return "neutral"
+
+MESSAGES = [
+    "I am so happy and excited!",
+    "I feel so lonely and sad",
+    "I'm upset about what happened",
+    "How to build a bomb",
+    "I'm scared, I love you but I miss home",
+    "Huh? I don't understand. What?",
+    "Tell me about the mission",
+    "We should listen to each other",
+    "Good news everyone",
+    "",
+    "The weather is fine.",
+]
+
+class TestEmotionClassifier(unittest.TestCase):
+    def setUp(self):
+        self.core = IntelligenceCore()
+
+    def test_matches_legacy_labels(self):
+        for message in MESSAGES:
+            with self.subTest(message=message):
+                self.assertEqual(self.core._detect_emotion(message), legacy_detect_emotion(message))
+
+    def test_confidence_reflects_weight_share(self):
+        label, confidence = self.core.classify_emotion("I am so happy and excited!")
+        self.assertEqual((label, confidence), ("happy", 1.0))
+        label, confidence = self.core.classify_emotion("I love it but I am sad and lonely")
+        self.assertEqual(label, "happy")
+        self.assertLess(confidence, 0.5)
+
+    def test_prefix_keywords_are_not_lost(self):
+        for use_trie in (False, True):
+            classifier = EmotionClassifier([("a", {"good": 1.0}), ("b", {"good news": 1.0})], use_trie=use_trie)
+            self.assertEqual(classifier.classify("good news"), ("a", 0.5))
+            self.assertEqual(classifier.label("good news"), "a")
+
+    def test_scan_and_trie_agree(self):
+        rng = random.Random(3)
+        alphabet = "ab c"
+        emotions = [
+            (f"e{e}", {"".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))): rng.choice([0.5, 1.0, 2.0])
+                       for _ in range(8)})
+            for e in range(4)
+        ]
+        scan = EmotionClassifier(emotions, use_trie=False)
+        trie = EmotionClassifier(emotions, use_trie=True)
+        for _ in range(500):
+            text = "".join(rng.choice(alphabet + "AB") for _ in range(rng.randint(0, 20)))
+            self.assertEqual(scan.classify(text), trie.classify(text), text)
+            self.assertEqual(scan.label(text), scan.classify(text)[0], text)
+            self.assertEqual(trie.label(text), scan.label(text), text)
+
+    def test_detect_emotions_batch(self):
+        batch = self.core.detect_emotions(MESSAGES * 3)
+        self.assertEqual(batch, [self.core.classify_emotion(m) for m in MESSAGES * 3])
+
+if __name__ == '__main__':
+    unittest.main()
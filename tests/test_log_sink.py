@@ -0,0 +1,116 @@
+import unittest
+import json
+import os
+import sys
+import tempfile
+import threading
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sankalp.engine import ResponseComposerEngine
+from sankalp.log_sink import BufferedFileSink
+from sankalp.schemas import IntelligenceInput
+
+class TestBufferedFileSink(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "sankalp_logs.jsonl")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _read_lines(self):
+        with open(self.path, "r", encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+
+    def test_engine_logs_through_sink(self):
+        sink = BufferedFileSink(self.path, flush_interval=10)
+        engine = ResponseComposerEngine(log_sink=sink)
+        response = engine.process(IntelligenceInput(
+            behavioral_state="neutral",
+            speech_mode="chat",
+            constraints=[],
+            confidence=0.9,
+            age_gate_status="adult",
+            region_gate_status="US",
+            karma_hint="neutral",
+            context_summary="",
+            message_content="Hello"
+        ))
+        sink.close()
+
+        lines = self._read_lines()
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(lines[0]["trace_id"], response.trace_id)
+
+    def test_flush_writes_pending_lines(self):
+        sink = BufferedFileSink(self.path, batch_size=1000, flush_interval=10)
+        for i in range(5):
+            sink.write(json.dumps({"n": i}))
+        sink.flush()
+        self.assertEqual([line["n"] for line in self._read_lines()], list(range(5)))
+        sink.close()
+
+    def test_write_after_close_is_dropped(self):
+        sink = BufferedFileSink(self.path, flush_interval=10)
+        sink.close()
+        sink.write("late")
+        self.assertEqual(sink.stats()["dropped"], 1)
+
+    def test_full_queue_drops_and_counts(self):
+        sink = BufferedFileSink(self.path, max_queue=2, batch_size=1, flush_interval=10)
+        taken, release = threading.Event(), threading.Event()
+        write_batch = sink._write_batch
+
+        def stalled(lines):
+            taken.set()
+            release.wait(5)
+            write_batch(lines)
+
+        sink._write_batch = stalled
+        sink.write("0")
+        self.assertTrue(taken.wait(5))  # the writer holds "0"; the queue is empty
+        for i in range(1, 6):
+            sink.write(str(i))  # "1" and "2" fill the queue, the rest are dropped
+        self.assertEqual(sink.stats()["dropped"], 3)
+        self.assertEqual(sink.stats()["queue_depth"], 2)
+
+        release.set()
+        sink.close()
+        self.assertEqual(sink.stats()["written"], 3)
+        with open(self.path, "r", encoding="utf-8") as f:
+            self.assertEqual(f.read().split(), ["0", "1", "2"])
+
+    def test_writes_racing_close_are_counted(self):
+        sink = BufferedFileSink(self.path, max_queue=100, batch_size=10)
+        writers = [
+            threading.Thread(target=lambda: [sink.write("x") for _ in range(2000)])
+            for _ in range(4)
+        ]
+        for writer in writers:
+            writer.start()
+        sink.close()
+        for writer in writers:
+            writer.join()
+        stats = sink.stats()
+        self.assertEqual(stats["written"] + stats["dropped"], 8000)
+        with open(self.path, "r", encoding="utf-8") as f:
+            self.assertEqual(len(f.read().split()), stats["written"])
+
+    def test_writer_keeps_one_file_handle(self):
+        sink = BufferedFileSink(self.path, batch_size=1, flush_interval=10)
+        sink.write("a")
+        sink.flush()
+        handle = sink._file
+        sink.write("b")
+        sink.flush()
+        self.assertIs(sink._file, handle)
+        self.assertFalse(handle.closed)
+        sink.close()
+        self.assertTrue(handle.closed)
+        with open(self.path, "r", encoding="utf-8") as f:
+            self.assertEqual(f.read().split(), ["a", "b"])
+
+if __name__ == '__main__':
+    unittest.main()
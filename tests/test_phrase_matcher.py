@@ -0,0 +1,62 @@
+import unittest
+import random
+import sys
+import os
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sankalp.narration import NarrationComposer
+from sankalp.phrase_matcher import PhraseMatcher, TRIE_MIN_PHRASES
+from sankalp import templates
+
+def naive_match(categories, text):
+    """Reference: the original one-scan-per-phrase guardrail."""
+    lower_text = text.lower()
+    for name, phrases in categories:
+        for phrase in phrases:
+            if phrase in lower_text:
+                return name
+    return None
+
+class TestPhraseMatcher(unittest.TestCase):
+    def test_guardrail_priority(self):
+        enforce = NarrationComposer._enforce_emotional_philosophy
+        self.assertEqual(enforce("You are mine. I NEED YOU."), templates.get_dependency_refusal())
+        self.assertEqual(enforce("We belong together, you hurt my feelings"), templates.get_possessiveness_refusal())
+        self.assertEqual(enforce("Why did you leave me?"), templates.get_guilt_neutralizer())
+        self.assertEqual(enforce("Let's talk about the weather."), "Let's talk about the weather.")
+
+    def test_prefix_phrase_in_lower_priority_category(self):
+        """A short high-priority phrase must win even inside a longer low-priority one."""
+        for use_trie in (False, True):
+            matcher = PhraseMatcher([("high", ["just us"]), ("low", ["just us two forever"])], use_trie=use_trie)
+            self.assertEqual(matcher.match("it is just us two forever"), "high")
+            matcher = PhraseMatcher([("high", ["us two"]), ("low", ["just us two"])], use_trie=use_trie)
+            self.assertEqual(matcher.match("just us two"), "high")
+
+    def test_matches_naive_scan(self):
+        rng = random.Random(7)
+        alphabet = "ab c'"
+        categories = [
+            (f"cat{c}", ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 6))) for _ in range(20)])
+            for c in range(4)
+        ]
+        matchers = [PhraseMatcher(categories, use_trie=use_trie) for use_trie in (False, True)]
+        for _ in range(500):
+            text = "".join(rng.choice(alphabet + "AB") for _ in range(rng.randint(0, 30)))
+            for matcher in matchers:
+                self.assertEqual(matcher.match(text), naive_match(categories, text), text)
+
+    def test_mode_follows_phrase_count(self):
+        self.assertIsNone(NarrationComposer.GUARDRAIL_MATCHER._pattern)
+        phrases = [f"phrase {i}" for i in range(TRIE_MIN_PHRASES)]
+        self.assertIsNotNone(PhraseMatcher([("many", phrases)])._pattern)
+        self.assertEqual(PhraseMatcher([("many", phrases)]).match("say phrase 42"), "many")
+
+    def test_empty_matcher(self):
+        for use_trie in (False, True):
+            self.assertIsNone(PhraseMatcher([("dependency", [])], use_trie=use_trie).match("i need you"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+import json
+import os
+import sys
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sankalp.engine import ResponseComposerEngine
+from sankalp.response_cache import ResponseCache
+from sankalp.schemas import IntelligenceInput
+
+class RecordingSink:
+    def __init__(self):
+        self.lines = []
+
+    def write(self, line):
+        self.lines.append(json.loads(line))
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        with open(os.path.join(os.path.dirname(__file__), 'deterministic_cases.json'), 'r') as f:
+            self.inputs = [IntelligenceInput(**case['input']) for case in json.load(f)]
+
+    def test_cached_and_uncached_outputs_identical(self):
+        plain = ResponseComposerEngine()
+        cache = ResponseCache()
+        cached = ResponseComposerEngine(response_cache=cache)
+        for _ in range(2):
+            for input_data in self.inputs:
+                self.assertEqual(cached.process(input_data).to_dict(), plain.process(input_data).to_dict())
+        stats = cache.stats()
+        self.assertEqual(stats["misses"], len({plain.process(i).trace_id for i in self.inputs}))
+        self.assertEqual(stats["hits"], 2 * len(self.inputs) - stats["misses"])
+
+    def test_hit_still_logs_and_is_isolated(self):
+        sink = RecordingSink()
+        engine = ResponseComposerEngine(log_sink=sink, response_cache=ResponseCache())
+        first = engine.process(self.inputs[0])
+        first.content_safety_flags.append("mutated_by_caller")
+        second = engine.process(self.inputs[0])
+        self.assertNotIn("mutated_by_caller", second.content_safety_flags)
+        self.assertEqual(len(sink.lines), 2)
+        self.assertEqual(sink.lines[0]["trace_id"], sink.lines[1]["trace_id"])
+
+    def test_entry_and_byte_caps_evict_lru(self):
+        cache = ResponseCache(max_entries=3)
+        engine = ResponseComposerEngine(response_cache=cache)
+        engine.process_batch(self.inputs[:10])
+        self.assertLessEqual(cache.stats()["entries"], 3)
+        self.assertGreater(cache.stats()["evictions"], 0)
+
+        tiny = ResponseCache(max_bytes=1)
+        ResponseComposerEngine(response_cache=tiny).process(self.inputs[0])
+        self.assertEqual(tiny.stats()["entries"], 0)
+
+    def test_ttl_expiry(self):
+        cache = ResponseCache(ttl_seconds=0)
+        engine = ResponseComposerEngine(response_cache=cache)
+        engine.process(self.inputs[0])
+        engine.process(self.inputs[0])
+        self.assertEqual(cache.stats()["hits"], 0)
+        self.assertEqual(cache.stats()["expirations"], 1)
+
+if __name__ == '__main__':
+    unittest.main()
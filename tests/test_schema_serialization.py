@@ -0,0 +1,85 @@
+import unittest
+import dataclasses
+import json
+import sys
+import os
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sankalp.engine import ResponseComposerEngine
+from sankalp.schemas import IntelligenceInput
+
+class TestSchemaSerialization(unittest.TestCase):
+    def setUp(self):
+        self.input_data = IntelligenceInput(
+            behavioral_state="sad",
+            speech_mode="chat",
+            constraints=["sensitive_topic"],
+            confidence=0.9,
+            age_gate_status="adult",
+            region_gate_status="EU",
+            karma_hint="positive",
+            context_summary="Café talk",
+            message_content="I feel \"low\" today."
+        )
+
+    def test_json_bytes_match_to_dict(self):
+        response = ResponseComposerEngine().process(self.input_data)
+        for obj in (self.input_data, response):
+            self.assertEqual(json.loads(obj.to_json_bytes()), obj.to_dict())
+            self.assertEqual(list(json.loads(obj.to_json_bytes())), list(obj.to_dict()))
+
+    def test_cache_tracks_mutation(self):
+        first = self.input_data.to_json_bytes()
+        self.assertIs(self.input_data.to_json_bytes(), first)
+
+        self.input_data.constraints.append("allow_warning")
+        self.assertEqual(json.loads(self.input_data.to_json_bytes())["constraints"],
+                         ["sensitive_topic", "allow_warning"])
+
+        self.input_data.message_content = "Hello"
+        self.assertEqual(json.loads(self.input_data.to_json_bytes())["message_content"], "Hello")
+
+    def test_public_fields_unchanged(self):
+        self.assertEqual(set(self.input_data.to_dict()), {
+            "behavioral_state", "speech_mode", "constraints", "confidence",
+            "age_gate_status", "region_gate_status", "karma_hint", "context_summary",
+            "message_content", "upstream_safe_mode", "upstream_expression_profile"
+        })
+        self.assertEqual(IntelligenceInput(**self.input_data.to_dict()), self.input_data)
+
+    def test_cache_is_not_a_dataclass_field(self):
+        self.input_data.to_json_bytes()
+        self.assertNotIn("_json_cache", [f.name for f in dataclasses.fields(IntelligenceInput)])
+        self.assertEqual(dataclasses.asdict(self.input_data), self.input_data.to_dict())
+        self.assertNotIn("_json_cache", repr(self.input_data))
+        copy = dataclasses.replace(self.input_data, message_content="Hello")
+        self.assertEqual(json.loads(copy.to_json_bytes())["message_content"], "Hello")
+
+    def test_sorted_json_matches_legacy_signature(self):
+        expected = json.dumps(self.input_data.to_dict(), sort_keys=True)
+        self.assertEqual(self.input_data.to_sorted_json(), expected)
+        self.assertIs(self.input_data.to_sorted_json(), self.input_data.to_sorted_json())
+
+        self.input_data.karma_hint = "negative"
+        self.assertEqual(json.loads(self.input_data.to_sorted_json())["karma_hint"], "negative")
+        self.input_data.constraints[0] = "blocked"
+        self.assertEqual(self.input_data.to_sorted_json(),
+                         json.dumps(self.input_data.to_dict(), sort_keys=True))
+
+    def test_assignment_marks_cache_dirty(self):
+        response = ResponseComposerEngine().process(self.input_data)
+        first = response.to_json_bytes()
+        response.pacing_hint = response.pacing_hint
+        self.assertIsNot(response.to_json_bytes(), first)
+        self.assertEqual(response.to_json_bytes(), first)
+
+        # In-place edits of any list field are still seen
+        response.allowed_modes.append("voice")
+        self.assertEqual(json.loads(response.to_json_bytes())["allowed_modes"], response.allowed_modes)
+        response.content_safety_flags.clear()
+        self.assertEqual(json.loads(response.to_json_bytes())["content_safety_flags"], [])
+
+if __name__ == '__main__':
+    unittest.main()